@@ -0,0 +1,214 @@
+import tempfile
+from array import array
+import numpy as np
+
+
+class EditHistory:
+    """Historie úprav mapy pro zpět / znovu (Ctrl+Z / Ctrl+Y).
+
+    Neukládají se kopie mapy, ale jen změny: každý tah myší je jedno pole
+    ``array("I")`` trojic (index dlaždice, staré ID, nové ID), kde index je
+    ``y * šířka + x``. Během tahu se změny jedné dlaždice slučují (zůstane
+    první staré a poslední nové ID), takže přetírání stejného místa nic
+    nepřidává. Jedna změna zabírá 12 bajtů.
+
+    Když tahy v paměti přesáhnou :attr:`max_memory` bajtů, nejstarší se
+    zapíšou do dočasného souboru. Soubor se používá jako zásobník (tahy se
+    vracejí v opačném pořadí, než se zapsaly), po přečtení se zase zkrátí.
+    """
+
+    MAX_MEMORY = 1024 * 1024  # bajtů změn v paměti
+
+    def __init__(self, map_width, max_memory=MAX_MEMORY):
+        """Inicializuje prázdnou historii.
+
+        Args:
+            map_width (int): Šířka mapy v dlaždicích (pro index dlaždice).
+            max_memory (int): Kolik bajtů změn se drží v paměti.
+        """
+
+        self.map_width = map_width
+        self.max_memory = max_memory
+        self._undo = []  # tahy: array("I"), nebo (pozice, délka) v souboru
+        self._redo = []
+        self._stroke = None  # index dlaždice -> [staré ID, nové ID]
+        self._memory = 0  # bajtů v paměti (v self._undo)
+        self._spilled = 0  # kolik nejstarších tahů je v souboru
+        self._file = None
+
+    def __len__(self):
+        return len(self._undo)
+
+    def clear(self, map_width=None):
+        """Smaže historii, např. po načtení jiné mapy."""
+
+        if map_width is not None:
+            self.map_width = map_width
+        self._undo.clear()
+        self._redo.clear()
+        self._stroke = None
+        self._memory = 0
+        self._spilled = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # === Záznam ===
+
+    def begin_stroke(self):
+        """Začne nový tah (stisk tlačítka myši)."""
+
+        self.end_stroke()
+        self._stroke = {}
+
+    def record(self, x, y, old_id, new_id):
+        """Zaznamená změnu jedné dlaždice v aktuálním tahu (bez tahu je to tah sám o sobě)."""
+
+        if old_id == new_id:
+            return
+        single = self._stroke is None
+        if single:
+            self._stroke = {}
+        index = y * self.map_width + x
+        change = self._stroke.get(index)
+        if change is None:
+            self._stroke[index] = [old_id, new_id]
+        else:
+            change[1] = new_id
+        if single:
+            self.end_stroke()
+
+    def record_cells(self, ys, xs, old_ids, new_ids):
+        """Zaznamená hromadnou změnu (výplň, obdélník, vložení) jako samostatný tah.
+
+        Změny se rovnou zabalí do pole, bez procházení po dlaždicích.
+
+        Args:
+            ys (numpy.ndarray): Řádky změněných dlaždic (bez opakování).
+            xs (numpy.ndarray): Sloupce změněných dlaždic.
+            old_ids (numpy.ndarray): Původní ID dlaždic.
+            new_ids (numpy.ndarray): Nová ID dlaždic.
+        """
+
+        self.end_stroke()
+        changed = old_ids != new_ids
+        if not changed.any():
+            return
+        triples = np.empty((int(changed.sum()), 3), dtype=np.uint32)
+        triples[:, 0] = ys[changed] * self.map_width + xs[changed]
+        triples[:, 1] = old_ids[changed]
+        triples[:, 2] = new_ids[changed]
+        deltas = array("I")
+        deltas.frombytes(triples.tobytes())
+        self._push(deltas)
+        self._redo.clear()
+
+    def end_stroke(self):
+        """Ukončí tah (puštění tlačítka myši) a uloží ho do historie."""
+
+        stroke, self._stroke = self._stroke, None
+        if not stroke:
+            return
+        deltas = array("I")
+        for index, (old_id, new_id) in stroke.items():
+            if old_id != new_id:
+                deltas.extend((index, old_id, new_id))
+        if not deltas:
+            return
+        self._push(deltas)
+        self._redo.clear()
+
+    def _push(self, deltas):
+        """Přidá tah na zásobník zpět, nejstarší tahy případně odloží do souboru."""
+
+        self._undo.append(deltas)
+        self._memory += len(deltas) * deltas.itemsize
+        while self._memory > self.max_memory and self._spilled < len(self._undo) - 1:
+            self._spill()
+
+    def _spill(self):
+        """Zapíše nejstarší tah z paměti na konec dočasného souboru."""
+
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()
+        deltas = self._undo[self._spilled]
+        self._file.seek(0, 2)
+        offset = self._file.tell()
+        deltas.tofile(self._file)
+        self._undo[self._spilled] = (offset, len(deltas))
+        self._memory -= len(deltas) * deltas.itemsize
+        self._spilled += 1
+
+    def _pop(self):
+        """Vezme poslední tah ze zásobníku zpět (ze souboru ho načte)."""
+
+        entry = self._undo.pop()
+        if isinstance(entry, tuple):
+            # Odložené tahy jsou na dně zásobníku, takže poslední je i na konci souboru
+            offset, length = entry
+            deltas = array("I")
+            self._file.seek(offset)
+            deltas.fromfile(self._file, length)
+            self._file.truncate(offset)
+            self._spilled -= 1
+        else:
+            deltas = entry
+            self._memory -= len(deltas) * deltas.itemsize
+        return deltas
+
+    # === Zpět / znovu ===
+
+    def _apply(self, deltas, column, set_tiles):
+        """Předá dlaždice tahu a jejich stará (column 1) nebo nová (column 2) ID."""
+
+        triples = np.frombuffer(deltas, dtype=np.uint32).reshape(-1, 3)
+        ys, xs = np.divmod(triples[:, 0].astype(np.intp), self.map_width)
+        set_tiles(ys, xs, triples[:, column])
+
+    def undo(self, set_tiles):
+        """Vrátí poslední tah.
+
+        Args:
+            set_tiles (callable): Volá se jako ``set_tiles(ys, xs, tile_ids)`` s poli
+                řádků, sloupců a původních ID vrácených dlaždic.
+
+        Returns:
+            bool: False, pokud nebylo co vracet.
+        """
+
+        self.end_stroke()
+        if not self._undo:
+            return False
+        deltas = self._pop()
+        # V tahu se každá dlaždice vyskytuje jen jednou, na pořadí nezáleží
+        self._apply(deltas, 1, set_tiles)
+        self._redo.append(deltas)
+        return True
+
+    def redo(self, set_tiles):
+        """Znovu provede poslední vrácený tah.
+
+        Args:
+            set_tiles (callable): Volá se jako ``set_tiles(ys, xs, tile_ids)`` s poli
+                řádků, sloupců a nových ID změněných dlaždic.
+
+        Returns:
+            bool: False, pokud nebylo co provést.
+        """
+
+        self.end_stroke()
+        if not self._redo:
+            return False
+        deltas = self._redo.pop()
+        self._apply(deltas, 2, set_tiles)
+        self._push(deltas)
+        return True
+
+    def memory_usage(self):
+        """Vrátí (bajty v paměti, bajty v souboru)."""
+
+        on_disk = 0
+        if self._file is not None:
+            self._file.seek(0, 2)
+            on_disk = self._file.tell()
+        return self._memory, on_disk
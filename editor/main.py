@@ -1,22 +1,40 @@
 """
 Tilemap editor
 
-l - load
-q - save
+l - load (na pozadí, průběh je vidět v panelu)
+q - save (na pozadí; mapa se zapíše celá, nebo vůbec)
+každou minutu se neuložené změny uloží do tile_map.autosave.txt (AUTOSAVE_INTERVAL)
 
 šipky = pohyb kamery
+kolečko myši = přiblížení / oddálení (od přehledu celé mapy po 4× detail)
 
 a, d, w, s = posun výběru mezi sloupci a řádky (v tilesetu)
 
 levé tlačítko = kreslení
 pravé tlačítko = mazání (tile 0)
+Ctrl+Z / Ctrl+Y = zpět / znovu (po celých tazích myší)
+
+1 - 6 = nástroj: štětec, čára, obdélník, výplň, kopírovat (tažením), vložit
+        (čára, obdélník a výplň pravým tlačítkem mažou)
 
 """
 
 import pygame
 import os
 import sys
-from tiles import tile_dict  # použit tiles.py se 35×26 dlaždicemi
+import time
+import numpy as np
+from map_view import MapView
+from history import EditHistory
+from map_io import MapStore
+from tools import (
+    BRUSH, LINE, RECTANGLE, FILL, COPY, PASTE, TOOLS,
+    line_cells, rectangle_cells, flood_fill, clip_stamp,
+)
+
+# Dlaždice (35×26) jsou sdílené se hrou ve složce src
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from tile_registry import tile_dict  # noqa: E402
 
 # === Inicializace Pygame ===
 pygame.init()
@@ -42,6 +60,8 @@ base_path = os.path.dirname(__file__)
 sprite_sheet = pygame.image.load(os.path.join(base_path, "tilemap.png")).convert_alpha()
 
 map_filepath = os.path.join(base_path, "tile_map.txt")
+autosave_filepath = os.path.join(base_path, "tile_map.autosave.txt")
+AUTOSAVE_INTERVAL = 60  # sekund, 0 = automatické ukládání vypnuto
 
 def get_tile(x, y):
     px = TILE_MARGIN + x * (SPRITE_TILE_SIZE + TILE_SPACING)
@@ -76,14 +96,74 @@ valid_tile_ids = sorted(tile_images.keys())
 selected_index = 0
 selected_tile = valid_tile_ids[selected_index]
 
-# === Mapa ===
-tile_map = [[0 for _ in range(MAP_WIDTH)] for _ in range(MAP_HEIGHT)]
+# === Zobrazení mapy (dlaždice zmenšené předem, kreslí se jen výřez) ===
+map_view = MapView(tile_images, VISIBLE_WIDTH, VISIBLE_HEIGHT - 40, TILE_SIZE)
+
+# === Mapa (ID dlaždic [řádek, sloupec]) ===
+tile_map = np.zeros((MAP_HEIGHT, MAP_WIDTH), dtype=np.int32)
+
+# === Historie úprav (Ctrl+Z / Ctrl+Y) ===
+history = EditHistory(MAP_WIDTH)
+
+# === Ukládání a načítání na pozadí ===
+map_store = MapStore()
+changes = 0  # počet úprav mapy (pro automatické ukládání)
+autosaved_changes = 0
+last_autosave = time.monotonic()
+status = ""  # stav ukládání / načítání v panelu
+
+def set_tiles(ys, xs, tile_ids):
+    """Nastaví dlaždice na mapě a překreslí je (bez zápisu do historie)."""
+    global changes
+    tile_map[ys, xs] = tile_ids
+    map_view.cells_changed(tile_map, ys, xs)
+    changes += 1
+
+def paint(x, y, tile_id):
+    """Nakreslí dlaždici a zapíše změnu do aktuálního tahu v historii."""
+    global changes
+    old_id = int(tile_map[y, x])
+    if old_id != tile_id:
+        changes += 1
+        history.record(x, y, old_id, tile_id)
+        tile_map[y, x] = tile_id
+        map_view.tile_changed(x, y, tile_id)
+
+def edit_cells(ys, xs, tile_ids):
+    """Změní více dlaždic najednou (jedno ID, nebo pole ID) jako jeden krok historie."""
+    old_ids = tile_map[ys, xs]
+    new_ids = np.broadcast_to(np.asarray(tile_ids, dtype=tile_map.dtype), old_ids.shape)
+    history.record_cells(ys, xs, old_ids, new_ids)
+    set_tiles(ys, xs, new_ids)
+
+# === Nástroje ===
+tool = BRUSH
+last_cell = None  # poslední dlaždice štětce (mezi ní a myší se kreslí čára)
+drag_start = None  # roh obdélníku / začátek čáry při tažení
+drag_button = 1
+clipboard = None  # zkopírované razítko (pole ID dlaždic)
+
+def mouse_tile():
+    """Vrátí souřadnice dlaždice pod myší (mohou být mimo mapu)."""
+    mx, my = pygame.mouse.get_pos()
+    return int((mx + camera_x) // map_view.tile_size), int((my + camera_y) // map_view.tile_size)
+
+def clamp_tile(x, y):
+    """Posune souřadnice dlaždice na nejbližší dlaždici mapy."""
+    return min(max(x, 0), MAP_WIDTH - 1), min(max(y, 0), MAP_HEIGHT - 1)
 
 # === Kamera ===
 camera_x = 0
 camera_y = 0
 camera_speed = 10
 
+def clamp_camera(x, y):
+    """Udrží kameru nad mapou (při aktuálním přiblížení)."""
+    tile_size = map_view.tile_size
+    x = max(0, min(x, MAP_WIDTH * tile_size - VISIBLE_WIDTH))
+    y = max(0, min(y, MAP_HEIGHT * tile_size - (VISIBLE_HEIGHT - 40)))
+    return x, y
+
 # === Hlavní smyčka ===
 running = True
 while running:
@@ -92,35 +172,48 @@ while running:
     # === Pohyb kamery ===
     keys = pygame.key.get_pressed()
     if keys[pygame.K_LEFT]:
-        camera_x = max(0, camera_x - camera_speed)
+        camera_x -= camera_speed
     if keys[pygame.K_RIGHT]:
-        camera_x = min(MAP_WIDTH * TILE_SIZE - VISIBLE_WIDTH, camera_x + camera_speed)
+        camera_x += camera_speed
     if keys[pygame.K_UP]:
-        camera_y = max(0, camera_y - camera_speed)
+        camera_y -= camera_speed
     if keys[pygame.K_DOWN]:
-        camera_y = min(MAP_HEIGHT * TILE_SIZE - (VISIBLE_HEIGHT - 40), camera_y + camera_speed)
+        camera_y += camera_speed
+    camera_x, camera_y = clamp_camera(camera_x, camera_y)
+    tile_size = map_view.tile_size
 
     # === Vykreslení mapy ===
-    for y in range(MAP_HEIGHT):
-        for x in range(MAP_WIDTH):
-            tile_id = tile_map[y][x]
-            img = tile_images.get(tile_id)
-            if img:
-                pos_x = x * TILE_SIZE - camera_x
-                pos_y = y * TILE_SIZE - camera_y
-                if 0 <= pos_x < VISIBLE_WIDTH and 0 <= pos_y < VISIBLE_HEIGHT - 40:
-                    scaled = pygame.transform.scale(img, (TILE_SIZE, TILE_SIZE))
-                    screen.blit(scaled, (pos_x, pos_y))
-                    pygame.draw.rect(screen, (0, 0, 0), (pos_x, pos_y, TILE_SIZE, TILE_SIZE), 1)
+    map_view.draw(screen, tile_map, camera_x, camera_y)
+
+    # === Náhled tažení a vkládání ===
+    hover_x, hover_y = mouse_tile()
+    if drag_start is not None:
+        end_x, end_y = clamp_tile(hover_x, hover_y)
+        if tool == LINE:
+            start = ((drag_start[0] + 0.5) * tile_size - camera_x, (drag_start[1] + 0.5) * tile_size - camera_y)
+            end = ((end_x + 0.5) * tile_size - camera_x, (end_y + 0.5) * tile_size - camera_y)
+            pygame.draw.line(screen, (255, 255, 0), start, end, 2)
+        else:
+            left, right = sorted((drag_start[0], end_x))
+            top, bottom = sorted((drag_start[1], end_y))
+            pygame.draw.rect(screen, (255, 255, 0), (left * tile_size - camera_x, top * tile_size - camera_y,
+                                                     (right - left + 1) * tile_size, (bottom - top + 1) * tile_size), 2)
+    elif tool == PASTE and clipboard is not None:
+        pygame.draw.rect(screen, (255, 255, 0), (hover_x * tile_size - camera_x, hover_y * tile_size - camera_y,
+                                                 clipboard.shape[1] * tile_size, clipboard.shape[0] * tile_size), 2)
 
     # === GUI panel ===
     pygame.draw.rect(screen, (30, 30, 30), (0, VISIBLE_HEIGHT - 40, VISIBLE_WIDTH, 40))
     desc = tile_descriptions.get(selected_tile, "?")
-    label = font.render(f"Vybraná dlaždice: {selected_tile} ({desc}) ←/→, WASD, Q: uložit, L: načíst", True, (255, 255, 255))
+    label = font.render(f"Vybraná dlaždice: {selected_tile} ({desc}) ←/→, WASD, Q: uložit, L: načíst | Nástroj: {tool} (1-6)", True, (255, 255, 255))
     screen.blit(label, (10, VISIBLE_HEIGHT - 30))
-    preview_tile = tile_images.get(selected_tile)
-    if preview_tile:
-        preview = pygame.transform.scale(preview_tile, (TILE_SIZE, TILE_SIZE))
+    if map_store.progress is not None:
+        status = f"Načítání {map_store.progress:.0%}"
+    if status:
+        status_label = font.render(status, True, (255, 255, 0))
+        screen.blit(status_label, (VISIBLE_WIDTH - TILE_SIZE - 20 - status_label.get_width(), VISIBLE_HEIGHT - 30))
+    preview = map_view.tile_image(selected_tile, TILE_SIZE)
+    if preview:
         screen.blit(preview, (VISIBLE_WIDTH - TILE_SIZE - 10, VISIBLE_HEIGHT - TILE_SIZE - 5))
 
     # === Události ===
@@ -128,19 +221,69 @@ while running:
         if event.type == pygame.QUIT:
             running = False
 
-        elif event.type == pygame.MOUSEBUTTONDOWN:
+        elif event.type == pygame.MOUSEWHEEL:
+            # Přiblížení kolem bodu pod myší
             mx, my = pygame.mouse.get_pos()
-            tx = (mx + camera_x) // TILE_SIZE
-            ty = (my + camera_y) // TILE_SIZE
-            if 0 <= tx < MAP_WIDTH and 0 <= ty < MAP_HEIGHT:
-                if event.button == 1:
-                    tile_map[ty][tx] = selected_tile
-                elif event.button == 3:
-                    tile_map[ty][tx] = 0
+            camera_x, camera_y = clamp_camera(*map_view.zoom(event.y, mx, my, camera_x, camera_y))
+            tile_size = map_view.tile_size
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 3):
+            tx, ty = mouse_tile()
+            inside = 0 <= tx < MAP_WIDTH and 0 <= ty < MAP_HEIGHT
+            new_tile = selected_tile if event.button == 1 else 0
+            if tool == BRUSH:
+                # Každý stisk tlačítka je jeden tah v historii
+                history.begin_stroke()
+                last_cell = (tx, ty)
+                if inside:
+                    paint(tx, ty, new_tile)
+            elif tool in (LINE, RECTANGLE, COPY):
+                drag_start = clamp_tile(tx, ty)
+                drag_button = event.button
+            elif tool == FILL and inside:
+                ys, xs = np.nonzero(flood_fill(tile_map, tx, ty))
+                edit_cells(ys, xs, new_tile)
+            elif tool == PASTE and clipboard is not None and event.button == 1:
+                stamp = clip_stamp(clipboard, tx, ty, MAP_WIDTH, MAP_HEIGHT)
+                if stamp is not None:
+                    edit_cells(*stamp)
+
+        elif event.type == pygame.MOUSEBUTTONUP and event.button in (1, 3):
+            if tool == BRUSH:
+                history.end_stroke()
+                last_cell = None
+            elif drag_start is not None:
+                end_x, end_y = clamp_tile(*mouse_tile())
+                new_tile = selected_tile if drag_button == 1 else 0
+                if tool == LINE:
+                    edit_cells(*line_cells(drag_start[0], drag_start[1], end_x, end_y), new_tile)
+                elif tool == RECTANGLE:
+                    edit_cells(*rectangle_cells(drag_start[0], drag_start[1], end_x, end_y), new_tile)
+                elif tool == COPY:
+                    left, right = sorted((drag_start[0], end_x))
+                    top, bottom = sorted((drag_start[1], end_y))
+                    clipboard = tile_map[top:bottom + 1, left:right + 1].copy()
+                    tool = PASTE
+                    print(f"Zkopírováno razítko {clipboard.shape[1]}×{clipboard.shape[0]}")
+                drag_start = None
 
         elif event.type == pygame.KEYDOWN:
+            ctrl = event.mod & pygame.KMOD_CTRL
+            # Zpět / znovu
+            if ctrl and event.key == pygame.K_z and not event.mod & pygame.KMOD_SHIFT:
+                history.undo(set_tiles)
+            elif ctrl and event.key in (pygame.K_y, pygame.K_z):
+                history.redo(set_tiles)
+
+            # Výběr nástroje
+            elif pygame.K_1 <= event.key <= pygame.K_6:
+                tool = TOOLS[event.key - pygame.K_1]
+                history.end_stroke()
+                last_cell = None
+                drag_start = None
+
             # Posun indexu v platných tile ID
-            if event.key == pygame.K_y or event.key == pygame.K_LEFTBRACKET:
+            elif event.key == pygame.K_y or event.key == pygame.K_LEFTBRACKET:
                 selected_index = (selected_index - 1) % len(valid_tile_ids)
                 selected_tile = valid_tile_ids[selected_index]
             elif event.key == pygame.K_x or event.key == pygame.K_RIGHTBRACKET:
@@ -167,36 +310,59 @@ while running:
                 selected_tile = 0
                 selected_index = valid_tile_ids.index(0)
 
-            elif event.key == pygame.K_q:
-                with open(map_filepath, "w") as f:
-                    for row in tile_map:
-                        f.write(",".join(map(str, row)) + "\n")
-                print("Mapa uložena jako tile_map.txt")
-
-            elif event.key == pygame.K_l:
-                try:
-                    with open(map_filepath, "r") as f:
-                        tile_map = [list(map(int, line.strip().split(","))) for line in f]
-                    MAP_HEIGHT = len(tile_map)
-                    MAP_WIDTH = len(tile_map[0]) if MAP_HEIGHT > 0 else 0
-                    print("Mapa načtena ze souboru.")
-                except Exception as e:
-                    print("Chyba při načítání:", e)
-
-    # === Malování při držení tlačítek ===
+            # Během načítání se neukládá, přepsal by se načítaný soubor starou mapou
+            elif event.key == pygame.K_q and map_store.progress is None:
+                map_store.save(tile_map, map_filepath)
+                status = "Ukládání…"
+
+            elif event.key == pygame.K_l and map_store.progress is None:
+                map_store.load(map_filepath)
+
+    # === Automatické ukládání ===
+    now = time.monotonic()
+    if AUTOSAVE_INTERVAL and now - last_autosave >= AUTOSAVE_INTERVAL and map_store.progress is None:
+        last_autosave = now
+        if changes != autosaved_changes:
+            autosaved_changes = changes
+            map_store.save(tile_map, autosave_filepath)
+
+    # === Dokončené uložení a načtení ===
+    for kind, path, result in map_store.poll():
+        name = os.path.basename(path)
+        if kind == "saved":
+            print(f"Mapa uložena jako {name}")
+            status = f"Uloženo: {name}"
+        elif kind == "loaded":
+            tile_map = result
+            MAP_HEIGHT, MAP_WIDTH = tile_map.shape
+            map_view.invalidate()
+            history.clear(MAP_WIDTH)
+            last_cell = None
+            drag_start = None
+            autosaved_changes = changes
+            print("Mapa načtena ze souboru.")
+            status = f"Načteno: {name}"
+        else:
+            print(f"Chyba při práci se souborem {name}:", result)
+            status = f"Chyba: {name}"
+
+    # === Malování štětcem při držení tlačítek ===
     mouse_buttons = pygame.mouse.get_pressed()
-    if mouse_buttons[0] or mouse_buttons[2]:
+    if tool == BRUSH and (mouse_buttons[0] or mouse_buttons[2]):
         mx, my = pygame.mouse.get_pos()
         if my < VISIBLE_HEIGHT - 40:
-            tx = (mx + camera_x) // TILE_SIZE
-            ty = (my + camera_y) // TILE_SIZE
-            if 0 <= tx < MAP_WIDTH and 0 <= ty < MAP_HEIGHT:
-                if mouse_buttons[0]:
-                    tile_map[ty][tx] = selected_tile
-                elif mouse_buttons[2]:
-                    tile_map[ty][tx] = 0
+            tx, ty = mouse_tile()
+            # Čára od minulé polohy myši, aby se při rychlém pohybu nic nevynechalo
+            start_x, start_y = last_cell or (tx, ty)
+            new_tile = selected_tile if mouse_buttons[0] else 0
+            ys, xs = line_cells(start_x, start_y, tx, ty)
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                if 0 <= x < MAP_WIDTH and 0 <= y < MAP_HEIGHT:
+                    paint(x, y, new_tile)
+            last_cell = (tx, ty)
 
     pygame.display.flip()
 
+map_store.close()
 pygame.quit()
 sys.exit()
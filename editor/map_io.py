@@ -0,0 +1,140 @@
+import os
+import queue
+import sys
+import threading
+import numpy as np
+
+# Zápis přes dočasný soubor je sdílený se hrou ve složce src
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from atomic_file import atomic_write  # noqa: E402
+
+
+class MapStore:
+    """Ukládání a načítání mapy na pozadí, aby editor během nich nezamrzl.
+
+    Ukládá se kopie mapy (snímek v okamžiku uložení), takže se dá dál kreslit.
+    Převod na text a zápis dělá pracovní vlákno: mapa se zapíše do dočasného
+    souboru vedle cílového a ten se pak přejmenuje (``os.replace``), takže
+    soubor na disku je vždy celá stará, nebo celá nová mapa. Více uložení do
+    stejného souboru čekajících ve frontě se sloučí do toho posledního.
+
+    Načítání čte soubor po řádcích a průběh (0 až 1) je v :attr:`progress`.
+    Výsledky úloh si hlavní smyčka vyzvedává přes :meth:`poll`.
+    """
+
+    def __init__(self):
+        """Spustí pracovní vlákno."""
+
+        self.progress = None  # průběh načítání (0 až 1), None = nic se nenačítá
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="MapStore", daemon=True)
+        self._worker.start()
+
+    # === Úlohy (volá hlavní smyčka) ===
+
+    def save(self, tile_map, path):
+        """Uloží snímek mapy na pozadí.
+
+        Args:
+            tile_map (numpy.ndarray): Mapa [řádek, sloupec].
+            path (str): Cílový soubor.
+        """
+
+        self._jobs.put(("save", path, tile_map.copy()))
+
+    def load(self, path):
+        """Načte mapu na pozadí, výsledek vrátí :meth:`poll`.
+
+        Args:
+            path (str): Soubor s mapou.
+        """
+
+        self.progress = 0.0
+        self._jobs.put(("load", path, None))
+
+    def poll(self):
+        """Vrátí dokončené úlohy od minulého volání.
+
+        Returns:
+            list[tuple]: ``("saved", cesta, None)``, ``("loaded", cesta, mapa)``
+            nebo ``("error", cesta, výjimka)``.
+        """
+
+        done = []
+        while True:
+            try:
+                done.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        return done
+
+    def close(self):
+        """Dokončí čekající úlohy (hlavně uložení) a ukončí vlákno."""
+
+        self._jobs.put(None)
+        self._worker.join()
+
+    # === Pracovní vlákno ===
+
+    def _run(self):
+        """Zpracovává úlohy z fronty, dokud nepřijde None."""
+
+        while True:
+            jobs = [self._jobs.get()]
+            while True:
+                try:
+                    jobs.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    break
+
+            for i, job in enumerate(jobs):
+                if job is None:
+                    return
+                kind, path, tile_map = job
+                # Starší uložení do souboru, který se ve frontě ukládá znovu, se přeskočí
+                if kind == "save" and any(later is not None and later[:2] == ("save", path) for later in jobs[i + 1:]):
+                    self._results.put(("saved", path, None))
+                    continue
+                try:
+                    if kind == "save":
+                        self._write(tile_map, path)
+                        self._results.put(("saved", path, None))
+                    else:
+                        self._results.put(("loaded", path, self._read(path)))
+                except Exception as e:
+                    self._results.put(("error", path, e))
+                finally:
+                    if kind == "load":
+                        self.progress = None
+
+    def _write(self, tile_map, path):
+        """Zapíše mapu jako CSV do dočasného souboru a přejmenuje ho na cílový."""
+
+        with atomic_write(path, "w", prefix=".tile_map.") as f:
+            # Po řádcích, převod celé mapy najednou by na dlouho držel GIL
+            for row in tile_map:
+                f.write(",".join(map(str, row.tolist())) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read(self, path):
+        """Přečte mapu po řádcích a průběžně nastavuje :attr:`progress`."""
+
+        size = os.path.getsize(path) or 1
+        rows = []
+        read = 0
+        with open(path, "rb") as f:
+            for line in f:
+                read += len(line)
+                line = line.strip()
+                if not line:
+                    continue
+                row = np.fromiter(map(int, line.split(b",")), dtype=np.int32)
+                if rows and len(row) != len(rows[0]):
+                    raise ValueError(f"řádek {len(rows) + 1} má {len(row)} dlaždic místo {len(rows[0])}")
+                rows.append(row)
+                self.progress = read / size
+        if not rows:
+            raise ValueError("soubor je prázdný")
+        return np.stack(rows)
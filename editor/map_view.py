@@ -0,0 +1,345 @@
+from collections import OrderedDict
+import numpy as np
+import pygame
+
+
+class ScaledTiles(dict):
+    """Obrázky dlaždic zmenšené na jednu velikost.
+
+    Dlaždice se zmenší až při prvním použití, takže se zmenšují jen ty,
+    které jsou opravdu na mapě. Neznámé ID vrací None.
+    """
+
+    def __init__(self, tile_images, tile_size):
+        super().__init__()
+        self.tile_images = tile_images
+        self.size = (tile_size, tile_size)
+
+    def __missing__(self, tile_id):
+        img = self.tile_images.get(tile_id)
+        if img is not None:
+            img = pygame.transform.scale(img, self.size)
+        self[tile_id] = img
+        return img
+
+
+class MapView:
+    """Vykreslování mapy v editoru.
+
+    Dlaždice se škálují jen jednou pro každou velikost a pak se berou z cache,
+    kreslí se jen dlaždice ve výřezu kamery (jedním voláním ``Surface.blits``)
+    a mřížka je předkreslená průhledná vrstva, která se jen posune pod kameru.
+    Cena snímku tak nezávisí na velikosti mapy.
+
+    Při malém přiblížení by se kreslily desítky tisíc malých dlaždic, proto se
+    mapa kreslí jako minimapa ve hře: každá dlaždice je jedna barva (průměrná
+    barva jejího obrázku). Základ je obrázek s jedním pixelem na dlaždici, pro
+    menší měřítka z něj vzniká mip pyramida (každá úroveň poloviční).
+
+    Větší měřítka se kreslí po čtvercových kusech (chunks), předkreslených
+    z dlaždic (nebo ze zvětšeného přehledu) a uložených v LRU cache. Snímek,
+    ve kterém se mapa nemění, je tak jen pár blitů. Když se změní jedna
+    dlaždice, :meth:`tile_changed` ji překreslí přímo ve všech plochách
+    v cache, které ji obsahují, nic se nekreslí celé znovu.
+    """
+
+    GRID_COLOR = (0, 0, 0)
+    BACKGROUND_COLOR = (64, 142, 93)
+    # Velikosti dlaždice v pixelech pro jednotlivé úrovně přiblížení
+    ZOOM_LEVELS = (0.25, 0.5, 1, 2, 3, 4, 6, 8, 10, 12, 16, 20, 24, 32, 40, 56, 80)
+    MIN_TILE_ZOOM = 10  # Od této velikosti se kreslí obrázky dlaždic, pod ní přehled
+    MIN_GRID_ZOOM = 16  # Od této velikosti se kreslí mřížka
+    CHUNK_PIXELS = 512  # Velikost kusu mapy na obrazovce
+    MAX_CHUNKS = 40  # Počet kusů mapy v cache (víc než se vejde na obrazovku)
+    MAX_PATCHED_TILES = 256  # Větší hromadné změny zahodí dotčené kusy místo překreslení po dlaždicích
+
+    def __init__(self, tile_images, view_width, view_height, tile_size=20):
+        """Inicializuje zobrazení mapy.
+
+        Args:
+            tile_images (dict): Nezměněné obrázky dlaždic podle ID.
+            view_width (int): Šířka oblasti mapy na obrazovce v pixelech.
+            view_height (int): Výška oblasti mapy na obrazovce v pixelech.
+            tile_size (float): Velikost dlaždice na obrazovce v pixelech.
+        """
+
+        self.tile_images = tile_images
+        self.view_width = view_width
+        self.view_height = view_height
+        self.tile_size = tile_size
+        self._scaled = {}  # velikost dlaždice -> ScaledTiles
+        self._grids = {}  # velikost dlaždice -> vrstva mřížky
+
+        # Průměrná barva každé dlaždice pro přehled mapy
+        colors = np.empty((max(tile_images, default=0) + 1, 3), dtype=np.uint8)
+        colors[:] = self.BACKGROUND_COLOR
+        for i, img in tile_images.items():
+            colors[i] = pygame.transform.average_color(img)[:3]
+        self.tile_colors = colors
+
+        self._overview = None  # obrázek s jedním pixelem na dlaždici
+        self._mips = {}  # velikost dlaždice < 1 -> zmenšený přehled
+        self._chunks = OrderedDict()  # (velikost dlaždice, chunk x, chunk y) -> předkreslený kus mapy
+
+    # === Dlaždice ===
+
+    def scaled_tiles(self, tile_size=None):
+        """Vrátí obrázky dlaždic zmenšené na danou velikost (zmenšují se při prvním použití)."""
+
+        tile_size = tile_size or self.tile_size
+        tiles = self._scaled.get(tile_size)
+        if tiles is None:
+            tiles = ScaledTiles(self.tile_images, tile_size)
+            self._scaled[tile_size] = tiles
+        return tiles
+
+    def tile_image(self, tile_id, tile_size=None):
+        """Vrátí zmenšený obrázek jedné dlaždice, nebo None, pokud dlaždice neexistuje."""
+
+        return self.scaled_tiles(tile_size)[tile_id]
+
+    def grid(self, tile_size=None):
+        """Vrátí vrstvu mřížky, která pokryje celý výřez při libovolném posunu kamery."""
+
+        tile_size = tile_size or self.tile_size
+        grid = self._grids.get(tile_size)
+        if grid is None:
+            columns = self.view_width // tile_size + 2
+            rows = self.view_height // tile_size + 2
+            grid = pygame.Surface((columns * tile_size, rows * tile_size), pygame.SRCALPHA)
+            for y in range(rows):
+                for x in range(columns):
+                    pygame.draw.rect(grid, self.GRID_COLOR, (x * tile_size, y * tile_size, tile_size, tile_size), 1)
+            self._grids[tile_size] = grid
+        return grid
+
+    # === Přiblížení ===
+
+    def zoom(self, steps, anchor_x, anchor_y, camera_x, camera_y):
+        """Změní přiblížení o daný počet úrovní tak, aby bod pod kotvou zůstal na místě.
+
+        Args:
+            steps (int): O kolik úrovní přiblížit (záporné = oddálit).
+            anchor_x (int): Pozice kotvy (např. myši) ve výřezu.
+            anchor_y (int): Pozice kotvy ve výřezu.
+            camera_x (float): Pozice kamery při původním přiblížení.
+            camera_y (float): Pozice kamery při původním přiblížení.
+
+        Returns:
+            tuple[float, float]: Pozice kamery při novém přiblížení.
+        """
+
+        levels = self.ZOOM_LEVELS
+        current = min(range(len(levels)), key=lambda i: abs(levels[i] - self.tile_size))
+        new_size = levels[max(0, min(len(levels) - 1, current + steps))]
+        factor = new_size / self.tile_size
+        self.tile_size = new_size
+        return (anchor_x + camera_x) * factor - anchor_x, (anchor_y + camera_y) * factor - anchor_y
+
+    # === Předkreslené plochy ===
+
+    def tile_changed(self, x, y, tile_id):
+        """Překreslí jednu změněnou dlaždici ve všech plochách v cache.
+
+        Args:
+            x (int): Sloupec dlaždice.
+            y (int): Řádek dlaždice.
+            tile_id (int): Nové ID dlaždice.
+        """
+
+        color = self._tile_color(tile_id)
+        if self._overview is not None:
+            self._overview.set_at((x, y), color)
+
+            # Pixel v každé menší úrovni je průměr 2×2 pixelů úrovně nad ní
+            larger = self._overview
+            size = 0.5
+            while size in self._mips:
+                mip = self._mips[size]
+                mip_x, mip_y = int(x * size), int(y * size)
+                if mip_x < mip.get_width() and mip_y < mip.get_height():
+                    block = pygame.surfarray.pixels3d(larger)[mip_x * 2:mip_x * 2 + 2, mip_y * 2:mip_y * 2 + 2]
+                    mip.set_at((mip_x, mip_y), tuple(int(c) for c in block.reshape(-1, 3).mean(axis=0)))
+                    del block  # uvolní zámek plochy
+                larger = mip
+                size /= 2
+
+        for (size, chunk_x, chunk_y), chunk in self._chunks.items():
+            tiles = self.CHUNK_PIXELS // size
+            if x // tiles != chunk_x or y // tiles != chunk_y:
+                continue
+            rect = pygame.Rect((x - chunk_x * tiles) * size, (y - chunk_y * tiles) * size, size, size)
+            if size < self.MIN_TILE_ZOOM:
+                chunk.fill(color, rect)
+            else:
+                chunk.fill(self.BACKGROUND_COLOR, rect)
+                img = self.scaled_tiles(size)[tile_id]
+                if img:
+                    chunk.blit(img, rect)
+
+    def cells_changed(self, tile_map, ys, xs):
+        """Oznámí hromadnou změnu dlaždic (výplň, obdélník, vložení, zpět).
+
+        Pár dlaždic se překreslí po jedné, u větší změny se přehled přepočítá
+        jen v obdélníku kolem změny a kusy mapy, které do něj zasahují, se
+        zahodí (při dalším kreslení vzniknou znovu).
+
+        Args:
+            tile_map (numpy.ndarray): Mapa už se změnami.
+            ys (numpy.ndarray): Řádky změněných dlaždic.
+            xs (numpy.ndarray): Sloupce změněných dlaždic.
+        """
+
+        if len(ys) == 0:
+            return
+        if len(ys) <= self.MAX_PATCHED_TILES:
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                self.tile_changed(x, y, int(tile_map[y, x]))
+            return
+
+        left, right = int(xs.min()), int(xs.max()) + 1
+        top, bottom = int(ys.min()), int(ys.max()) + 1
+        if self._overview is not None:
+            ids = tile_map[top:bottom, left:right]
+            ids = np.where((ids >= 0) & (ids < len(self.tile_colors)), ids, 0)
+            pixels = pygame.surfarray.pixels3d(self._overview)
+            pixels[left:right, top:bottom] = self.tile_colors[ids.T]
+            del pixels  # uvolní zámek plochy
+        self._mips.clear()
+        for key in list(self._chunks):
+            size, chunk_x, chunk_y = key
+            tiles = self.CHUNK_PIXELS // size
+            if (chunk_x * tiles < right and (chunk_x + 1) * tiles > left
+                    and chunk_y * tiles < bottom and (chunk_y + 1) * tiles > top):
+                del self._chunks[key]
+
+    def invalidate(self):
+        """Zahodí všechny předkreslené plochy, např. po načtení jiné mapy."""
+
+        self._overview = None
+        self._mips.clear()
+        self._chunks.clear()
+
+    def _tile_color(self, tile_id):
+        """Vrátí barvu dlaždice v přehledu."""
+
+        if 0 <= tile_id < len(self.tile_colors):
+            return tuple(int(c) for c in self.tile_colors[tile_id])
+        return self.BACKGROUND_COLOR
+
+    def overview(self, tile_map, tile_size=1):
+        """Vrátí přehled celé mapy s danou velikostí dlaždice (nejvýš 1 pixel).
+
+        Args:
+            tile_map (numpy.ndarray): Mapa, ID dlaždic [řádek, sloupec].
+            tile_size (float): 1 nebo úroveň mip pyramidy (0.5, 0.25, ...).
+        """
+
+        if self._overview is None:
+            ids = np.asarray(tile_map, dtype=np.int64)
+            ids = np.where((ids >= 0) & (ids < len(self.tile_colors)), ids, 0)
+            self._overview = pygame.surfarray.make_surface(self.tile_colors[ids.T])
+        if tile_size >= 1:
+            return self._overview
+
+        mip = self._mips.get(tile_size)
+        if mip is None:
+            # Každá úroveň vzniká z o jednu větší (průměrováním 2×2 pixelů)
+            larger = self.overview(tile_map, tile_size * 2)
+            width, height = larger.get_size()
+            mip = pygame.transform.smoothscale(larger, (max(1, width // 2), max(1, height // 2)))
+            self._mips[tile_size] = mip
+        return mip
+
+    def chunk(self, tile_map, tile_size, chunk_x, chunk_y):
+        """Vrátí předkreslený kus mapy pro velikost dlaždice větší než 1 pixel.
+
+        Pod :attr:`MIN_TILE_ZOOM` je kus zvětšený přehled, jinak je složený
+        z obrázků dlaždic.
+        """
+
+        key = (tile_size, chunk_x, chunk_y)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        map_height, map_width = tile_map.shape
+        tiles = self.CHUNK_PIXELS // tile_size
+        area = pygame.Rect(chunk_x * tiles, chunk_y * tiles, tiles, tiles).clip(pygame.Rect(0, 0, map_width, map_height))
+        if tile_size < self.MIN_TILE_ZOOM:
+            overview = self.overview(tile_map)
+            chunk = pygame.transform.scale(overview.subsurface(area), (area.width * tile_size, area.height * tile_size))
+        else:
+            chunk = pygame.Surface((area.width * tile_size, area.height * tile_size))
+            chunk.fill(self.BACKGROUND_COLOR)
+            scaled = self.scaled_tiles(tile_size)
+            blits = []
+            ids = tile_map[area.top:area.bottom, area.left:area.right].tolist()
+            for row_index, row in enumerate(ids):
+                pos_y = row_index * tile_size
+                for column, tile_id in enumerate(row):
+                    img = scaled[tile_id]
+                    if img:
+                        blits.append((img, (column * tile_size, pos_y)))
+            chunk.blits(blits, doreturn=False)
+
+        self._chunks[key] = chunk
+        if len(self._chunks) > self.MAX_CHUNKS:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    # === Kreslení ===
+
+    def visible_range(self, camera_x, camera_y, map_width, map_height, tile_size=None):
+        """Vrátí rozsah viditelných dlaždic (x0, y0, x1, y1), konce jsou bez sebe."""
+
+        tile_size = tile_size or self.tile_size
+        x0 = max(0, int(camera_x // tile_size))
+        y0 = max(0, int(camera_y // tile_size))
+        x1 = min(map_width, int((camera_x + self.view_width - 1) // tile_size) + 1)
+        y1 = min(map_height, int((camera_y + self.view_height - 1) // tile_size) + 1)
+        return x0, y0, max(x0, x1), max(y0, y1)
+
+    def draw(self, screen, tile_map, camera_x, camera_y):
+        """Vykreslí viditelnou část mapy (a mřížku, pokud je dost přiblížená).
+
+        Args:
+            screen (pygame.Surface): Cílová plocha.
+            tile_map (numpy.ndarray): Mapa, ID dlaždic [řádek, sloupec].
+            camera_x (float): Pozice kamery na mapě v pixelech.
+            camera_y (float): Pozice kamery na mapě v pixelech.
+        """
+
+        if tile_map.size == 0:
+            return
+        previous_clip = screen.get_clip()
+        screen.set_clip(pygame.Rect(0, 0, self.view_width, self.view_height))
+        tile_size = self.tile_size
+        if tile_size <= 1:
+            screen.blit(self.overview(tile_map, tile_size), (-camera_x, -camera_y))
+        else:
+            self._draw_chunks(screen, tile_map, camera_x, camera_y)
+            if tile_size >= self.MIN_GRID_ZOOM:
+                x0, y0, x1, y1 = self.visible_range(camera_x, camera_y, tile_map.shape[1], tile_map.shape[0])
+                area = pygame.Rect(0, 0, (x1 - x0) * tile_size, (y1 - y0) * tile_size)
+                screen.blit(self.grid(tile_size), (x0 * tile_size - camera_x, y0 * tile_size - camera_y), area)
+        screen.set_clip(previous_clip)
+
+    def _draw_chunks(self, screen, tile_map, camera_x, camera_y):
+        """Vykreslí viditelné kusy mapy."""
+
+        tile_size = self.tile_size
+        tiles = self.CHUNK_PIXELS // tile_size
+        chunk_pixels = tiles * tile_size
+        rows = -(-tile_map.shape[0] // tiles)
+        columns = -(-tile_map.shape[1] // tiles)
+        x0 = max(0, int(camera_x // chunk_pixels))
+        y0 = max(0, int(camera_y // chunk_pixels))
+        x1 = min(columns, int((camera_x + self.view_width - 1) // chunk_pixels) + 1)
+        y1 = min(rows, int((camera_y + self.view_height - 1) // chunk_pixels) + 1)
+        screen.blits([
+            (self.chunk(tile_map, tile_size, cx, cy), (cx * chunk_pixels - camera_x, cy * chunk_pixels - camera_y))
+            for cy in range(y0, y1)
+            for cx in range(x0, x1)
+        ], doreturn=False)
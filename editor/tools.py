@@ -0,0 +1,113 @@
+import numpy as np
+
+# === Nástroje editoru ===
+BRUSH = "štětec"
+LINE = "čára"
+RECTANGLE = "obdélník"
+FILL = "výplň"
+COPY = "kopírovat"
+PASTE = "vložit"
+TOOLS = (BRUSH, LINE, RECTANGLE, FILL, COPY, PASTE)  # klávesy 1-6
+
+
+def line_cells(x0, y0, x1, y1):
+    """Vrátí dlaždice na úsečce mezi dvěma dlaždicemi (Bresenhamův algoritmus).
+
+    Používá se i mezi dvěma po sobě jdoucími polohami myši, aby štětec
+    při rychlém pohybu nevynechával dlaždice.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Řádky a sloupce dlaždic (ys, xs).
+    """
+
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    step_x = 1 if x0 < x1 else -1
+    step_y = 1 if y0 < y1 else -1
+    error = dx + dy
+    xs = []
+    ys = []
+    while True:
+        xs.append(x0)
+        ys.append(y0)
+        if x0 == x1 and y0 == y1:
+            break
+        double = 2 * error
+        if double >= dy:
+            error += dy
+            x0 += step_x
+        if double <= dx:
+            error += dx
+            y0 += step_y
+    return np.array(ys, dtype=np.intp), np.array(xs, dtype=np.intp)
+
+
+def rectangle_cells(x0, y0, x1, y1):
+    """Vrátí všechny dlaždice obdélníku se dvěma danými rohy (včetně nich).
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Řádky a sloupce dlaždic (ys, xs).
+    """
+
+    left, right = sorted((x0, x1))
+    top, bottom = sorted((y0, y1))
+    ys, xs = np.mgrid[top:bottom + 1, left:right + 1]
+    return ys.ravel(), xs.ravel()
+
+
+def flood_fill(grid, x, y):
+    """Najde souvislou oblast (sousedé přes hranu) stejných dlaždic jako na (x, y).
+
+    Řádkové (scanline) vyplňování: oblast se prochází po vodorovných úsecích,
+    konce úseku i začátky úseků v sousedních řádcích se hledají operacemi
+    NumPy nad celým řádkem, ne po jednotlivých dlaždicích.
+
+    Args:
+        grid (numpy.ndarray): Mapa [řádek, sloupec].
+        x (int): Sloupec počáteční dlaždice.
+        y (int): Řádek počáteční dlaždice.
+
+    Returns:
+        numpy.ndarray: Booleovská maska oblasti.
+    """
+
+    same = grid == grid[y, x]
+    filled = np.zeros_like(same)
+    height, width = grid.shape
+    stack = [(x, y)]
+    while stack:
+        x, y = stack.pop()
+        if filled[y, x]:
+            continue
+        row = same[y]
+
+        # Konce úseku: první jiná dlaždice vlevo a vpravo (argmin najde první False)
+        to_left = row[x::-1]
+        left = 0 if to_left.all() else x - int(np.argmin(to_left)) + 1
+        to_right = row[x:]
+        right = width if to_right.all() else x + int(np.argmin(to_right))
+        filled[y, left:right] = True
+
+        # V sousedních řádcích začíná nový úsek všude, kde začíná souvislý kus oblasti
+        for next_y in (y - 1, y + 1):
+            if 0 <= next_y < height:
+                open_cells = same[next_y, left:right] & ~filled[next_y, left:right]
+                starts = np.flatnonzero(open_cells & ~np.concatenate(([False], open_cells[:-1])))
+                stack.extend((left + int(start), next_y) for start in starts)
+    return filled
+
+
+def clip_stamp(stamp, x, y, width, height):
+    """Ořízne razítko vložené levým horním rohem na (x, y) podle rozměrů mapy.
+
+    Returns:
+        tuple | None: (ys, xs, ID dlaždic) vložených dlaždic, nebo None, pokud je celé mimo mapu.
+    """
+
+    stamp_height, stamp_width = stamp.shape
+    left, top = max(x, 0), max(y, 0)
+    right, bottom = min(x + stamp_width, width), min(y + stamp_height, height)
+    if left >= right or top >= bottom:
+        return None
+    ys, xs = np.mgrid[top:bottom, left:right]
+    return ys.ravel(), xs.ravel(), stamp[top - y:bottom - y, left - x:right - x].ravel()
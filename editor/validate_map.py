@@ -0,0 +1,161 @@
+"""
+Kontrola mapy a předpočítání dat pro hru
+
+python validate_map.py [mapa] [--bez-zapisu]
+
+Zkontroluje mapu uloženou editorem (výchozí tile_map.txt vedle skriptu):
+- všechny řádky mají stejný počet dlaždic a jsou to celá čísla,
+- každé ID dlaždice je v tile_dict a jeho souřadnice jsou uvnitř tilesetu,
+- všechna stanoviště zákazníků (pickup) jsou propojená silnicí
+  (souvislé oblasti průchozích dlaždic, WALKABLE_TILES).
+
+Když je mapa v pořádku, uloží vedle ní předpočítaná data, která hra načte
+místo procházení mapy při startu (viz map_index.MapIndex):
+- <mapa>.index.npz  - polohy stanovišť, mapa průchodnosti (bity),
+                      silniční vzdálenosti mezi všemi stanovišti zákazníků
+- <mapa>.minimap.png - obrázek minimapy
+
+Návratový kód je 1, pokud mapa obsahuje chyby.
+"""
+
+import argparse
+import os
+import sys
+import numpy as np
+import pygame
+
+# Herní moduly (dlaždice, MapIndex, RoadNetwork) jsou ve složce src
+base_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(base_path), "src"))
+from tile_registry import tile_dict, WALKABLE_TILES, minimap_colors  # noqa: E402
+from map_index import MapIndex, artifact_paths  # noqa: E402
+from road_network import RoadNetwork  # noqa: E402
+
+# === Stejné nastavení jako ve hře ===
+SPRITE_TILE_SIZE = 16
+TILE_SPACING = 1
+TILE_MARGIN = 0
+MINIMAP_SCALE = 2
+
+
+def read_map(path, errors):
+    """Načte mapu ve formátu editoru (řádky ID oddělených čárkou).
+
+    Chyby formátu přidá do ``errors``, vadné hodnoty nahradí dlaždicí 0.
+
+    Returns:
+        list[list[int]]: Mapa [řádek][sloupec], nebo None, pokud ji nejde použít.
+    """
+
+    tile_map = []
+    with open(path, "r") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            row = []
+            for column, value in enumerate(line.split(",")):
+                try:
+                    row.append(int(value))
+                except ValueError:
+                    errors.append(f"řádek {line_number}, sloupec {column}: '{value}' není číslo dlaždice")
+                    row.append(0)
+            if tile_map and len(row) != len(tile_map[0]):
+                errors.append(f"řádek {line_number} má {len(row)} dlaždic místo {len(tile_map[0])}")
+                return None
+            tile_map.append(row)
+    if not tile_map:
+        errors.append("mapa je prázdná")
+        return None
+    return tile_map
+
+
+def check_tiles(tile_map, sheet_size, errors):
+    """Zkontroluje, že mapa používá jen dlaždice z tile_dict, které jsou v tilesetu."""
+
+    columns = (sheet_size[0] - TILE_MARGIN) // (SPRITE_TILE_SIZE + TILE_SPACING)
+    rows = (sheet_size[1] - TILE_MARGIN) // (SPRITE_TILE_SIZE + TILE_SPACING)
+    grid = np.array(tile_map)
+    for tile_id in np.unique(grid).tolist():
+        if tile_id not in tile_dict:
+            where = np.argwhere(grid == tile_id)
+            y, x = where[0].tolist()
+            errors.append(f"neznámá dlaždice {tile_id} ({len(where)}×, poprvé na ({x}, {y}))")
+            continue
+        x, y = tile_dict[tile_id][0]
+        if not (0 <= x < columns and 0 <= y < rows):
+            errors.append(f"dlaždice {tile_id} má souřadnice ({x}, {y}) mimo tileset {columns}×{rows}")
+
+
+def check_pickups(index, errors):
+    """Najde stanoviště zákazníků, která nejsou silnicí propojená s ostatními.
+
+    Za hlavní síť se bere souvislá oblast průchozích dlaždic s nejvíce stanovišti.
+    """
+
+    pickups = index.locations["pickup"]
+    if len(pickups) < 2:
+        errors.append(f"mapa má jen {len(pickups)} stanovišť zákazníků, hra potřebuje aspoň 2")
+        return
+    labels = RoadNetwork(index.walkable_mask).components()
+    pickup_labels = [int(labels[y, x]) for x, y in pickups]
+    main = max(set(pickup_labels), key=pickup_labels.count)
+    for (x, y), label in zip(pickups, pickup_labels):
+        if label != main:
+            errors.append(f"stanoviště zákazníků ({x}, {y}) je nedostupné z ostatních")
+
+
+def pickup_distances(index):
+    """Spočítá silniční vzdálenosti mezi všemi stanovišti zákazníků (tak, jak jezdí auta ve hře).
+
+    Returns:
+        numpy.ndarray: int32 [odkud, kam] vzdálenosti v dlaždicích, -1 = nedostupné.
+    """
+
+    pickups = index.locations["pickup"]
+    network = RoadNetwork(index.walkable_mask, cache_size=1, clearance=index.road_clearance)
+    distances = np.full((len(pickups), len(pickups)), -1, dtype=np.int32)
+    for j, goal in enumerate(pickups):
+        for i, start in enumerate(pickups):
+            distances[i, j] = network.distance(start, goal)
+    return distances
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zkontroluje mapu editoru a předpočítá data pro hru.")
+    parser.add_argument("mapa", nargs="?", default=os.path.join(base_path, "tile_map.txt"), help="soubor s mapou")
+    parser.add_argument("--bez-zapisu", action="store_true", help="jen zkontrolovat, nic neukládat")
+    args = parser.parse_args()
+
+    errors = []
+    tile_map = read_map(args.mapa, errors)
+    if tile_map is None:
+        for error in errors:
+            print("CHYBA:", error)
+        return 1
+
+    sheet_size = pygame.image.load(os.path.join(base_path, "tilemap.png")).get_size()
+    check_tiles(tile_map, sheet_size, errors)
+    index = MapIndex(tile_map, WALKABLE_TILES, minimap_colors(tile_dict.keys()), MINIMAP_SCALE)
+    check_pickups(index, errors)
+
+    print(f"Mapa {len(tile_map[0])}×{len(tile_map)} dlaždic, "
+          + ", ".join(f"{category}: {len(tiles)}" for category, tiles in index.locations.items()))
+    for error in errors:
+        print("CHYBA:", error)
+    if errors:
+        print("Mapa obsahuje chyby, data se neukládají.")
+        return 1
+
+    if not args.bez_zapisu:
+        distances = pickup_distances(index)
+        unreachable = int((distances < 0).sum())
+        if unreachable:
+            print(f"Pozor: {unreachable} dvojic stanovišť je dostupných jen úzkými průjezdy (mimo trasy aut).")
+        index.save_artifacts(args.mapa, distances)
+        print("Uloženo:", ", ".join(os.path.basename(path) for path in artifact_paths(args.mapa)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
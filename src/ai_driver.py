@@ -0,0 +1,362 @@
+import math
+import numpy as np
+import pygame
+from fleet import STEER_LEFT, STEER_RIGHT, THROTTLE, REVERSE, BRAKE
+
+# Which pygame key each control flag stands for
+_FLAG_KEYS = (
+    (STEER_LEFT, pygame.K_a),
+    (STEER_RIGHT, pygame.K_d),
+    (THROTTLE, pygame.K_w),
+    (REVERSE, pygame.K_s),
+    (BRAKE, pygame.K_x),
+)
+
+
+class KeyState:
+    """A pressed-keys sequence that can be passed to ``CarSprite.update`` instead of ``pygame.key.get_pressed()``."""
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed=()):
+        """Initializes the key state.
+
+        Args:
+            pressed (iterable): pygame key constants that are held down.
+        """
+
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    @classmethod
+    def from_controls(cls, controls, handbrake_toggle=False):
+        """Builds a key state from Fleet control flags.
+
+        Args:
+            controls (int): Combined control flags.
+            handbrake_toggle (bool): Whether SPACE is pressed this tick.
+        """
+
+        pressed = [key for flag, key in _FLAG_KEYS if controls & flag]
+        if handbrake_toggle:
+            pressed.append(pygame.K_SPACE)
+        return cls(pressed)
+
+
+class AIDriver:
+    """Autonomous driver of one taxi.
+
+    Follows a road path tile by tile and serves a :class:`Job` the way
+    ``Game.loop`` requires from the player: it stops at the pickup and delivery
+    tiles with the handbrake engaged, waits, then releases the handbrake and
+    drives on. Steering and throttle are decided by :func:`plan_drivers`, which
+    handles any number of drivers in one vectorized pass.
+
+    Without a job, :meth:`drive_to` sends the driver to any tile; it becomes
+    idle again once it gets there.
+
+    Attributes:
+        phase: One of ``"idle"``, ``"to_pickup"``, ``"at_pickup"``, ``"to_delivery"``,
+            ``"at_delivery"`` or ``"to_destination"``.
+        job: The job being served, or None.
+        path: Remaining tiles to drive through.
+        completed_jobs: Number of delivered jobs.
+    """
+
+    CRUISE_SPEED = 3.0
+    TURN_SPEED = 1.5
+    STEER_DEADBAND = 4  # degrees
+    STOP_RADIUS = 50  # Same radius as Game.is_at_tile
+    DWELL_TICKS = 30  # How long the driver waits with the handbrake engaged
+    STUCK_TICKS = 30  # Ticks without moving before the driver backs up
+    REVERSE_TICKS = 25
+    LOOKAHEAD = 3  # Tiles to look ahead along the path (about the car's turning radius)
+    SEARCH_WINDOW = 8  # Path tiles searched for the car's current progress
+
+    def __init__(self, road_network, tile_size):
+        """Initializes an idle driver.
+
+        Args:
+            road_network (RoadNetwork): Road graph used for path finding.
+            tile_size (int): Size of one tile in world pixels.
+        """
+
+        self.road_network = road_network
+        self.tile_size = tile_size
+        self.phase = "idle"
+        self.job = None
+        self.path = []
+        self.path_index = 0
+        self.wait_ticks = 0
+        self.stuck_ticks = 0
+        self.reverse_ticks = 0
+        self.reverse_steer = STEER_LEFT
+        self.last_pos = None
+        self.completed_jobs = 0
+
+    def tile_center(self, tile):
+        """Returns the world position of a tile's center as a (x, y) tuple."""
+
+        return (tile[0] * self.tile_size + self.tile_size // 2, tile[1] * self.tile_size + self.tile_size // 2)
+
+    def route_to(self, start_tile, goal_tile):
+        """Plans the path from start_tile to goal_tile."""
+
+        self.path = self.road_network.shortest_path(start_tile, goal_tile)
+        self.path_index = 0
+
+    def assign_job(self, job, car_pos):
+        """Starts serving a job.
+
+        Args:
+            job (Job): The job to serve.
+            car_pos: The car's world position.
+        """
+
+        self.job = job
+        self.phase = "to_pickup"
+        self.route_to(self.world_to_tile(car_pos), job.pickup_tile_loc)
+
+    def drive_to(self, goal_tile, car_pos):
+        """Sends the driver to a tile without a job.
+
+        Args:
+            goal_tile (tuple[int, int]): The destination tile (x, y).
+            car_pos: The car's world position.
+        """
+
+        self.job = None
+        self.phase = "to_destination"
+        self.route_to(self.world_to_tile(car_pos), goal_tile)
+
+    def world_to_tile(self, pos):
+        """Converts a world position to tile coordinates."""
+
+        return (int(pos[0]) // self.tile_size, int(pos[1]) // self.tile_size)
+
+    @property
+    def stop_tile(self):
+        """The tile where the driver has to stop next, or None."""
+
+        if self.phase == "to_pickup":
+            return self.job.pickup_tile_loc
+        if self.phase == "to_delivery":
+            return self.job.delivery_tile_loc
+        if self.phase == "to_destination" and self.path:
+            return self.path[-1]
+        return None
+
+    def target(self):
+        """Returns the world position the driver currently steers towards, or None."""
+
+        if not self.path:
+            return None
+        index = min(self.path_index + self.LOOKAHEAD, len(self.path) - 1)
+        return self.tile_center(self.path[index])
+
+    def follow_path(self, pos, distance):
+        """Moves a position along the path without simulating the car.
+
+        A cheap estimate for cars too far away to be seen: the car is assumed to
+        drive through the tile centers of its path. Reaching the end of a
+        :meth:`drive_to` trip makes the driver idle.
+
+        Args:
+            pos: The car's world position.
+            distance (float): Distance to travel in world pixels.
+
+        Returns:
+            tuple: (x, y, angle) of the new position and heading, the angle
+            is None if the position did not change.
+        """
+
+        x, y = float(pos[0]), float(pos[1])
+        angle = None
+        # Head for the center of the current path tile first, then the following ones
+        index = self.path_index
+        while distance > 0 and index < len(self.path):
+            tx, ty = self.tile_center(self.path[index])
+            dx, dy = tx - x, ty - y
+            length = math.hypot(dx, dy)
+            if length > 0:
+                angle = math.degrees(math.atan2(-dx, -dy))
+            if length <= distance:
+                x, y = tx, ty
+                distance -= length
+                self.path_index = index
+                index += 1
+            else:
+                x += dx / length * distance
+                y += dy / length * distance
+                distance = 0
+
+        self.stuck_ticks = 0
+        self.reverse_ticks = 0
+        self.last_pos = None
+        if self.phase == "to_destination" and self.path_index + 1 >= len(self.path):
+            self.phase = "idle"
+            self.path = []
+        return x, y, angle
+
+    def keys(self, car):
+        """Plans a single car and returns its key state (for use with ``CarSprite.update``).
+
+        The returned state contains SPACE when the handbrake should be toggled.
+
+        Args:
+            car (CarSprite): The car driven by this driver.
+        """
+
+        controls, toggles = plan_drivers(
+            [self],
+            np.array([car.pos]),
+            np.array([car.angle]),
+            np.array([car.speed]),
+            np.array([car.handbrake_engaged]),
+        )
+        return KeyState.from_controls(int(controls[0]), bool(toggles[0]))
+
+    def drive(self, car, game, camera_x, camera_y):
+        """Convenience helper: plans one tick and applies it to a CarSprite.
+
+        Args:
+            car (CarSprite): The car driven by this driver.
+            game (Game): The game, used for collisions.
+            camera_x (float): The camera's x position.
+            camera_y (float): The camera's y position.
+        """
+
+        keys = self.keys(car)
+        if keys[pygame.K_SPACE]:
+            car.toggle_handbrake()
+        car.update(game, camera_x, camera_y, keys)
+
+
+def plan_drivers(drivers, pos, angle, speed, handbrake):
+    """Decides the controls of many AI drivers in one vectorized planning pass.
+
+    Args:
+        drivers (list[AIDriver]): The drivers, aligned with the state arrays.
+        pos (numpy.ndarray): (N, 2) car positions.
+        angle (numpy.ndarray): (N,) car headings in degrees.
+        speed (numpy.ndarray): (N,) car speeds.
+        handbrake (numpy.ndarray): (N,) handbrake states.
+
+    Returns:
+        tuple: (uint8 control flags per car, bool array of cars whose handbrake must be toggled)
+    """
+
+    count = len(drivers)
+    controls = np.zeros(count, dtype=np.uint8)
+    toggles = np.zeros(count, dtype=bool)
+    if count == 0:
+        return controls, toggles
+
+    # Gather per-driver targets
+    targets = np.empty((count, 2))
+    stops = np.full((count, 2), np.nan)
+    driving = np.zeros(count, dtype=bool)
+    for i, driver in enumerate(drivers):
+        target = driver.target() if driver.phase in ("to_pickup", "to_delivery", "to_destination") else None
+        if target is not None:
+            targets[i] = target
+            driving[i] = True
+            stops[i] = driver.tile_center(driver.stop_tile)
+        else:
+            targets[i] = pos[i]
+
+    # Steering towards the look-ahead point (angle 0 = up, positive = counterclockwise)
+    delta = targets - pos
+    desired = np.degrees(np.arctan2(-delta[:, 0], -delta[:, 1]))
+    error = (desired - angle + 180) % 360 - 180
+    steer_left = error > AIDriver.STEER_DEADBAND
+    steer_right = error < -AIDriver.STEER_DEADBAND
+
+    # Speed: slow down for sharp turns and when approaching the stop tile
+    stop_distance = np.hypot(stops[:, 0] - pos[:, 0], stops[:, 1] - pos[:, 1])
+    stop_distance = np.where(np.isnan(stop_distance), np.inf, stop_distance)
+    target_speed = np.where(np.abs(error) > 45, AIDriver.TURN_SPEED, AIDriver.CRUISE_SPEED)
+    target_speed = np.minimum(target_speed, np.maximum(stop_distance - AIDriver.STOP_RADIUS / 2, 0) / 20)
+    at_stop = stop_distance <= AIDriver.STOP_RADIUS
+
+    throttle = driving & (speed < target_speed) & ~at_stop
+    brake = driving & ((speed > target_speed + 0.5) | at_stop) & (np.abs(speed) > 0)
+    stopped = driving & at_stop & (np.abs(speed) < 0.2) & ~handbrake
+
+    controls |= np.where(driving & steer_left, STEER_LEFT, 0).astype(np.uint8)
+    controls |= np.where(driving & steer_right, STEER_RIGHT, 0).astype(np.uint8)
+    controls |= np.where(throttle, THROTTLE, 0).astype(np.uint8)
+    controls |= np.where(brake, BRAKE, 0).astype(np.uint8)
+
+    tile_size = drivers[0].tile_size
+    tiles = (np.trunc(pos).astype(np.int64) // tile_size)
+
+    # Per-driver bookkeeping: phases, waypoints and getting unstuck
+    for i in np.flatnonzero(driving | handbrake):
+        driver = drivers[i]
+        last_pos = driver.last_pos
+        driver.last_pos = (pos[i, 0], pos[i, 1])
+
+        if driver.phase in ("at_pickup", "at_delivery"):
+            driver.wait_ticks -= 1
+            if driver.wait_ticks <= 0:
+                toggles[i] = handbrake[i]
+                if driver.phase == "at_pickup":
+                    driver.phase = "to_delivery"
+                    driver.route_to((int(tiles[i, 0]), int(tiles[i, 1])), driver.job.delivery_tile_loc)
+                else:
+                    driver.phase = "idle"
+                    driver.job = None
+                    driver.path = []
+                    driver.completed_jobs += 1
+            continue
+
+        if not driving[i]:
+            continue
+
+        if driver.phase == "to_destination" and at_stop[i]:
+            driver.phase = "idle"
+            driver.path = []
+            driver.stuck_ticks = 0
+            continue
+
+        if stopped[i]:
+            # Engage the handbrake at the pickup/delivery tile, like the player has to
+            toggles[i] = True
+            driver.phase = "at_pickup" if driver.phase == "to_pickup" else "at_delivery"
+            driver.wait_ticks = AIDriver.DWELL_TICKS
+            driver.stuck_ticks = 0
+            continue
+
+        # Advance along the path to the tile nearest to the car within the search window
+        current = (int(tiles[i, 0]), int(tiles[i, 1]))
+        window = driver.path[driver.path_index:driver.path_index + AIDriver.SEARCH_WINDOW]
+        nearest = min(range(len(window)), key=lambda k: abs(window[k][0] - current[0]) + abs(window[k][1] - current[1]))
+        driver.path_index += nearest
+
+        # Back up if the car has been blocked for a while
+        if driver.reverse_ticks > 0:
+            if speed[i] > 0:
+                # Stop first, then reverse with the wheels turned the other way
+                controls[i] = BRAKE
+            else:
+                driver.reverse_ticks -= 1
+                controls[i] = REVERSE | driver.reverse_steer
+                if driver.reverse_ticks == 0:
+                    driver.route_to(current, driver.stop_tile)
+        elif not at_stop[i] and last_pos is not None and abs(pos[i, 0] - last_pos[0]) + abs(pos[i, 1] - last_pos[1]) < 0.05:
+            driver.stuck_ticks += 1
+            if driver.stuck_ticks >= AIDriver.STUCK_TICKS:
+                driver.stuck_ticks = 0
+                driver.reverse_ticks = AIDriver.REVERSE_TICKS
+                # Turn the wheels away from the target, and the other way on every next attempt
+                if driver.reverse_steer == STEER_LEFT and not steer_left[i]:
+                    driver.reverse_steer = STEER_RIGHT
+                else:
+                    driver.reverse_steer = STEER_LEFT
+        else:
+            driver.stuck_ticks = 0
+
+    return controls, toggles
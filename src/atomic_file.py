@@ -0,0 +1,49 @@
+import contextlib
+import os
+import stat
+import tempfile
+
+# Read once at import, on the main thread. Changing the umask affects the
+# whole process, so it must not be toggled while other threads create files.
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+def file_mode(path):
+    """Returns the permissions a rewritten file should get: its current ones, or the default for a new file."""
+
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~UMASK
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="wb", prefix=None):
+    """Opens a temporary file next to ``path`` that replaces it when the block ends.
+
+    A reader never sees a half-written file: the data is written to the
+    temporary file, which is then renamed over the target. If the block
+    raises, the temporary file is deleted and the target is left untouched.
+    The new file keeps the permissions of the one it replaces.
+
+    Args:
+        path (str): The file to write.
+        mode (str): Mode to open the temporary file in, ``"wb"`` or ``"w"``.
+        prefix (str, optional): Name prefix of the temporary file.
+
+    Yields:
+        file: The open temporary file.
+    """
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        # mkstemp creates the file readable only by its owner, the rename would keep that
+        os.chmod(temp_path, file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
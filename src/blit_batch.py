@@ -0,0 +1,55 @@
+import pygame
+from itertools import islice
+
+class BlitBatch:
+    """Collects blits and submits them to a surface with a single ``Surface.blits`` call.
+
+    The underlying list is kept between frames and its slots are overwritten,
+    so steady-state rendering does not grow or reallocate it.
+    """
+
+    def __init__(self, capacity=0):
+        """Initializes the batch.
+
+        Args:
+            capacity (int): Number of slots to preallocate.
+        """
+
+        self.items = [None] * capacity
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, surface, pos, area=None):
+        """Queues a blit.
+
+        Args:
+            surface (pygame.Surface): The source surface.
+            pos (tuple): Destination position on the target surface.
+            area (pygame.Rect, optional): Part of the source surface to draw.
+        """
+
+        item = (surface, pos) if area is None else (surface, pos, area)
+        if self.count < len(self.items):
+            self.items[self.count] = item
+        else:
+            self.items.append(item)
+        self.count += 1
+
+    def flush(self, target, renderer=None):
+        """Draws all queued blits onto the target surface and empties the batch.
+
+        Args:
+            target (pygame.Surface): The surface to draw on.
+            renderer (DirtyRectRenderer, optional): If given, the drawn regions
+                are reported to it as changed.
+        """
+
+        if self.count:
+            if renderer is not None and renderer.enabled:
+                for item in islice(self.items, self.count):
+                    width, height = item[2].size if len(item) > 2 else item[0].get_size()
+                    renderer.add(pygame.Rect(item[1][0], item[1][1], width, height))
+            target.blits(islice(self.items, self.count), doreturn=False)
+        self.count = 0
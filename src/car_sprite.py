@@ -1,11 +1,27 @@
 import pygame
 import math
 import os
+from preload import load_image
 
 class CarSprite(pygame.sprite.Sprite):
 
     """The car object."""
 
+    # Driving constants (shared with the vectorized Fleet simulation)
+    MAX_SPEED = 5
+    MAX_REVERSE_SPEED = -2
+    ACCELERATION = 0.1
+    BRAKE_STRENGTH = 0.3
+    FRICTION = 0.5
+    STEERING_SPEED = 0.8
+    MAX_STEERING = 5.0
+    STEERING_RETURN = 0.5
+    MAX_FUEL = 100
+    FUEL_CONSUMPTION = 0.012
+
+    # Corners of the collision box relative to the car's center, before rotation
+    COLLISION_CORNERS = ((20, 45), (-20, 45), (20, -44), (-20, -44))
+
     def __init__(self, x, y, size=(85, 100)):
         """Initialize the car sprite with position and size.
 
@@ -19,7 +35,7 @@ class CarSprite(pygame.sprite.Sprite):
 
         base_path = os.path.dirname(os.path.dirname(__file__))
         self.original_image = pygame.transform.scale(
-            pygame.image.load(os.path.join(base_path, "assets/Car_Ruber.png")).convert_alpha(), size
+            load_image(os.path.join(base_path, "assets/Car_Ruber.png")).convert_alpha(), size
         )
         self.image = self.original_image
         self.rect = self.image.get_rect(center=(x, y))
@@ -32,23 +48,23 @@ class CarSprite(pygame.sprite.Sprite):
         self.angle = 0
         self.speed = 0
 
-        self.max_speed = 5
-        self.max_reverse_speed = -2
-        self.acceleration = 0.1
-        self.brake_strength = 0.3
-        self.friction = 0.5
+        self.max_speed = self.MAX_SPEED
+        self.max_reverse_speed = self.MAX_REVERSE_SPEED
+        self.acceleration = self.ACCELERATION
+        self.brake_strength = self.BRAKE_STRENGTH
+        self.friction = self.FRICTION
 
         self.steering_angle = 0
-        self.steering_speed = 0.8
-        self.max_steering = 5.0
-        self.steering_return = 0.5
+        self.steering_speed = self.STEERING_SPEED
+        self.max_steering = self.MAX_STEERING
+        self.steering_return = self.STEERING_RETURN
 
         self.handbrake_engaged = False
         self.stored_momentum = 0
         self.braking = False
 
-        self.max_fuel = 100
-        self.fuel = 100
+        self.max_fuel = self.MAX_FUEL
+        self.fuel = self.MAX_FUEL
 
         self.collision_points = None
 
@@ -111,10 +127,8 @@ class CarSprite(pygame.sprite.Sprite):
             # Define bounding box collision corners
             new_vector = pygame.Vector2(new_x, new_y)
             collision_points = [
-                new_vector + (pygame.Vector2(20, 45).rotate(-self.angle)),
-                new_vector + (pygame.Vector2(-20, 45).rotate(-self.angle)),
-                new_vector + (pygame.Vector2(20, -44).rotate(-self.angle)),
-                new_vector + (pygame.Vector2(-20, -44).rotate(-self.angle)),
+                new_vector + (pygame.Vector2(corner).rotate(-self.angle))
+                for corner in self.COLLISION_CORNERS
             ]
             self.collision_points = collision_points
 
@@ -133,7 +147,7 @@ class CarSprite(pygame.sprite.Sprite):
 
         # Fuel usage
         if abs(self.speed) > 0.1 and self.fuel > 0:
-            self.fuel -= 0.012
+            self.fuel -= self.FUEL_CONSUMPTION
             self.fuel = max(self.fuel, 0)
 
     def toggle_handbrake(self):
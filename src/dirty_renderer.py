@@ -0,0 +1,59 @@
+import pygame
+
+class DirtyRectRenderer:
+    """Presents frames to the display, optionally updating only the changed regions.
+
+    When enabled, scenes report every screen region they draw with :meth:`add`.
+    On the next frame they only restore the background under
+    :attr:`previous_rects` (instead of redrawing the whole screen), and
+    :meth:`present` pushes the old and new regions with
+    ``pygame.display.update(rects)`` instead of flipping the whole display.
+    A scene calls :meth:`invalidate` whenever the whole screen changes,
+    e.g. when the camera moves or the scene is switched.
+
+    When disabled, every frame is a full redraw followed by ``pygame.display.flip()``.
+    """
+
+    def __init__(self, enabled=False):
+        """Initializes the renderer.
+
+        Args:
+            enabled (bool): Whether dirty-rectangle rendering is used.
+        """
+
+        self.enabled = enabled
+        self.full_redraw = True
+        self.rects = []
+        self.previous_rects = []
+
+    def invalidate(self):
+        """Requests a full redraw of the current frame."""
+
+        self.full_redraw = True
+
+    def needs_full_redraw(self):
+        """Returns True if the scene has to redraw the whole screen this frame."""
+
+        return not self.enabled or self.full_redraw
+
+    def add(self, rect):
+        """Marks a screen region as changed in the current frame.
+
+        Args:
+            rect (pygame.Rect | tuple): The region that was drawn.
+        """
+
+        if self.enabled and rect:
+            self.rects.append(pygame.Rect(rect))
+
+    def present(self):
+        """Shows the current frame and starts tracking the next one."""
+
+        if self.needs_full_redraw():
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.previous_rects + self.rects)
+
+        self.previous_rects = self.rects
+        self.rects = []
+        self.full_redraw = False
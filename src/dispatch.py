@@ -0,0 +1,236 @@
+import heapq
+import random
+from collections import deque
+from job import Job
+
+
+class RideRequest:
+    """A customer waiting at a pickup tile to be driven somewhere."""
+
+    __slots__ = ("id", "pickup_tile_loc", "delivery_tile_loc", "created", "deadline", "state")
+
+    def __init__(self, request_id, pickup_tile_loc, delivery_tile_loc, created, deadline):
+        """Initializes an open request.
+
+        Args:
+            request_id (int): Unique ID of the request.
+            pickup_tile_loc (tuple): The tile location for pickup (x, y).
+            delivery_tile_loc (tuple): The tile location for delivery (x, y).
+            created (float): Time the request was made, in seconds.
+            deadline (float): Time the customer gives up waiting, in seconds.
+        """
+
+        self.id = request_id
+        self.pickup_tile_loc = pickup_tile_loc
+        self.delivery_tile_loc = delivery_tile_loc
+        self.created = created
+        self.deadline = deadline
+        self.state = "open"  # "open", "assigned" or "expired"
+
+    def to_job(self, is_timed=False, time_limit=None):
+        """Creates the Job that serves this request."""
+
+        return Job(self.pickup_tile_loc, self.delivery_tile_loc, is_timed=is_timed, time_limit=time_limit)
+
+
+class DispatchEngine:
+    """Generates ride requests and assigns them to taxis.
+
+    Requests arrive at every pickup tile as an independent Poisson process.
+    With the same rate everywhere this is one Poisson process with
+    ``rate * len(pickup_tiles)`` arrivals per second, each at a random tile,
+    so only the time of the next arrival has to be drawn.
+
+    Open requests are kept in a heap keyed by deadline, for expiring them, and in
+    a FIFO queue per pickup tile, for matching. Assigned and expired requests are
+    not searched for and removed from these, they are skipped when they come
+    up (lazy deletion). So each tick costs only the arrivals and expiries of that
+    tick, no matter how many requests are open.
+
+    Taxis are matched in batches: a cost matrix of road distances from every
+    available taxi to every pickup tile with waiting customers is built from the
+    cached distance fields of the :class:`RoadNetwork`, and the cheapest pairs
+    are assigned greedily.
+
+    The road distance of a trip, used for its fare, is looked up in the
+    precomputed pickup distances when they are known (see
+    :attr:`MapIndex.pickup_distances`), otherwise it is measured on the road
+    network.
+    """
+
+    REQUEST_RATE = 0.02  # Requests per second at each pickup tile
+    PATIENCE = 90  # Seconds a customer waits before giving up
+    MAX_OPEN = 5000  # Arrivals are dropped while this many requests are open
+
+    def __init__(self, road_network, pickup_tiles, rate=REQUEST_RATE, patience=PATIENCE, now=0.0,
+                 on_request=None, on_expire=None, trip_distances=None):
+        """Initializes the engine. The first request arrives at ``now``.
+
+        Args:
+            road_network (RoadNetwork): Road graph used for the road distances.
+            pickup_tiles (list[tuple[int, int]]): Tiles where customers are picked up and dropped off.
+            rate (float): Requests per second at each pickup tile.
+            patience (float): Seconds a customer waits for a taxi.
+            now (float): The current time in seconds.
+            on_request (callable, optional): Called with each new RideRequest.
+            on_expire (callable, optional): Called with each RideRequest whose customer gave up.
+            trip_distances (dict, optional): Precomputed road distances in tiles, {(pickup, delivery): tiles}.
+        """
+
+        self.road_network = road_network
+        self.pickup_tiles = list(pickup_tiles)
+        self.rate = rate
+        self.patience = patience
+        self.on_request = on_request
+        self.on_expire = on_expire
+        self.trip_distances = trip_distances
+
+        self.open = {}  # request ID -> RideRequest
+        self._deadlines = []  # heap of (deadline, request ID)
+        self._waiting = {tile: deque() for tile in self.pickup_tiles}
+        self._waiting_count = dict.fromkeys(self.pickup_tiles, 0)
+        self._next_id = 0
+        self._next_arrival = now
+
+    def __len__(self):
+        return len(self.open)
+
+    def update(self, now):
+        """Expires the requests whose deadline has passed and generates new arrivals.
+
+        Args:
+            now (float): The current time in seconds.
+        """
+
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            _, request_id = heapq.heappop(deadlines)
+            request = self.open.pop(request_id, None)
+            if request is not None:
+                request.state = "expired"
+                self._waiting_count[request.pickup_tile_loc] -= 1
+                if self.on_expire is not None:
+                    self.on_expire(request)
+
+        if len(self.pickup_tiles) < 2:
+            return
+        total_rate = self.rate * len(self.pickup_tiles)
+        while self._next_arrival <= now:
+            if len(self.open) < self.MAX_OPEN:
+                self._add_request(self._next_arrival)
+            self._next_arrival += random.expovariate(total_rate)
+
+    def _add_request(self, created):
+        """Creates a request at a random pickup tile."""
+
+        pickup, delivery = random.sample(self.pickup_tiles, 2)
+        request = RideRequest(self._next_id, pickup, delivery, created, created + self.patience)
+        self._next_id += 1
+        self.open[request.id] = request
+        heapq.heappush(self._deadlines, (request.deadline, request.id))
+        self._waiting[pickup].append(request)
+        self._waiting_count[pickup] += 1
+        if self.on_request is not None:
+            self.on_request(request)
+
+    def add_pickup_tile(self, tile):
+        """Starts generating requests at a new pickup tile.
+
+        Args:
+            tile (tuple[int, int]): The tile (x, y).
+        """
+
+        if tile in self._waiting:
+            return
+        self.pickup_tiles.append(tile)
+        self._waiting[tile] = deque()
+        self._waiting_count[tile] = 0
+
+    def remove_pickup_tile(self, tile):
+        """Stops generating requests at a pickup tile, its waiting customers give up.
+
+        Requests already heading to the tile are not affected.
+
+        Args:
+            tile (tuple[int, int]): The tile (x, y).
+        """
+
+        queue = self._waiting.pop(tile, None)
+        if queue is None:
+            return
+        self.pickup_tiles.remove(tile)
+        del self._waiting_count[tile]
+        for request in queue:
+            if request.state == "open":
+                request.state = "expired"
+                del self.open[request.id]
+                if self.on_expire is not None:
+                    self.on_expire(request)
+
+    def waiting_at(self, tile):
+        """Returns the number of open requests at a pickup tile."""
+
+        return self._waiting_count.get(tile, 0)
+
+    def trip_distance(self, request):
+        """Returns the road distance in tiles from a request's pickup to its delivery, or -1 if unreachable."""
+
+        if self.trip_distances is not None:
+            distance = self.trip_distances.get((request.pickup_tile_loc, request.delivery_tile_loc))
+            if distance is not None:
+                return distance
+        return self.road_network.distance(request.pickup_tile_loc, request.delivery_tile_loc)
+
+    def _take(self, tile):
+        """Removes and returns the open request at a tile with the earliest deadline."""
+
+        queue = self._waiting[tile]
+        while True:
+            request = queue.popleft()
+            if request.state == "open":
+                break
+        request.state = "assigned"
+        del self.open[request.id]
+        self._waiting_count[tile] -= 1
+        return request
+
+    def match(self, taxis):
+        """Assigns open requests to available taxis, nearest pairs first.
+
+        Args:
+            taxis (list[tuple]): (key, tile) of each available taxi, the key
+                identifies the taxi to the caller.
+
+        Returns:
+            list[tuple]: (key, RideRequest) for each taxi that got a request.
+        """
+
+        tiles = [tile for tile, count in self._waiting_count.items() if count > 0]
+        if not tiles or not taxis:
+            return []
+
+        # Cost matrix as a flat list of (road distance, taxi, tile) entries
+        costs = []
+        for tile_index, tile in enumerate(tiles):
+            field = self.road_network.distance_field(tile)
+            for taxi_index, (_, (x, y)) in enumerate(taxis):
+                distance = field[y, x] if 0 <= y < field.shape[0] and 0 <= x < field.shape[1] else -1
+                if distance < 0:
+                    # Off the road network, fall back to the straight distance
+                    distance = self.road_network.distance((x, y), tile)
+                    if distance < 0:
+                        distance = 2 * (abs(x - tile[0]) + abs(y - tile[1]))
+                costs.append((int(distance), taxi_index, tile_index))
+        costs.sort()
+
+        matches = []
+        assigned = [False] * len(taxis)
+        for _, taxi_index, tile_index in costs:
+            tile = tiles[tile_index]
+            if assigned[taxi_index] or self._waiting_count[tile] == 0:
+                continue
+            assigned[taxi_index] = True
+            matches.append((taxis[taxi_index][0], self._take(tile)))
+            if len(matches) == len(taxis):
+                break
+        return matches
@@ -0,0 +1,127 @@
+class FloatingText:
+    """One floating text effect, reused by :class:`FloatingTextPool`."""
+
+    __slots__ = ("surface", "x", "y", "alpha", "lifetime")
+
+    def __init__(self):
+        self.surface = None
+        self.x = 0.0
+        self.y = 0.0
+        self.alpha = 0.0
+        self.lifetime = 0.0
+
+
+class FloatingTextPool:
+    """Texts such as "+$12" that float up from a world position and fade out.
+
+    All effect objects are allocated up front and reused, so spawning and
+    expiring effects does not create garbage. Expired effects are removed
+    from the active list by moving the last one into their slot, so removal
+    is O(1) and the order of drawing does not matter. Text surfaces are
+    rendered once per text and color and shared by all effects showing them.
+
+    Movement and fading are in units per second, so they do not depend on
+    the frame rate.
+    """
+
+    RISE_SPEED = 30  # World pixels per second
+    FADE_SPEED = 300  # Alpha per second
+    MAX_CACHED_TEXTS = 256
+
+    def __init__(self, font, capacity=512):
+        """Initializes the pool.
+
+        Args:
+            font (pygame.font.Font): Font the texts are rendered with.
+            capacity (int): Maximum number of simultaneous effects, new
+                effects are dropped while the pool is full.
+        """
+
+        self.font = font
+        self.active = []
+        self._free = [FloatingText() for _ in range(capacity)]
+        self._surfaces = {}  # (text, color) -> rendered surface
+
+    def __len__(self):
+        return len(self.active)
+
+    def _render(self, text, color):
+        """Returns the surface of a text, rendering it only the first time."""
+
+        key = (text, color)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            if len(self._surfaces) >= self.MAX_CACHED_TEXTS:
+                self._surfaces.clear()
+            surface = self.font.render(text, True, color)
+            self._surfaces[key] = surface
+        return surface
+
+    def spawn(self, text, color, x, y, alpha=255, lifetime=1.0):
+        """Starts a floating text effect.
+
+        Args:
+            text (str): The text to show.
+            color (tuple[int, int, int]): Text color.
+            x (float): World x position of the top left corner of the text.
+            y (float): World y position of the top left corner of the text.
+            alpha (int): Starting opacity (0-255).
+            lifetime (float): Maximum lifetime in seconds.
+
+        Returns:
+            bool: False if the pool was full and the effect was dropped.
+        """
+
+        if not self._free:
+            return False
+        effect = self._free.pop()
+        effect.surface = self._render(text, color)
+        effect.x = x
+        effect.y = y
+        effect.alpha = alpha
+        effect.lifetime = lifetime
+        self.active.append(effect)
+        return True
+
+    def update(self, dt):
+        """Moves and fades the effects and removes the finished ones.
+
+        Args:
+            dt (float): Seconds since the last update.
+        """
+
+        active = self.active
+        rise = self.RISE_SPEED * dt
+        fade = self.FADE_SPEED * dt
+        i = len(active) - 1
+        while i >= 0:
+            effect = active[i]
+            effect.y -= rise
+            effect.lifetime -= dt
+            effect.alpha -= fade
+            if effect.lifetime <= 0 or effect.alpha <= 0:
+                # Swap-remove: the last effect takes this slot
+                last = active.pop()
+                if last is not effect:
+                    active[i] = last
+                effect.surface = None
+                self._free.append(effect)
+            i -= 1
+
+    def draw(self, screen, camera_x, camera_y, renderer=None):
+        """Draws the effects.
+
+        Args:
+            screen (pygame.Surface): The target surface.
+            camera_x (float): The camera's x position.
+            camera_y (float): The camera's y position.
+            renderer (DirtyRectRenderer, optional): Renderer the drawn regions are reported to.
+        """
+
+        for effect in self.active:
+            surface = effect.surface
+            # Shared surfaces get the alpha of each effect right before its blit
+            surface.set_alpha(int(effect.alpha))
+            rect = screen.blit(surface, (effect.x - camera_x, effect.y - camera_y))
+            if renderer is not None:
+                renderer.add(rect)
@@ -1,49 +1,104 @@
+import os
 import pygame
+from preload import load_image
 
 class Passenger(pygame.sprite.Sprite):
-    """Represents a passenger sprite with animations."""
+    """Represents a passenger sprite with animations.
 
-    def __init__(self, x, y, sprite_sheet):
+    The animation frames are sliced from the sprite sheet and scaled only once
+    per sheet file and scale (see :meth:`get_frames`) and shared by all
+    passengers, so creating a passenger does not process or allocate any images.
+    """
+
+    BACKGROUND_COLOR = (77, 253, 252)
+    SHEET_AREA = (16, 16, 96, 96)  # Part of RPG_assets.png with the characters
+    SPRITE_SIZE = 16
+    CHARACTERS = 4  # 2x2 blocks of 3x3 sprites
+    DIRECTIONS = ("down", "right", "up")  # Sheet column of each direction within a block, frames are in rows
+    FRAME_COUNT = 3
+
+    _frame_cache = {}  # (sprite sheet path, scale) -> {(character, direction): frames}
+
+    def __init__(self, x, y, sprite_sheet_path, character=0, direction="down", scale=2):
         """Initializes the Passenger sprite with a position and a sprite sheet.
-        
+
         Args:
             x: The x-coordinate where the passenger should appear.
             y: The y-coordinate where the passenger should appear.
-            sprite_sheet: The sprite sheet containing passenger animations.
+            sprite_sheet_path (str): Path to the sprite sheet containing passenger animations.
+            character (int): Which of the characters on the sheet is shown.
+            direction (str): Walking direction, "down", "right", "up" or "left".
+            scale (int): Scale of the sprites.
         """
 
         super().__init__()
-        self.sprite_sheet = sprite_sheet  # <- make sure this is passed and stored
-        self.sprite_sheet = self.sprite_sheet.subsurface(pygame.Rect(16, 16, 96, 96))  # Ensure the sprite sheet is loaded correctly
-        self.background_color = (77, 253, 252)
-        self.sprite_sheet.set_colorkey(self.background_color)
-        self.frames = []
-        self.load_frames()
+        self.frames = self.get_frames(sprite_sheet_path, scale)[(character, direction)]
         self.current_frame = 0
         self.image = self.frames[self.current_frame]
         self.rect = self.image.get_rect(center=(x, y))
         self.animation_timer = 0
         self.animation_speed = 150  # milliseconds
 
-    def load_frames(self):
-        """Loads the frames for the passenger sprite from the sprite sheet."""
+    @classmethod
+    def get_frames(cls, sprite_sheet_path, scale=2):
+        """Returns the animation frames of all characters on a sprite sheet.
+
+        The sheet is loaded, sliced and scaled on the first call for a sheet
+        file and scale, later calls (e.g. from the next game) return the
+        cached frames.
+
+        Args:
+            sprite_sheet_path (str): Path to the sprite sheet containing passenger animations.
+            scale (int): Scale of the sprites.
+
+        Returns:
+            dict: Tuple of frames for each (character, direction).
+        """
+
+        key = (os.path.normcase(os.path.abspath(sprite_sheet_path)), scale)
+        frames = cls._frame_cache.get(key)
+        if frames is not None:
+            return frames
+
+        sprite_sheet = load_image(sprite_sheet_path).convert_alpha()
+        area = sprite_sheet.subsurface(pygame.Rect(cls.SHEET_AREA))
+        size = cls.SPRITE_SIZE
+        scaled_size = (size * scale, size * scale)
+        block = size * len(cls.DIRECTIONS)
+        blocks_per_row = area.get_width() // block
 
-        sprite_width, sprite_height = 16, 16
-        for i in range(3):  # Walking down
-            frame = self.sprite_sheet.subsurface(pygame.Rect(0, i * sprite_height, sprite_width, sprite_height))
-            frame = pygame.transform.scale(frame, (32, 32))
-            frame.set_colorkey(self.background_color)
-            self.frames.append(frame)
+        frames = {}
+        for character in range(cls.CHARACTERS):
+            block_x = character % blocks_per_row * block
+            block_y = character // blocks_per_row * block
+            for column, direction in enumerate(cls.DIRECTIONS):
+                animation = []
+                for i in range(cls.FRAME_COUNT):
+                    frame = area.subsurface(pygame.Rect(block_x + column * size, block_y + i * size, size, size))
+                    frame = pygame.transform.scale(frame, scaled_size)
+                    frame.set_colorkey(cls.BACKGROUND_COLOR)
+                    animation.append(frame)
+                frames[(character, direction)] = tuple(animation)
+            # Walking left is walking right mirrored (flipping drops the colorkey)
+            animation = []
+            for frame in frames[(character, "right")]:
+                frame = pygame.transform.flip(frame, True, False)
+                frame.set_colorkey(cls.BACKGROUND_COLOR)
+                animation.append(frame)
+            frames[(character, "left")] = tuple(animation)
+
+        cls._frame_cache[key] = frames
+        return frames
 
     def update(self, dt):
         """Updates the passenger sprite's animation based on the time delta.
-        
+
         Args:
             dt: The time delta since the last update.
         """
-        
+
         self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
             self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.image = self.frames[self.current_frame]
\ No newline at end of file
+            self.image = self.frames[self.current_frame]
@@ -1,65 +1,179 @@
-import pygame
+import numpy as np
 from entities.passenger import Passenger
 
 class PassengerManager:
-    """Manages the passenger sprite and its animations."""
+    """Manages the passengers waiting at the pickup tiles.
 
-    def __init__(self, sprite_sheet):
+    The passengers are not sprites. Their state is kept in arrays (only the
+    first :attr:`count` entries are in use) and removed passengers are replaced
+    by the last one, like in :class:`Fleet`. All passengers are animated by
+    one shared clock, each with its own frame offset, so updating them costs
+    the same no matter how many there are. Drawing culls them to the camera
+    view and submits the visible ones as a single blit sequence.
+
+    Passengers are identified by a key chosen by the caller, e.g. the ID of
+    the ride request they belong to.
+    """
+
+    ANIMATION_SPEED = 150  # Milliseconds per animation frame
+    CHARACTERS = 3  # The first characters on the sheet are people
+    # Offsets of the passengers waiting at the same tile, the first one stands at the tile corner
+    CROWD_OFFSETS = ((0, 0), (14, 6), (-12, 10), (6, -12), (-8, -6), (20, -4), (-18, -2), (10, 16), (-4, 18))
+
+    def __init__(self, sprite_sheet_path, capacity=64, scale=2):
         """Initializes the PassengerManager with a sprite sheet.
-        
+
         Args:
-            sprite_sheet: The sprite sheet containing passenger animations.
+            sprite_sheet_path (str): Path to the sprite sheet containing passenger animations.
+            capacity (int): Number of passengers to preallocate room for.
+            scale (int): Scale of the passenger sprites.
         """
 
-        self.sprite_sheet = sprite_sheet
-        self.group = pygame.sprite.Group()
-        self.sprite = None
-        self.visible = False
-        self.animating = False
+        frames = Passenger.get_frames(sprite_sheet_path, scale)
+        self.animations = [frames[(character, "down")] for character in range(self.CHARACTERS)]
+        self.frame_count = len(self.animations[0])
+        self.half_size = self.animations[0][0].get_width() // 2
+
+        self.count = 0
+        self.pos = np.zeros((capacity, 2))
+        self.character = np.zeros(capacity, dtype=np.int64)
+        self.phase = np.zeros(capacity, dtype=np.int64)
+        self.keys = [None] * capacity
+        self.index = {}  # key -> index
+        self.clock = 0  # Shared animation clock in milliseconds
+        self._crowd = {}  # (x, y) -> set of crowd slots taken there
+        self._slots = {}  # key -> ((x, y), crowd slot) of each passenger
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def _grow(self):
+        """Doubles the capacity of all state arrays."""
+
+        capacity = max(1, len(self.character) * 2)
+        for name in ("pos", "character", "phase"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.keys.extend([None] * (capacity - len(self.keys)))
+
+    def add(self, key, x, y):
+        """Adds a waiting passenger.
+
+        Passengers added at the same point stand next to each other, each
+        taking the first crowd slot not used by a passenger still waiting there.
 
-    def start_entry_animation(self, x, y):
-        """Starts the entry animation for a passenger at the given coordinates.
-        
         Args:
+            key: Key identifying the passenger.
             x: The x-coordinate where the passenger should appear.
             y: The y-coordinate where the passenger should appear.
         """
 
-        self.sprite = Passenger(x, y, self.sprite_sheet)
-        self.group.add(self.sprite)
-        self.visible = True
-        self.animating = True
+        if key in self.index:
+            return
+        if self.count == len(self.character):
+            self._grow()
+
+        taken = self._crowd.setdefault((x, y), set())
+        placed = 0
+        while placed in taken:
+            placed += 1
+        taken.add(placed)
+        self._slots[key] = ((x, y), placed)
+        offset_x, offset_y = self.CROWD_OFFSETS[placed % len(self.CROWD_OFFSETS)]
 
-    def remove_passenger(self):
-        """Removes the passenger sprite from the group and stops its animation."""
-        
-        if self.sprite:
-            self.sprite.kill()
-            self.sprite = None
-        self.visible = False
-        self.animating = False
+        i = self.count
+        self.pos[i] = (x + offset_x, y + offset_y)
+        self.character[i] = placed % self.CHARACTERS
+        self.phase[i] = placed % self.frame_count
+        self.keys[i] = key
+        self.index[key] = i
+        self.count += 1
+
+    def remove(self, key):
+        """Removes a passenger, if it exists, by moving the last one into its slot.
+
+        Args:
+            key: Key of the passenger.
+        """
+
+        index = self.index.pop(key, None)
+        if index is None:
+            return
+
+        # Free the crowd slot, so the next passenger at the tile can stand there
+        point, slot = self._slots.pop(key)
+        taken = self._crowd[point]
+        taken.discard(slot)
+        if not taken:
+            del self._crowd[point]
+
+        last = self.count - 1
+        if index != last:
+            for array in (self.pos, self.character, self.phase):
+                array[index] = array[last]
+            moved = self.keys[last]
+            self.keys[index] = moved
+            self.index[moved] = index
+        self.keys[last] = None
+        self.count = last
+
+    def clear(self):
+        """Removes all passengers."""
+
+        self.keys[:self.count] = [None] * self.count
+        self.index.clear()
+        self._crowd.clear()
+        self._slots.clear()
+        self.count = 0
 
     def update(self, dt):
-        """Updates the passenger sprite and its animations.
+        """Advances the shared animation clock.
 
         Args:
-            dt: The time delta since the last update.
+            dt: The time delta since the last update, in milliseconds.
         """
 
-        self.group.update(dt)
+        self.clock += dt
 
-    def draw(self, screen, camera_x, camera_y):
-        """Draws the passenger sprite on the screen.
+    def draw(self, screen, camera_x, camera_y, batch=None):
+        """Draws the passengers inside the camera view, the ones further down on top.
 
         Args:
             screen: The screen surface to draw on.
             camera_x: The x-coordinate of the camera.
             camera_y: The y-coordinate of the camera.
+            batch (BlitBatch, optional): If given, the blits are queued in the batch
+                instead of being drawn immediately.
         """
-        
-        if self.sprite:
-            screen.blit(
-                self.sprite.image,
-                (self.sprite.rect.x - camera_x, self.sprite.rect.y - camera_y)
-        )
 
+        if self.count == 0:
+            return
+
+        half = self.half_size
+        width, height = screen.get_size()
+        x = self.pos[:self.count, 0] - camera_x - half
+        y = self.pos[:self.count, 1] - camera_y - half
+        visible = np.flatnonzero((x > -2 * half) & (x < width) & (y > -2 * half) & (y < height))
+        if len(visible) == 0:
+            return
+        visible = visible[np.argsort(y[visible], kind="stable")]
+
+        step = int(self.clock // self.ANIMATION_SPEED)
+        frames = (step + self.phase[visible]) % self.frame_count
+        animations = self.animations
+        blits = [
+            (animations[character][frame], (px, py))
+            for character, frame, px, py in zip(
+                self.character[visible].tolist(), frames.tolist(), x[visible].tolist(), y[visible].tolist()
+            )
+        ]
+        if batch is not None:
+            for surface, pos in blits:
+                batch.add(surface, pos)
+        else:
+            screen.blits(blits, doreturn=False)
@@ -0,0 +1,52 @@
+# Game events, published on Game.events
+TILE_CATEGORY_CHANGED = "tile_category_changed"  # category, previous: "pump", "food", "service", "pickup" or None
+HANDBRAKE_CHANGED = "handbrake_changed"  # engaged
+FUEL_LOW_CHANGED = "fuel_low_changed"  # low: fuel went below (True) or back above (False) the threshold
+JOB_STATE_CHANGED = "job_state_changed"  # state, previous: "pickup", "dropoff" or None
+MONEY_CHANGED = "money_changed"  # money, previous
+MAP_CHANGED = "map_changed"  # change: MapChange of the edited tiles
+
+
+class EventBus:
+    """A lightweight synchronous publish/subscribe event bus.
+
+    Instead of polling game state every frame, code publishes an event when
+    something changes and the subscribers of that event are called right away,
+    in the order they subscribed.
+    """
+
+    def __init__(self):
+        """Initializes a bus without subscribers."""
+
+        self._subscribers = {}
+
+    def subscribe(self, event_type, callback):
+        """Calls callback(**data) whenever an event of the given type is published.
+
+        Args:
+            event_type (str): The event type, e.g. :data:`MONEY_CHANGED`.
+            callback (callable): Function taking the event data as keyword arguments.
+        """
+
+        self._subscribers.setdefault(event_type, []).append(callback)
+
+    def unsubscribe(self, event_type, callback):
+        """Removes a callback added by :meth:`subscribe`."""
+
+        callbacks = self._subscribers.get(event_type)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def publish(self, event_type, **data):
+        """Calls all subscribers of the event type with the event data.
+
+        Args:
+            event_type (str): The event type.
+            **data: Event data passed to the subscribers.
+        """
+
+        callbacks = self._subscribers.get(event_type)
+        if callbacks:
+            # A copy, so subscribers may unsubscribe while being called
+            for callback in tuple(callbacks):
+                callback(**data)
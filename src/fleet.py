@@ -0,0 +1,306 @@
+import numpy as np
+import pygame
+from car_sprite import CarSprite
+
+# Control flags, combined into one uint8 per car (the batched equivalent of pressed keys)
+STEER_LEFT = 1   # A
+STEER_RIGHT = 2  # D
+THROTTLE = 4     # W
+REVERSE = 8      # S
+BRAKE = 16       # X
+
+
+def controls_from_keys(keys):
+    """Converts a pressed-keys sequence (as used by ``CarSprite.update``) into control flags.
+
+    Args:
+        keys: Key state indexable by pygame key constants.
+
+    Returns:
+        int: The combined control flags.
+    """
+
+    controls = 0
+    if keys[pygame.K_a]:
+        controls |= STEER_LEFT
+    if keys[pygame.K_d]:
+        controls |= STEER_RIGHT
+    if keys[pygame.K_w]:
+        controls |= THROTTLE
+    if keys[pygame.K_s]:
+        controls |= REVERSE
+    if keys[pygame.K_x]:
+        controls |= BRAKE
+    return controls
+
+
+def build_walkable_mask(tile_map, walkable_tiles):
+    """Builds a boolean [row, column] array telling which tiles can be driven on.
+
+    Args:
+        tile_map (list[list[int]]): The tile map.
+        walkable_tiles (list[int]): IDs of walkable tiles.
+
+    Returns:
+        numpy.ndarray: The walkability mask.
+    """
+
+    return np.isin(np.asarray(tile_map), walkable_tiles)
+
+
+class Fleet:
+    """Simulates many cars at once with vectorized NumPy math.
+
+    Car state is stored as a struct of arrays (position, angle, speed, steering,
+    fuel, max speed, handbrake). :meth:`step` advances all cars, or a subset,
+    in one go. It uses the same driving constants and four-corner collision
+    box as :class:`CarSprite`, tested against a walkability mask.
+    ``CarSprite`` is still used to render the cars that are visible.
+
+    Only the first :attr:`count` entries of each array are in use.
+    """
+
+    def __init__(self, walkable_mask, tile_size, capacity=64):
+        """Initializes an empty fleet.
+
+        Args:
+            walkable_mask (numpy.ndarray): Boolean [row, column] walkability of the map tiles.
+            tile_size (int): Size of one tile in world pixels.
+            capacity (int): Number of cars to preallocate room for.
+        """
+
+        self.walkable_mask = walkable_mask
+        self.tile_size = tile_size
+        self.count = 0
+
+        self.pos = np.zeros((capacity, 2))
+        self.angle = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.steering = np.zeros(capacity)
+        self.fuel = np.zeros(capacity)
+        self.max_speed = np.zeros(capacity)
+        self.handbrake = np.zeros(capacity, dtype=bool)
+        self.stored_momentum = np.zeros(capacity)
+
+        self.corners = np.array(CarSprite.COLLISION_CORNERS, dtype=float)
+
+    def _grow(self):
+        """Doubles the capacity of all state arrays."""
+
+        capacity = max(1, len(self.angle) * 2)
+        for name in ("pos", "angle", "speed", "steering", "fuel", "max_speed", "handbrake", "stored_momentum"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, x, y, angle=0, max_speed=CarSprite.MAX_SPEED, fuel=CarSprite.MAX_FUEL):
+        """Adds a car to the fleet.
+
+        Args:
+            x (float): X position in world space.
+            y (float): Y position in world space.
+            angle (float): Heading in degrees (0 = up, like CarSprite).
+            max_speed (float): Maximum forward speed.
+            fuel (float): Initial fuel.
+
+        Returns:
+            int: Index of the new car.
+        """
+
+        if self.count == len(self.angle):
+            self._grow()
+        i = self.count
+        self.pos[i] = (x, y)
+        self.angle[i] = angle
+        self.speed[i] = 0
+        self.steering[i] = 0
+        self.fuel[i] = fuel
+        self.max_speed[i] = max_speed
+        self.handbrake[i] = False
+        self.stored_momentum[i] = 0
+        self.count += 1
+        return i
+
+    def remove(self, index):
+        """Removes a car by moving the last car into its slot.
+
+        Args:
+            index (int): Index of the car to remove.
+
+        Returns:
+            int: The previous index of the car that now occupies ``index``
+            (equal to ``index`` if the removed car was the last one).
+        """
+
+        last = self.count - 1
+        if index != last:
+            for name in ("pos", "angle", "speed", "steering", "fuel", "max_speed", "handbrake", "stored_momentum"):
+                array = getattr(self, name)
+                array[index] = array[last]
+        self.count = last
+        return last
+
+    def collision_points(self, pos, angle):
+        """Returns the four rotated collision corners of each car.
+
+        Args:
+            pos (numpy.ndarray): (N, 2) car centers.
+            angle (numpy.ndarray): (N,) headings in degrees.
+
+        Returns:
+            numpy.ndarray: (N, 4, 2) world positions of the corners.
+        """
+
+        rad = np.radians(angle)
+        cos = np.cos(rad)[:, None]
+        sin = np.sin(rad)[:, None]
+        # Same as pygame.Vector2(corner).rotate(-angle)
+        cx = self.corners[:, 0]
+        cy = self.corners[:, 1]
+        xs = pos[:, 0, None] + cx * cos + cy * sin
+        ys = pos[:, 1, None] - cx * sin + cy * cos
+        return np.stack((xs, ys), axis=-1)
+
+    def is_walkable(self, xs, ys):
+        """Vectorized version of ``Game.is_walkable``.
+
+        Args:
+            xs (numpy.ndarray): X coordinates in world space.
+            ys (numpy.ndarray): Y coordinates in world space.
+
+        Returns:
+            numpy.ndarray: Boolean array, True where the point lies on a walkable tile.
+        """
+
+        tile_x = np.trunc(xs).astype(np.int64) // self.tile_size
+        tile_y = np.trunc(ys).astype(np.int64) // self.tile_size
+        rows, cols = self.walkable_mask.shape
+        inside = (tile_x >= 0) & (tile_x < cols) & (tile_y >= 0) & (tile_y < rows)
+        result = np.zeros(tile_x.shape, dtype=bool)
+        result[inside] = self.walkable_mask[tile_y[inside], tile_x[inside]]
+        return result
+
+    def step(self, controls, indices=None, scale=1.0):
+        """Advances cars by one tick, exactly like ``CarSprite.update`` does for one car.
+
+        Args:
+            controls (numpy.ndarray): uint8 control flags per stepped car.
+            indices (numpy.ndarray, optional): Indices of the cars to step. Defaults to all cars.
+            scale (float): Number of ticks the movement covers. Values above 1
+                let distant cars be stepped less often with the same average speed.
+        """
+
+        if indices is None:
+            indices = slice(0, self.count)
+
+        controls = np.asarray(controls)
+        speed = self.speed[indices]
+        steering = self.steering[indices]
+        angle = self.angle[indices]
+        fuel = self.fuel[indices]
+        max_speed = self.max_speed[indices]
+        pos = self.pos[indices]
+
+        # Steering
+        left = (controls & STEER_LEFT) != 0
+        right = (controls & STEER_RIGHT) != 0
+        returned = np.where(
+            steering > 0,
+            np.maximum(steering - CarSprite.STEERING_RETURN, 0),
+            np.minimum(steering + CarSprite.STEERING_RETURN, 0)
+        )
+        steering = np.where(
+            left, np.minimum(steering + CarSprite.STEERING_SPEED, CarSprite.MAX_STEERING),
+            np.where(right, np.maximum(steering - CarSprite.STEERING_SPEED, -CarSprite.MAX_STEERING), returned)
+        )
+
+        # Movement + fuel logic
+        has_fuel = fuel > 0
+        braked = np.where(
+            speed > 0,
+            np.maximum(speed - CarSprite.BRAKE_STRENGTH, 0),
+            np.minimum(speed + CarSprite.BRAKE_STRENGTH, 0)
+        )
+        coasted = np.where(
+            speed > 0,
+            np.maximum(speed - CarSprite.FRICTION, 0),
+            np.minimum(speed + CarSprite.FRICTION, 0)
+        )
+        new_speed = np.select(
+            [
+                (controls & BRAKE) != 0,
+                ((controls & THROTTLE) != 0) & has_fuel,
+                ((controls & REVERSE) != 0) & has_fuel,
+            ],
+            [
+                braked,
+                np.minimum(speed + CarSprite.ACCELERATION, max_speed),
+                np.maximum(speed - CarSprite.ACCELERATION, CarSprite.MAX_REVERSE_SPEED),
+            ],
+            coasted
+        )
+        speed = np.where(self.handbrake[indices], speed, new_speed)
+
+        # Move and rotate
+        moving = speed != 0
+        angle = np.where(moving, angle + steering * (speed / max_speed) * 0.5 * scale, angle)
+        rad = np.radians(angle)
+        new_pos = np.empty_like(pos)
+        new_pos[:, 0] = pos[:, 0] - np.sin(rad) * speed * scale
+        new_pos[:, 1] = pos[:, 1] - np.cos(rad) * speed * scale
+
+        corners = self.collision_points(new_pos, angle)
+        free = self.is_walkable(corners[..., 0], corners[..., 1]).all(axis=1)
+        pos = np.where((moving & free)[:, None], new_pos, pos)
+
+        # Fuel usage
+        burning = (np.abs(speed) > 0.1) & has_fuel
+        fuel = np.where(burning, np.maximum(fuel - CarSprite.FUEL_CONSUMPTION * scale, 0), fuel)
+
+        self.speed[indices] = speed
+        self.steering[indices] = steering
+        self.angle[indices] = angle
+        self.pos[indices] = pos
+        self.fuel[indices] = fuel
+
+    def toggle_handbrake(self, indices):
+        """Toggles the handbrake of the given cars, like ``CarSprite.toggle_handbrake``.
+
+        Args:
+            indices (numpy.ndarray): Indices of the cars.
+        """
+
+        indices = np.asarray(indices)
+        engaged = self.handbrake[indices]
+
+        engage = indices[~engaged]
+        self.stored_momentum[engage] = np.abs(self.speed[engage])
+        self.speed[engage] = 0
+        self.handbrake[engage] = True
+
+        release = indices[engaged]
+        direction = np.where(self.angle[release] % 360 < 180, 1, -1)
+        self.speed[release] = np.minimum(self.stored_momentum[release] + 1.5, self.max_speed[release]) * direction
+        self.handbrake[release] = False
+        self.stored_momentum[release] = 0
+
+    def sync_sprite(self, sprite, index, camera_x, camera_y):
+        """Copies a car's state into a CarSprite so it can be rendered.
+
+        Args:
+            sprite (CarSprite): The sprite used to draw the car.
+            index (int): Index of the car in the fleet.
+            camera_x (float): The camera's x position.
+            camera_y (float): The camera's y position.
+        """
+
+        sprite.pos.update(self.pos[index])
+        sprite.angle = float(self.angle[index])
+        sprite.speed = float(self.speed[index])
+        sprite.steering_angle = float(self.steering[index])
+        sprite.fuel = float(self.fuel[index])
+        sprite.max_speed = float(self.max_speed[index])
+        sprite.handbrake_engaged = bool(self.handbrake[index])
+        sprite.image = pygame.transform.rotate(sprite.original_image, sprite.angle)
+        sprite.rect = sprite.image.get_rect(center=(sprite.pos - pygame.Vector2(camera_x, camera_y)))
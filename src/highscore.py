@@ -0,0 +1,194 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+
+class HighScoreStore:
+    """Keeps the high score in memory and persists it, together with per-session stats, in SQLite.
+
+    The database is read only once, when the store is created. Scenes read
+    :attr:`value` directly and subscribe to be notified when it changes,
+    so nothing has to poll the disk.
+
+    Writes never happen on the render thread. They are queued to a background
+    worker, which commits everything queued so far in one transaction. So a burst
+    of writes is coalesced into a single atomic commit, and a crash can never
+    leave a half-written score behind.
+    """
+
+    def __init__(self, path, legacy_path=None):
+        """Initializes the store, loads the saved high score and starts the writer thread.
+
+        Args:
+            path (str): Path to the SQLite database file.
+            legacy_path (str, optional): Path to the old ``highscore.txt``. Its value
+                is imported when the database is created for the first time.
+        """
+
+        self.path = path
+        self._listeners = []
+        self._queue = queue.Queue()
+
+        self.value = self._load(legacy_path)
+
+        self._worker = threading.Thread(target=self._run, name="HighScoreStore", daemon=True)
+        self._worker.start()
+
+    def _connect(self):
+        """Opens the database and makes sure the tables exist."""
+
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE IF NOT EXISTS high_score (id INTEGER PRIMARY KEY CHECK (id = 0), value INTEGER NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "id TEXT PRIMARY KEY, ended_at REAL NOT NULL, cause TEXT NOT NULL, "
+            "customers_served INTEGER NOT NULL, money_earned REAL NOT NULL, "
+            "distance_driven REAL NOT NULL, fuel_bought REAL NOT NULL)"
+        )
+        return conn
+
+    def _load(self, legacy_path):
+        """Reads the high score from the database, importing the legacy file on first run."""
+
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT value FROM high_score WHERE id = 0").fetchone()
+                if row is not None:
+                    return row[0]
+
+                value = 0
+                if legacy_path and os.path.exists(legacy_path):
+                    with open(legacy_path, "r") as f:
+                        value = int(f.read().strip())
+                with conn:
+                    conn.execute("INSERT INTO high_score (id, value) VALUES (0, ?)", (value,))
+                return value
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Error loading high score: {e}")
+        return 0
+
+    def _run(self):
+        """Writer thread: commits queued writes in batches until :meth:`close` is called."""
+
+        conn = None
+        running = True
+        while running:
+            writes = [self._queue.get()]
+            while True:
+                try:
+                    writes.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in writes:
+                running = False
+                writes = [write for write in writes if write is not None]
+            if not writes:
+                continue
+
+            # Only the latest high score and the latest stats of each session need to be written
+            high_score = None
+            sessions = {}
+            for kind, data in writes:
+                if kind == "high_score":
+                    high_score = data
+                else:
+                    sessions[data["id"]] = data
+
+            try:
+                if conn is None:
+                    conn = self._connect()
+                with conn:
+                    if high_score is not None:
+                        conn.execute("INSERT OR REPLACE INTO high_score (id, value) VALUES (0, ?)", (high_score,))
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO sessions VALUES "
+                        "(:id, :ended_at, :cause, :customers_served, :money_earned, :distance_driven, :fuel_bought)",
+                        list(sessions.values())
+                    )
+            except Exception as e:
+                print(f"Error saving score: {e}")
+
+        if conn is not None:
+            conn.close()
+
+    def subscribe(self, callback):
+        """Registers a callback called with the new value whenever the high score changes.
+
+        Bound methods are held weakly, so a discarded scene does not keep
+        receiving notifications.
+
+        Args:
+            callback (callable): Function taking the new high score.
+        """
+
+        if hasattr(callback, "__self__"):
+            self._listeners.append(weakref.WeakMethod(callback))
+        else:
+            self._listeners.append(lambda: callback)
+
+    def _notify(self):
+        """Calls all live listeners with the current value."""
+
+        alive = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is not None:
+                callback(self.value)
+                alive.append(ref)
+        self._listeners = alive
+
+    def submit(self, score):
+        """Records a finished game's score, saving it only if it beats the high score.
+
+        Args:
+            score (int): The score to submit.
+        """
+
+        if score > self.value:
+            self.value = score
+            self._queue.put(("high_score", self.value))
+            self._notify()
+
+    def record_session(self, session_id, cause, customers_served, money_earned, distance_driven, fuel_bought):
+        """Stores the stats of a game session.
+
+        The score is not submitted, a finished game does that with :meth:`submit`.
+        Recording the same session again replaces its previous stats.
+
+        Args:
+            session_id (str): Unique ID of the session.
+            cause (str): Why the session ended (e.g. ``"out_of_fuel"``, ``"starved"``, ``"quit"``).
+            customers_served (int): Number of delivered customers (the score).
+            money_earned (float): Money earned from fares.
+            distance_driven (float): Distance driven in world pixels.
+            fuel_bought (float): Units of fuel bought at pumps.
+        """
+
+        self._queue.put(("session", {
+            "id": session_id,
+            "ended_at": time.time(),
+            "cause": cause,
+            "customers_served": customers_served,
+            "money_earned": money_earned,
+            "distance_driven": distance_driven,
+            "fuel_bought": fuel_bought,
+        }))
+
+    def reset(self):
+        """Resets the high score to zero."""
+
+        self.value = 0
+        self._queue.put(("high_score", self.value))
+        self._notify()
+
+    def close(self):
+        """Writes everything still queued and stops the writer thread."""
+
+        self._queue.put(None)
+        self._worker.join()
@@ -0,0 +1,114 @@
+import numpy as np
+
+# Simulation tiers
+FULL = 0  # On screen: updated every tick
+NEAR = 1  # Close to the screen: updated every few ticks with a longer step
+FAR = 2   # Far away: position estimated analytically, a limited number per tick
+
+
+class LODScheduler:
+    """Decides which entities are simulated in which detail on each tick.
+
+    Every entity is put in a tier by its distance from the camera view. Entities
+    in the :data:`FULL` tier are updated every tick, :data:`NEAR` ones once every
+    ``near_interval`` ticks (staggered, so not all of them on the same tick) and
+    only ``far_budget`` :data:`FAR` entities are updated per tick, in round-robin
+    order. So the cost of a tick depends on the screen size and the budget,
+    not on the size of the world.
+
+    The scheduler remembers the tick each entity was last updated on. The number
+    of ticks since then is returned with each schedule, so a promoted entity
+    can first catch up on the time it was simulated less precisely.
+
+    Entities are identified by their index, kept in sync with the owner's
+    arrays (see :meth:`add` and :meth:`remove`).
+    """
+
+    def __init__(self, full_margin=100, near_margin=1200, near_interval=4, far_budget=8):
+        """Initializes the scheduler.
+
+        Args:
+            full_margin (int): World pixels around the camera view in the full tier.
+            near_margin (int): World pixels around the camera view in the near tier.
+            near_interval (int): Number of ticks between updates in the near tier.
+            far_budget (int): Maximum number of far entities updated per tick.
+        """
+
+        self.full_margin = full_margin
+        self.near_margin = near_margin
+        self.near_interval = near_interval
+        self.far_budget = far_budget
+
+        self.tick = 0
+        self.count = 0
+        self.last_update = np.zeros(16, dtype=np.int64)
+        self._far_cursor = 0
+
+    def add(self):
+        """Registers a new entity and returns its index."""
+
+        if self.count == len(self.last_update):
+            self.last_update = np.concatenate((self.last_update, np.zeros_like(self.last_update)))
+        # Stagger the near tier updates of the entities
+        self.last_update[self.count] = self.tick - self.count % self.near_interval
+        self.count += 1
+        return self.count - 1
+
+    def remove(self, index):
+        """Removes an entity by moving the last one into its slot (like ``Fleet.remove``)."""
+
+        self.count -= 1
+        self.last_update[index] = self.last_update[self.count]
+
+    def tiers(self, positions, view_rect):
+        """Returns the tier of each entity.
+
+        Args:
+            positions (numpy.ndarray): (N, 2) world positions.
+            view_rect (pygame.Rect): The camera view in world coordinates.
+
+        Returns:
+            numpy.ndarray: int8 tier per entity.
+        """
+
+        x = positions[:, 0]
+        y = positions[:, 1]
+        tiers = np.full(len(positions), FAR, dtype=np.int8)
+        for tier, margin in ((NEAR, self.near_margin), (FULL, self.full_margin)):
+            area = view_rect.inflate(margin * 2, margin * 2)
+            inside = (x >= area.left) & (x < area.right) & (y >= area.top) & (y < area.bottom)
+            tiers[inside] = tier
+        return tiers
+
+    def schedule(self, positions, view_rect):
+        """Advances to the next tick and picks the entities to update on it.
+
+        Args:
+            positions (numpy.ndarray): (N, 2) world positions of all entities.
+            view_rect (pygame.Rect): The camera view in world coordinates.
+
+        Returns:
+            tuple: (full, near, far, elapsed) - index arrays of the entities to update
+            in each tier, and the number of ticks since each entity's last update.
+        """
+
+        self.tick += 1
+        count = self.count
+        tiers = self.tiers(positions[:count], view_rect)
+        elapsed = self.tick - self.last_update[:count]
+
+        full = np.flatnonzero(tiers == FULL)
+        near = np.flatnonzero((tiers == NEAR) & (elapsed >= self.near_interval))
+
+        # Far entities take turns, continuing after the last one updated
+        far = np.flatnonzero(tiers == FAR)
+        if len(far) > self.far_budget:
+            start = np.searchsorted(far, self._far_cursor)
+            far = np.concatenate((far[start:], far[:start]))[:self.far_budget]
+        if len(far):
+            self._far_cursor = far[-1] + 1
+
+        self.last_update[full] = self.tick
+        self.last_update[near] = self.tick
+        self.last_update[far] = self.tick
+        return full, near, far, elapsed
@@ -1,7 +1,15 @@
+import time
+# Taken before the other imports on purpose: importing pygame and the menu
+# is part of the startup time reported by Main.report_startup
+STARTED = time.perf_counter()
+
 import pygame
+import os
 
 from scenes.mainmenu import MainMenu
-from scenes.game import Game
+from dirty_renderer import DirtyRectRenderer
+from highscore import HighScoreStore
+import preload
 
 class Main():
     """The main class that initializes Pygame"""
@@ -10,6 +18,9 @@ class Main():
         self.WIDTH = 1920
         self.HEIGHT = 1080
         self.FPS = 60
+        self.DIRTY_RECTS = False  # Update only changed screen regions (saves power on kiosks)
+        self.DEBUG = False  # Print diagnostics, like the startup time
+        self.STARTUP_BUDGET = 1000  # Milliseconds from start to the first frame of the intro
 
         pygame.init()
 
@@ -18,15 +29,39 @@ class Main():
         pygame.display.set_caption("Ruber Taxi Service")
 
         self.clock = pygame.time.Clock()
+        self.renderer = DirtyRectRenderer(enabled=self.DIRTY_RECTS)
+
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.high_scores = HighScoreStore(
+            os.path.join(base_path, "scores.db"),
+            legacy_path=os.path.join(base_path, "highscore.txt")
+        )
         self.running = False
 
         self.current_scene = MainMenu(self)
-    
+
+        # The game scene, its modules and assets are loaded while the intro plays
+        preload.prefetch()
+
     def start_game(self):
+        # Imported here, so the menu does not wait for the game modules (usually prefetched by now)
+        from scenes.game import Game
         self.current_scene = Game(self)
 
+    def report_startup(self):
+        """Logs how long it took to show the first frame (in debug mode), with a warning when over the budget."""
+
+        if not self.DEBUG:
+            return
+        startup = (time.perf_counter() - STARTED) * 1000
+        if startup > self.STARTUP_BUDGET:
+            print(f"Startup took {startup:.0f} ms, over the budget of {self.STARTUP_BUDGET} ms")
+        else:
+            print(f"Startup took {startup:.0f} ms (budget {self.STARTUP_BUDGET} ms)")
+
     def run(self):
         self.running = True
+        first_frame = True
 
         while self.running:
             dt = self.clock.tick(self.FPS)
@@ -34,7 +69,12 @@ class Main():
             if self.current_scene is not None:
                 self.current_scene.loop(dt)
 
+            if first_frame:
+                first_frame = False
+                self.report_startup()
+
         pygame.quit()
+        self.high_scores.close()
     
     def quit(self):
         self.running = False
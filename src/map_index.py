@@ -0,0 +1,260 @@
+import hashlib
+import os
+import numpy as np
+import pygame
+from atomic_file import atomic_write
+from fleet import build_walkable_mask
+from tile_registry import CATEGORY_TILES
+
+
+def artifact_paths(map_path):
+    """Returns the paths of the precomputed index (.npz) and minimap (.png) stored next to a map file."""
+
+    base, _ = os.path.splitext(map_path)
+    return base + ".index.npz", base + ".minimap.png"
+
+
+def map_digest(map_path):
+    """Returns the SHA-1 of a map file, used to check that precomputed data belongs to it."""
+
+    with open(map_path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class MapChange:
+    """What an edit of the map changed, as returned by :meth:`MapIndex.set_tiles`."""
+
+    __slots__ = ("tiles", "added", "removed", "walkability")
+
+    def __init__(self):
+        self.tiles = []  # (x, y) of every tile whose ID changed
+        self.added = []  # (tile, category) of new special tiles
+        self.removed = []  # (tile, category) of special tiles that are gone
+        self.walkability = []  # (x, y) of tiles that became walkable or blocked
+
+    def __bool__(self):
+        return bool(self.tiles)
+
+    @property
+    def categories(self):
+        """Set of the special tile categories that gained or lost a tile."""
+
+        return {category for _, category in self.added + self.removed}
+
+
+class MapIndex:
+    """The tile map together with the data derived from it.
+
+    The location lists of the special tiles, their categories, the walkability
+    mask and the minimap surface are built by one scan of the map. After that
+    the map is only changed through :meth:`set_tiles`, which updates all of them
+    for the edited tiles alone, so closing a road or adding a station costs the
+    same on any map size.
+
+    The derived data is updated in place (the same list, array and surface
+    objects), so code holding on to them, like the road network sharing the
+    walkability mask, sees the change right away.
+
+    The scan can be skipped by precomputing the data with
+    ``editor/validate_map.py``, which stores it next to the map file
+    (see :meth:`save_artifacts`). It is used only if it was computed from the
+    same file contents with the same settings, otherwise the map is scanned.
+    The precomputed data also has the road distances between all pickup tiles
+    (:attr:`pickup_distances`), which are only known when it was loaded and
+    are dropped once an edit changes the roads or the pickup tiles.
+    """
+
+    CATEGORY_TILES = CATEGORY_TILES
+    UNKNOWN_COLOR = (80, 80, 80)  # Minimap color of tiles without a color
+
+    def __init__(self, tile_map, walkable_tiles, tile_colors, minimap_scale=2, map_path=None, road_clearance=1):
+        """Builds the derived data, from the precomputed files if they are up to date.
+
+        Args:
+            tile_map (list[list[int]]): The tile map, edited in place by :meth:`set_tiles`.
+            walkable_tiles (list[int]): IDs of walkable tiles.
+            tile_colors (dict): Minimap color of each tile ID.
+            minimap_scale (int): Size of one tile on the minimap in pixels.
+            map_path (str, optional): File the map was loaded from, to look for precomputed data.
+            road_clearance (int): Clearance of the road network the pickup distances are measured on.
+        """
+
+        self.tile_map = tile_map
+        self.walkable_tiles = frozenset(walkable_tiles)
+        self.tile_colors = tile_colors
+        self.minimap_scale = minimap_scale
+        self.road_clearance = road_clearance
+        # Road distances between pickup tiles, {(from, to): tiles}, only known when precomputed
+        self.pickup_distances = None
+
+        if map_path is None or not self._load_artifacts(map_path):
+            self._scan()
+
+    def _scan(self):
+        """Builds the derived data by scanning the whole map."""
+
+        # Special tile locations in map order, and the category of each of them
+        self.locations = {category: [] for category in self.CATEGORY_TILES.values()}
+        self.tile_categories = {}
+        for y, row in enumerate(self.tile_map):
+            for x, tile_id in enumerate(row):
+                category = self.CATEGORY_TILES.get(tile_id)
+                if category is not None:
+                    self.locations[category].append((x, y))
+                    self.tile_categories[(x, y)] = category
+
+        self.walkable_mask = build_walkable_mask(self.tile_map, list(self.walkable_tiles))
+        self.minimap_surface = self._create_minimap()
+
+    def _settings(self):
+        """Returns what the precomputed data depends on besides the map itself."""
+
+        return {
+            "shape": np.array((self.height, self.width)),
+            "minimap_scale": np.array(self.minimap_scale),
+            "road_clearance": np.array(self.road_clearance),
+            "walkable_tiles": np.array(sorted(self.walkable_tiles)),
+            "category_tiles": np.array(sorted(self.CATEGORY_TILES.items()), dtype=str),
+            "tile_colors": np.array(hashlib.sha1(repr(sorted(self.tile_colors.items())).encode()).hexdigest()),
+        }
+
+    def _load_artifacts(self, map_path):
+        """Loads the precomputed data of the map, returns False if it is missing or out of date."""
+
+        index_path, minimap_path = artifact_paths(map_path)
+        try:
+            with np.load(index_path) as data:
+                if str(data["source"]) != map_digest(map_path):
+                    return False
+                for name, value in self._settings().items():
+                    if not np.array_equal(data[name], value):
+                        return False
+                locations = {
+                    category: [tuple(tile) for tile in data["locations_" + category].tolist()]
+                    for category in self.CATEGORY_TILES.values()
+                }
+                walkable_mask = np.unpackbits(data["walkable"], count=self.height * self.width)
+                distances = data["pickup_distances"].tolist()
+            minimap = pygame.image.load(minimap_path)
+        except (OSError, KeyError, ValueError):
+            return False
+        if minimap.get_size() != (self.width * self.minimap_scale, self.height * self.minimap_scale):
+            return False
+
+        self.locations = locations
+        self.tile_categories = {
+            tile: category for category, tiles in locations.items() for tile in tiles
+        }
+        self.walkable_mask = walkable_mask.reshape(self.height, self.width).astype(bool)
+        # Copied to a surface of the same format as a freshly created minimap
+        self.minimap_surface = pygame.Surface(minimap.get_size())
+        self.minimap_surface.blit(minimap, (0, 0))
+        pickups = locations["pickup"]
+        self.pickup_distances = {
+            (start, goal): distances[i][j]
+            for i, start in enumerate(pickups)
+            for j, goal in enumerate(pickups)
+        }
+        return True
+
+    def save_artifacts(self, map_path, pickup_distances):
+        """Stores the derived data next to the map file, for :class:`MapIndex` to load instead of scanning.
+
+        Both files are written to a temporary file first and then renamed, so
+        a reader never sees a half-written file.
+
+        Args:
+            map_path (str): The map file the data was computed from.
+            pickup_distances (numpy.ndarray): [from, to] road distances between the
+                pickup tiles in the order of ``locations["pickup"]``, -1 if unreachable.
+        """
+
+        index_path, minimap_path = artifact_paths(map_path)
+        arrays = self._settings()
+        arrays["source"] = np.array(map_digest(map_path))
+        for category, tiles in self.locations.items():
+            arrays["locations_" + category] = np.array(tiles, dtype=np.int32).reshape(-1, 2)
+        arrays["walkable"] = np.packbits(self.walkable_mask.ravel())
+        arrays["pickup_distances"] = np.asarray(pickup_distances, dtype=np.int32)
+
+        with atomic_write(index_path) as f:
+            np.savez_compressed(f, **arrays)
+        with atomic_write(minimap_path) as f:
+            pygame.image.save(self.minimap_surface, f, "png")
+
+    @property
+    def width(self):
+        """Width of the map in tiles."""
+
+        return len(self.tile_map[0])
+
+    @property
+    def height(self):
+        """Height of the map in tiles."""
+
+        return len(self.tile_map)
+
+    def _create_minimap(self):
+        """Creates the minimap surface from the tile map."""
+
+        scale = self.minimap_scale
+        surf = pygame.Surface((int(self.width * scale), int(self.height * scale)))
+        surf.fill((30, 30, 30))
+        for y, row in enumerate(self.tile_map):
+            for x, tile_id in enumerate(row):
+                self._paint_minimap(surf, x, y, tile_id)
+        return surf
+
+    def _paint_minimap(self, surf, x, y, tile_id):
+        """Fills the minimap pixels of one tile."""
+
+        scale = self.minimap_scale
+        color = self.tile_colors.get(tile_id, self.UNKNOWN_COLOR)
+        surf.fill(color, pygame.Rect(int(x * scale), int(y * scale), max(1, int(scale)), max(1, int(scale))))
+
+    def set_tiles(self, changes):
+        """Changes tiles of the map and updates the derived data of just these tiles.
+
+        Args:
+            changes: Iterable of (x, y, tile_id). Tiles outside the map are ignored.
+
+        Returns:
+            MapChange: The tiles that actually changed, for updating other systems
+            (e.g. the road network or the dispatch).
+        """
+
+        change = MapChange()
+        width, height = self.width, self.height
+        for x, y, tile_id in changes:
+            if not (0 <= x < width and 0 <= y < height):
+                continue
+            old_id = self.tile_map[y][x]
+            if old_id == tile_id:
+                continue
+            self.tile_map[y][x] = tile_id
+            tile = (x, y)
+            change.tiles.append(tile)
+
+            old_category = self.CATEGORY_TILES.get(old_id)
+            category = self.CATEGORY_TILES.get(tile_id)
+            if old_category != category:
+                if old_category is not None:
+                    self.locations[old_category].remove(tile)
+                    del self.tile_categories[tile]
+                    change.removed.append((tile, old_category))
+                if category is not None:
+                    self.locations[category].append(tile)
+                    self.tile_categories[tile] = category
+                    change.added.append((tile, category))
+
+            walkable = tile_id in self.walkable_tiles
+            if walkable != self.walkable_mask[y, x]:
+                self.walkable_mask[y, x] = walkable
+                change.walkability.append(tile)
+
+            self._paint_minimap(self.minimap_surface, x, y, tile_id)
+
+        # The precomputed distances do not follow edits of the roads or pickup tiles
+        if change.walkability or "pickup" in change.categories:
+            self.pickup_distances = None
+        return change
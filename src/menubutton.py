@@ -76,17 +76,21 @@ class MenuButton(pygame.sprite.Sprite):
         Args:
             surface (pygame.Surface): The surface to draw the button on.
 
+        Returns:
+            pygame.Rect: The screen region covered by the button.
         """
 
         offset = self.hover_offset if self.hovered else 0  # změna zde
         arrow_pos = (self.rect.x + offset, self.rect.y)
+        drawn_rect = pygame.Rect(arrow_pos, self.image.get_size())
         if self.hovered:
             # Draw text with shadow to the left of the arrow
             text_x = arrow_pos[0] - self.text_surface.get_width() - 10
             text_y = arrow_pos[1] + (self.image.get_height() - self.text_surface.get_height()) // 2
             # Shadow uses the actual button text
             shadow_surface = self.font.render(self.text, True, (40, 40, 40))
-            surface.blit(shadow_surface, (text_x + 2, text_y + 2))
-            surface.blit(self.text_surface, (text_x, text_y))
+            drawn_rect.union_ip(surface.blit(shadow_surface, (text_x + 2, text_y + 2)))
+            drawn_rect.union_ip(surface.blit(self.text_surface, (text_x, text_y)))
         surface.blit(self.image, arrow_pos)
         # If not hovered, draw arrow in original position (already handled by the image.blit call)
+        return drawn_rect
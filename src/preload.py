@@ -0,0 +1,78 @@
+import importlib
+import os
+import threading
+import time
+import pygame
+
+# Loaded only when the game starts, so the menu does not wait for them
+GAME_MODULES = ("scenes.game",)
+
+# Images loaded by the game scene, relative to the src folder
+GAME_IMAGES = (
+    "tiles/game/tilemap.png",
+    "tiles/game/game_board_background.png",
+    "tiles/game/gas-pump-alt.png",
+    "tiles/game/apple-whole.png",
+    "tiles/game/wrench.png",
+    "entities/RPG_assets.png",
+    "../assets/Car_Ruber.png",
+)
+
+SRC_PATH = os.path.dirname(os.path.abspath(__file__))
+
+_images = {}  # normalized path -> decoded, unconverted surface
+
+
+def load_image(path):
+    """Loads an image, or returns it right away if it was already prefetched.
+
+    The surface is not converted and may be shared, so callers should convert
+    it (``convert`` / ``convert_alpha`` return a new surface) before drawing
+    on it.
+
+    Args:
+        path (str): Path to the image file.
+
+    Returns:
+        pygame.Surface: The decoded image.
+    """
+
+    key = os.path.normcase(os.path.abspath(path))
+    image = _images.get(key)
+    if image is None:
+        image = pygame.image.load(path)
+        _images[key] = image
+    return image
+
+
+def prefetch(modules=GAME_MODULES, images=GAME_IMAGES):
+    """Imports modules and decodes images on a background thread.
+
+    Meant to run while the intro plays. Whatever is not done yet when it is
+    needed is simply loaded on the spot: an import of a module being imported
+    by the thread waits for it, and :func:`load_image` loads images that were
+    not prefetched yet.
+
+    Args:
+        modules (tuple[str]): Names of the modules to import.
+        images (tuple[str]): Image paths relative to the src folder.
+
+    Returns:
+        threading.Thread: The started thread.
+    """
+
+    def run():
+        start = time.perf_counter()
+        try:
+            for name in modules:
+                importlib.import_module(name)
+            for path in images:
+                load_image(os.path.join(SRC_PATH, path))
+        except Exception as e:
+            print(f"Error prefetching game assets: {e}")
+            return
+        print(f"Game assets prefetched in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    thread = threading.Thread(target=run, name="Prefetch", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,233 @@
+from collections import deque, OrderedDict
+import numpy as np
+
+class RoadNetwork:
+    """Graph of walkable tiles used for path finding.
+
+    Every walkable tile is a node connected to its four walkable neighbours.
+    Distances are measured in tiles. Breadth-first distance fields are computed
+    per goal tile and cached, so many cars heading to the same goal share
+    one search.
+
+    With ``clearance`` > 0 only tiles that have walkable tiles all around them
+    (within that many tiles) are used, except for the goal itself. This keeps
+    routes away from walls, which the car's long collision box could scrape.
+    """
+
+    def __init__(self, walkable_mask, cache_size=64, clearance=0):
+        """Initializes the network.
+
+        Args:
+            walkable_mask (numpy.ndarray): Boolean [row, column] walkability of the map tiles.
+            cache_size (int): Number of distance fields kept in the cache.
+            clearance (int): Required number of walkable tiles around route tiles.
+        """
+
+        self.walkable_mask = walkable_mask
+        self.cache_size = cache_size
+        self.clearance = clearance
+        self._passable = None
+        self._fields = OrderedDict()
+
+    @property
+    def passable(self):
+        """Boolean [row, column] mask of tiles routes may pass through."""
+
+        if self._passable is None:
+            self._passable = self._erode(self.walkable_mask)
+        return self._passable
+
+    def _erode(self, walkable):
+        """Keeps only the tiles with walkable tiles all around them, within the clearance.
+
+        Tiles outside the given mask count as not walkable.
+        """
+
+        passable = walkable.copy()
+        for _ in range(self.clearance):
+            padded = np.pad(passable, 1, constant_values=False)
+            eroded = passable.copy()
+            for dy in (0, 1, 2):
+                for dx in (0, 1, 2):
+                    eroded &= padded[dy:dy + passable.shape[0], dx:dx + passable.shape[1]]
+            passable = eroded
+        return passable
+
+    def is_walkable(self, tile):
+        """Returns True if the tile (x, y) is inside the map and walkable."""
+
+        x, y = tile
+        rows, cols = self.walkable_mask.shape
+        return 0 <= x < cols and 0 <= y < rows and bool(self.walkable_mask[y, x])
+
+    def invalidate(self):
+        """Drops all cached data (call after the walkability mask changed)."""
+
+        self._passable = None
+        self._fields.clear()
+
+    def tiles_changed(self, tiles):
+        """Updates the network after the walkability of some tiles changed.
+
+        Only the part of the passable mask within the clearance of the tiles is
+        recomputed. The cached distance fields are dropped only if the passable
+        tiles (the nodes and edges of the graph) actually changed.
+
+        Args:
+            tiles (list[tuple[int, int]]): (x, y) of the tiles whose entry in
+                the walkability mask changed.
+        """
+
+        if not tiles:
+            return
+        if self._passable is None:
+            self._fields.clear()
+            return
+
+        rows, cols = self.walkable_mask.shape
+        c = self.clearance
+        xs = [x for x, _ in tiles]
+        ys = [y for _, y in tiles]
+        # Tiles whose passability may have changed, and the walkable tiles they depend on
+        left, right = max(0, min(xs) - c), min(cols, max(xs) + c + 1)
+        top, bottom = max(0, min(ys) - c), min(rows, max(ys) + c + 1)
+        window_left, window_right = max(0, left - c), min(cols, right + c)
+        window_top, window_bottom = max(0, top - c), min(rows, bottom + c)
+
+        eroded = self._erode(self.walkable_mask[window_top:window_bottom, window_left:window_right])
+        updated = eroded[top - window_top:bottom - window_top, left - window_left:right - window_left]
+        region = self._passable[top:bottom, left:right]
+        if not np.array_equal(updated, region):
+            region[...] = updated
+            self._fields.clear()
+
+    def components(self):
+        """Labels the connected parts of the network.
+
+        Returns:
+            numpy.ndarray: int32 [row, column] component number of each passable tile, -1 elsewhere.
+        """
+
+        rows, cols = self.walkable_mask.shape
+        size = rows * cols
+        walkable = self.passable.ravel().tolist()
+        labels = [-1] * size
+        label = 0
+        for start in range(size):
+            if not walkable[start] or labels[start] >= 0:
+                continue
+            labels[start] = label
+            queue = deque([start])
+            while queue:
+                i = queue.popleft()
+                x = i % cols
+                for j in (i - cols, i + cols, i - 1 if x > 0 else -1, i + 1 if x < cols - 1 else -1):
+                    if 0 <= j < size and walkable[j] and labels[j] < 0:
+                        labels[j] = label
+                        queue.append(j)
+            label += 1
+        return np.array(labels, dtype=np.int32).reshape(rows, cols)
+
+    def distance_field(self, goal):
+        """Returns the distance in tiles from every tile to the goal tile.
+
+        Args:
+            goal (tuple[int, int]): The goal tile (x, y).
+
+        Returns:
+            numpy.ndarray: int32 [row, column] distances, -1 where the goal is unreachable.
+        """
+
+        goal = (int(goal[0]), int(goal[1]))
+        field = self._fields.get(goal)
+        if field is not None:
+            self._fields.move_to_end(goal)
+            return field
+
+        rows, cols = self.walkable_mask.shape
+        size = rows * cols
+        walkable = self.passable.ravel().tolist()
+        dist = [-1] * size
+        if self.is_walkable(goal):
+            start = goal[1] * cols + goal[0]
+            dist[start] = 0
+            queue = deque([start])
+            while queue:
+                i = queue.popleft()
+                d = dist[i] + 1
+                x = i % cols
+                for j in (i - cols, i + cols, i - 1 if x > 0 else -1, i + 1 if x < cols - 1 else -1):
+                    if 0 <= j < size and walkable[j] and dist[j] < 0:
+                        dist[j] = d
+                        queue.append(j)
+
+        field = np.array(dist, dtype=np.int32).reshape(rows, cols)
+        self._fields[goal] = field
+        if len(self._fields) > self.cache_size:
+            self._fields.popitem(last=False)
+        return field
+
+    def _nearest_reachable(self, field, x, y):
+        """Returns the tile nearest to (x, y) with a known distance in the field, or None.
+
+        Tiles within the clearance plus one are searched, as a car can stand
+        next to the tiles used by routes.
+        """
+
+        rows, cols = field.shape
+        if not (0 <= x < cols and 0 <= y < rows):
+            return None
+        if field[y, x] >= 0:
+            return x, y
+        reach = self.clearance + 1
+        nearby = [
+            (abs(dx) + abs(dy), field[y + dy, x + dx], x + dx, y + dy)
+            for dy in range(-reach, reach + 1)
+            for dx in range(-reach, reach + 1)
+            if 0 <= x + dx < cols and 0 <= y + dy < rows and field[y + dy, x + dx] >= 0
+        ]
+        if not nearby:
+            return None
+        _, _, x, y = min(nearby)
+        return x, y
+
+    def distance(self, start, goal):
+        """Returns the road distance in tiles between two tiles, or -1 if unreachable."""
+
+        field = self.distance_field(goal)
+        tile = self._nearest_reachable(field, int(start[0]), int(start[1]))
+        if tile is None:
+            return -1
+        return int(field[tile[1], tile[0]]) + abs(tile[0] - int(start[0])) + abs(tile[1] - int(start[1]))
+
+    def shortest_path(self, start, goal):
+        """Finds a shortest path between two tiles.
+
+        If the start tile is too close to a wall to be used by routes (see
+        ``clearance``), the path starts from the nearest usable tile instead.
+
+        Args:
+            start (tuple[int, int]): The start tile (x, y).
+            goal (tuple[int, int]): The goal tile (x, y).
+
+        Returns:
+            list[tuple[int, int]]: Tiles from start to goal (both included),
+            or an empty list if the goal cannot be reached.
+        """
+
+        field = self.distance_field(goal)
+        rows, cols = field.shape
+        tile = self._nearest_reachable(field, int(start[0]), int(start[1]))
+        if tile is None:
+            return []
+        x, y = tile
+
+        path = [(x, y)]
+        while field[y, x] > 0:
+            d = field[y, x]
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < cols and 0 <= ny < rows and field[ny, nx] == d - 1:
+                    x, y = nx, ny
+                    break
+            path.append((x, y))
+        return path
@@ -1,12 +1,23 @@
 import pygame
 import os
 import math
-import random
+import uuid
 from car_sprite import CarSprite
-from tiles import tile_dict
-from job import Job
-from entities.passenger import Passenger
+from tile_registry import tile_dict, WALKABLE_TILES, minimap_colors
+from tile_atlas import TileAtlas
+from blit_batch import BlitBatch
+from map_index import MapIndex
+from road_network import RoadNetwork
+from traffic import TrafficSystem
+from dispatch import DispatchEngine
+from timers import DeadlineScheduler
+from effects import FloatingTextPool
+from events import (
+    EventBus, TILE_CATEGORY_CHANGED, HANDBRAKE_CHANGED, FUEL_LOW_CHANGED, JOB_STATE_CHANGED, MONEY_CHANGED,
+    MAP_CHANGED
+)
 from entities.passenger_manager import PassengerManager
+from preload import load_image
 
 
 class Game:
@@ -21,7 +32,7 @@ class Game:
         brake_pressed: Boolean indicating if the brake is pressed.
         money: Player's current cash amount.
         is_refueling: Boolean indicating if the player is currently refueling.
-        cash_animations: List of cash animations for floating money effects.
+        floating_texts: Pool of floating money effects.
         pending_job: Job that is available to be accepted by the player.
     """
 
@@ -34,31 +45,44 @@ class Game:
         """
 
         self.main = main
+        # State changes are published here instead of being polled every frame
+        self.events = EventBus()
+        self._money = 0
+        self._job_state = None
         self.sprites = pygame.sprite.Group()
         self.car = CarSprite(400,500)
         self.sprites.add(self.car)
         self.brake_pressed = False
         self.money = 0 
         self.is_refueling = False
-        self.cash_animations = []
         self.pending_job = None
         self.customers_served = 0  # Track number of delivered customers (score)
+        # Session stats, stored once per game-over event
+        self.session_id = uuid.uuid4().hex
+        self.money_earned = 0
+        self.distance_driven = 0
+        self.fuel_bought = 0
+        self.session_recorded = False
         self.tank_session = None  # Track refueling session
         self.hunger = 100
         self.max_hunger = 100
         self.is_eating = False
-        self.passenger_group = pygame.sprite.Group()
-        self.passenger_sprite = None
-        self.passenger_visible = False
         self.accepting_jobs = True  # Whether new jobs are generated automatically
         self.job_counter = 0
         self.timed_job_interval = 3
         self.is_timed_job = False
-        self.timed_job_duration = 100_000
+        self.timed_job_duration = 100  # seconds
+        self.timed_job_bonus = 10  # Maximal bonus for a timed job, shrinks with the time used
         self.timed_job_remaining = 0
         self.timed_job_active = False
-        self.timed_job_timer = None
+        self.timed_job_timer = None  # Deadline of the current timed job
+        self.timers = DeadlineScheduler()
         self.font_big = pygame.font.Font(None, 48)
+        self.fonts = {}  # Kenney_Future fonts by size
+        self.hud_text = {}  # HUD slot -> (text, surface, shadow)
+        self.message_surfaces = {}  # Centered message -> (background, shadow, text)
+        self.dashboard_bg_scaled = None
+        self.help_overlay = None
 
         base_path = os.path.dirname(os.path.dirname(__file__))
 
@@ -67,6 +91,7 @@ class Game:
         self.font = pygame.font.Font(self.font_path, 36)
         self.font_small = pygame.font.Font(self.font_path, 24)
         self.small_font = pygame.font.Font(self.font_path, 32)
+        self.floating_texts = FloatingTextPool(self.get_font(28))
 
         self.SPRITE_TILE_SIZE = 16
         self.TILE_SPACING = 1
@@ -74,33 +99,15 @@ class Game:
 
         self.tile_size = 40
 
-        self.sprite_sheet = pygame.image.load(os.path.join(base_path, "tiles/game/tilemap.png")).convert_alpha()
-
-        def get_tile(x, y):
-            """Returns a tile image from the sprite sheet based on its coordinates.
-            
-            Args:
-                x: The x-coordinate of the tile in the sprite sheet.
-                y: The y-coordinate of the tile in the sprite sheet.
-            
-            Returns:
-                A pygame.Surface object representing the tile.
-            """
-
-            px = self.TILE_MARGIN + x * (self.SPRITE_TILE_SIZE + self.TILE_SPACING)
-            py = self.TILE_MARGIN + y * (self.SPRITE_TILE_SIZE + self.TILE_SPACING)
-            rect = pygame.Rect(px, py, self.SPRITE_TILE_SIZE, self.SPRITE_TILE_SIZE)
-            return self.sprite_sheet.subsurface(rect)
+        self.sprite_sheet = load_image(os.path.join(base_path, "tiles/game/tilemap.png")).convert_alpha()
 
-        self.tile_images = {
-            i: pygame.transform.scale(get_tile(*coords), (self.tile_size, self.tile_size))
-            for i, (coords, _) in tile_dict.items()
-        }
+        # All tiles live in one pre-scaled atlas surface, drawn via area blits
+        self.tile_atlas = TileAtlas(
+            self.sprite_sheet, tile_dict, self.tile_size,
+            self.SPRITE_TILE_SIZE, self.TILE_SPACING, self.TILE_MARGIN
+        )
 
-        self.tile_colors = {
-            i: (100 + i * 10 % 155, 100 + i * 20 % 155, 100 + i * 30 % 155)
-            for i in tile_dict.keys()
-        }
+        self.tile_colors = minimap_colors(tile_dict.keys())
 
         def load_tile_map(path):
             """Loads the tile map from a text file.
@@ -116,117 +123,457 @@ class Game:
         map_filepath = os.path.join(os.path.dirname(base_path), "editor/tile_map.txt")
         self.tile_map = load_tile_map(map_filepath)
 
-        self.WALKABLE_TILES = [0, 22, 676, 814, 850, 851, 852, 779, 674, 709, 782] # List of ID's of walkable tiles
+        self.WALKABLE_TILES = WALKABLE_TILES
 
         self.MAP_WIDTH = len(self.tile_map[0]) * self.tile_size
         self.MAP_HEIGHT = len(self.tile_map) * self.tile_size
 
-        # Find pickup and pump tile locations
-        self.pickup_tile_locations = []
-        self.pump_tile_locations = []
-        self.food_tile_locations = []
-        self.service_tile_locations = []
-        for y, row in enumerate(self.tile_map):
-            for x, tile_id in enumerate(row):
-                PICKUP_TILE = 851
-                PUMP_TILE = 852
-                FOOD_TILE = 814
-                SERVICE_TILE = 676
-                if tile_id == PICKUP_TILE:
-                    self.pickup_tile_locations.append((x, y))
-                elif tile_id == PUMP_TILE:
-                    self.pump_tile_locations.append((x, y))
-                elif tile_id == FOOD_TILE:
-                    self.food_tile_locations.append((x, y))
-                elif tile_id == SERVICE_TILE:
-                    self.service_tile_locations.append((x, y))
+        # Pickup, pump, food and service tile locations, walkability and the minimap,
+        # all updated per tile when the map is edited (see edit_map)
+        self.minimap_scale = 2
+        self.map_index = MapIndex(
+            self.tile_map, self.WALKABLE_TILES, self.tile_colors, self.minimap_scale,
+            map_path=map_filepath, road_clearance=1
+        )
+        self.pickup_tile_locations = self.map_index.locations["pickup"]
+        self.pump_tile_locations = self.map_index.locations["pump"]
+        self.food_tile_locations = self.map_index.locations["food"]
+        self.service_tile_locations = self.map_index.locations["service"]
+
+        # Category of each special tile, the car's current one is tracked in self.tile_category
+        self.tile_categories = self.map_index.tile_categories
+        self.tile_category = None
+        self.LOW_FUEL = 30
+        self.fuel_low = False
+
+        # === Traffic ===
+        self.TRAFFIC_CARS = 12
+        self.walkable_mask = self.map_index.walkable_mask
+        self.road_network = RoadNetwork(self.walkable_mask, clearance=self.map_index.road_clearance)
+        self.traffic = TrafficSystem(self.road_network, self.tile_size, self.car.original_image)
+        self.traffic.spawn(self.TRAFFIC_CARS, self.car.pos)
         
 
+        # === Dispatch ===
+        self.dispatch = DispatchEngine(
+            self.road_network, self.pickup_tile_locations, now=self.now(),
+            on_request=self.on_ride_requested, on_expire=self.on_ride_expired,
+            trip_distances=self.map_index.pickup_distances
+        )
         self.current_job = None
-        self.job_state = None
-        self.new_job()
+        self.current_request = None
 
         # === Minimap ===
-        self.minimap_scale = 2
-        self.minimap_surface = self._create_minimap()
+        self.minimap_surface = self.map_index.minimap_surface
 
         # Load PNG backgrounds for minimap and dashboard
-        self.dashboard_bg_img = pygame.image.load(os.path.join(base_path, "tiles/game/game_board_background.png")).convert_alpha()
+        self.dashboard_bg_img = load_image(os.path.join(base_path, "tiles/game/game_board_background.png")).convert_alpha()
 
         # Load PNG icon for pump (for minimap)
-        self.pump_icon_img = pygame.image.load(os.path.join(base_path, "tiles/game/gas-pump-alt.png")).convert_alpha()
+        self.pump_icon_img = load_image(os.path.join(base_path, "tiles/game/gas-pump-alt.png")).convert_alpha()
         self.pump_icon_img = pygame.transform.scale(self.pump_icon_img, (18, 18))
 
         # Load PNG icon for food (for minimap)
-        self.food_icon_img = pygame.image.load(os.path.join(base_path, "tiles/game/apple-whole.png")).convert_alpha()
+        self.food_icon_img = load_image(os.path.join(base_path, "tiles/game/apple-whole.png")).convert_alpha()
         self.food_icon_img = pygame.transform.scale(self.food_icon_img, (18, 18))
         
         # Load PNG icon for service (for minimap)
-        self.service_icon_img = pygame.image.load(os.path.join(base_path, "tiles/game/wrench.png")).convert_alpha()
+        self.service_icon_img = load_image(os.path.join(base_path, "tiles/game/wrench.png")).convert_alpha()
         self.service_icon_img = pygame.transform.scale(self.service_icon_img, (18, 18))
         
+        self.minimap_icons = self._build_minimap_icons()
+
+        # Reusable blit batches for the map tiles and the world sprites
+        self.map_batch = BlitBatch(capacity=2048)
+        self.sprite_batch = BlitBatch(capacity=32)
+
         self.show_fps = False  # FPS display toggle
 
-        self.passenger_group = pygame.sprite.Group()
         base_path = os.path.dirname(os.path.dirname(__file__))
-        self.passenger_sprite_sheet = pygame.image.load(os.path.join(base_path, "entities/RPG_assets.png")).convert_alpha()
-        self.passenger_sprite = None
-        self.passenger_visible = False
 
-        self.passenger_manager = PassengerManager(self.passenger_sprite_sheet)
+        # Customers waiting for a taxi, one per open ride request
+        self.passenger_manager = PassengerManager(os.path.join(base_path, "entities/RPG_assets.png"))
 
         self.show_help = False
 
+        # Prompts shown above the dashboard, rebuilt only when the state they depend on changes
+        self.prompts = []
+        self.prompts_dirty = True
+        self.events.subscribe(TILE_CATEGORY_CHANGED, self.on_prompt_state_changed)
+        self.events.subscribe(MONEY_CHANGED, self.on_prompt_state_changed)
+        self.events.subscribe(HANDBRAKE_CHANGED, self.on_handbrake_changed)
+        self.events.subscribe(JOB_STATE_CHANGED, self.on_job_state_changed)
+
+        self.new_job()
+
+        # A new scene always starts with a full redraw
+        self.last_camera = None
+        self.main.renderer.invalidate()
+
+    @property
+    def money(self):
+        """Player's current cash amount. Changing it publishes MONEY_CHANGED."""
+
+        return self._money
+
+    @money.setter
+    def money(self, value):
+        previous = self._money
+        self._money = value
+        if value != previous:
+            self.events.publish(MONEY_CHANGED, money=value, previous=previous)
+
+    @property
+    def job_state(self):
+        """State of the current job ("pickup", "dropoff" or None). Changing it publishes JOB_STATE_CHANGED."""
+
+        return self._job_state
+
+    @job_state.setter
+    def job_state(self, value):
+        previous = self._job_state
+        self._job_state = value
+        if value != previous:
+            self.events.publish(JOB_STATE_CHANGED, state=value, previous=previous)
+
+    def get_font(self, size):
+        """Returns the game font (Kenney_Future) in the given size, loading each size only once."""
+
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(self.font_path, size)
+            self.fonts[size] = font
+        return font
+
+    def update_car_state(self):
+        """Publishes events for the car state that changed since the last frame."""
+
+        car_tile = (int(self.car.pos.x) // self.tile_size, int(self.car.pos.y) // self.tile_size)
+        category = self.tile_categories.get(car_tile)
+        if category != self.tile_category:
+            previous = self.tile_category
+            self.tile_category = category
+            self.events.publish(TILE_CATEGORY_CHANGED, category=category, previous=previous)
+
+        fuel_low = self.car.fuel < self.LOW_FUEL
+        if fuel_low != self.fuel_low:
+            self.fuel_low = fuel_low
+            self.events.publish(FUEL_LOW_CHANGED, low=fuel_low)
+
+    def check_job_progress(self):
+        """Picks up or drops off the passenger if the car stands at the job's stop with the handbrake engaged.
+
+        Called when the handbrake gets engaged or the job state changes, the
+        only moments the outcome can change.
+        """
+
+        if self.current_job and self.job_state:
+            if self.job_state == "pickup":
+                # If at pickup location, handbrake is engaged, and car is stopped, switch to dropoff
+                if self.is_at_tile(self.current_job.pickup_tile_loc) and self.car.is_handbraking() and abs(self.car.speed) < 0.2:
+                    print("[JOB] Passenger picked up.")
+                    self.passenger_manager.remove(self.current_request.id)
+                    self.job_state = "dropoff"
+
+            elif self.job_state == "dropoff":
+                # If at delivery location, handbrake is engaged, and car is stopped, complete job and start new one
+                if self.is_at_tile(self.current_job.delivery_tile_loc) and self.car.is_handbraking() and abs(self.car.speed) < 0.2:
+                    print("[JOB] Passenger dropped off. Job complete.")
+
+                    # Calculate payment from the road distance of the trip (straight distance if there is no road)
+                    base_rate = 0.5  
+                    road_distance = self.dispatch.trip_distance(self.current_request)
+                    if road_distance >= 0:
+                        distance = road_distance * self.tile_size / 100
+                    else:
+                        distance = self.current_job.distance(self.tile_size) / 100
+                    earned = int(base_rate * distance)
+                    if self.timed_job_timer is not None:
+                        earned += self.timers.complete(self.timed_job_timer)
+                        self.timed_job_timer = None
+                    self.money += earned
+                    self.money_earned += earned
+                    self.customers_served += 1  # Increment score
+                    self.floating_texts.spawn(f"+${earned}", (0, 255, 100), self.car.pos.x, self.car.pos.y - 50, alpha=255, lifetime=1.0)
+
+                    # Clean up job
+                    self.job_state = None
+                    self.current_job = None
+                    self.current_request = None
+                    if self.accepting_jobs:
+                        self.new_job()
+
+    def build_prompts(self, service_price, max_speed_limit):
+        """Decides which prompts to show for the tile the car is parked on.
+
+        Args:
+            service_price (int): Price of a speed upgrade.
+            max_speed_limit (float): Maximal upgraded speed.
+
+        Returns:
+            list[tuple[str, int]]: (message, distance of its center from the bottom of the screen) pairs.
+        """
+
+        FUEL_PER_DOLLAR = 2.0
+        FOOD_PRICE = 20
+
+        if not self.car.handbrake_engaged:
+            return []
+        customer_in_car = self.current_job and self.job_state == "dropoff"
+
+        # Refuel message logic
+        if self.tile_category == "pump":
+            if customer_in_car:
+                message = "Cannot refuel customer in car"
+            elif self.car.fuel < self.car.max_fuel:
+                if self.money < (0.5 / FUEL_PER_DOLLAR):
+                    message = "Not enough money for refueling"
+                else:
+                    message = "Hold F to refuel"
+            else:
+                message = None
+            return [(message, 60)] if message else []
+
+        # Food message logic
+        if self.tile_category == "food":
+            if customer_in_car:
+                message = "Cannot eat customer in car"
+            elif self.hunger < self.max_hunger:
+                if self.money >= FOOD_PRICE:
+                    message = "Press F to eat"
+                else:
+                    message = "Not enough money for food"
+            else:
+                message = None
+            return [(message, 60)] if message else []
+
+        # Service message logic
+        if self.tile_category == "service":
+            if customer_in_car:
+                message = "Cannot upgrade customer in car"
+            elif self.car.max_speed >= max_speed_limit:
+                message = "Maximum speed reached"
+            elif self.money >= service_price:
+                message = f"Press F to upgrade speed (${service_price})"
+            else:
+                message = "Not enough money for upgrade"
+            return [(message, 120)]
+
+        return []
+
+    def draw_message(self, text, size, center, padding):
+        """Draws a message with a shadow on the dashboard background.
+
+        The rendered surfaces are cached per message, so showing the same
+        message again costs only the blits.
+
+        Args:
+            text (str): The message.
+            size (int): Font size.
+            center (tuple[int, int]): Screen position of the message's center.
+            padding (tuple[int, int]): Extra width and height of the background.
+        """
+
+        key = (text, size, padding)
+        surfaces = self.message_surfaces.get(key)
+        if surfaces is None:
+            font = self.get_font(size)
+            text_surface = font.render(text, True, (255, 255, 255))
+            shadow_surface = font.render(text, True, (40, 40, 40))
+            bg_size = (text_surface.get_width() + padding[0], text_surface.get_height() + padding[1])
+            bg_img = pygame.transform.scale(self.dashboard_bg_img, bg_size)
+            surfaces = (bg_img, shadow_surface, text_surface)
+            self.message_surfaces[key] = surfaces
+
+        bg_img, shadow_surface, text_surface = surfaces
+        screen = self.main.screen
+        text_rect = text_surface.get_rect(center=center)
+        self.main.renderer.add(screen.blit(bg_img, bg_img.get_rect(center=center)))
+        screen.blit(shadow_surface, text_rect.move(4, 4))
+        screen.blit(text_surface, text_rect)
+
+    def on_prompt_state_changed(self, **event):
+        """Marks the prompts for rebuilding."""
+
+        self.prompts_dirty = True
+
+    def on_handbrake_changed(self, engaged):
+        """Checks pickup and delivery when the car stops with the handbrake."""
+
+        self.prompts_dirty = True
+        if engaged:
+            self.check_job_progress()
+
+    def on_job_state_changed(self, state, previous):
+        """Checks whether the car already stands at the new stop."""
+
+        self.prompts_dirty = True
+        if state is not None:
+            self.check_job_progress()
+
+    def on_ride_requested(self, request):
+        """Shows the new customer waiting at the pickup tile."""
+
+        tile_x, tile_y = request.pickup_tile_loc
+        self.passenger_manager.add(request.id, tile_x * self.tile_size, tile_y * self.tile_size)
+
+    def on_ride_expired(self, request):
+        """Removes a customer who gave up waiting."""
+
+        self.passenger_manager.remove(request.id)
+
+    def now(self):
+        """Returns the game time in seconds (used by the dispatch engine)."""
+
+        return pygame.time.get_ticks() / 1000
+
     def new_job(self):
-        """Creates a new job by randomly selecting two pickup locations."""
+        """Takes the nearest open ride request from the dispatch engine as the current job.
 
-        # If there are not enough pickup locations, do not create a job
-        if len(self.pickup_tile_locations) < 2:
-            self.current_job = None
-            self.job_state = None
+        If no customer is waiting, there is no current job until one arrives.
+        """
+
+        self.current_job = None
+        self.current_request = None
+        self.job_state = None
+        if self.timed_job_timer is not None:
+            self.timers.cancel(self.timed_job_timer)
+            self.timed_job_timer = None
+
+        self.dispatch.update(self.now())
+        car_tile = (int(self.car.pos.x) // self.tile_size, int(self.car.pos.y) // self.tile_size)
+        matches = self.dispatch.match([("player", car_tile)])
+        if not matches:
             return
-        
+        request = matches[0][1]
+
         # Track job count and decide if it's a timed one
         self.job_counter += 1
-        # self.is_timed_job = (self.job_counter % self.timed_job_interval == 0)
-        self.is_timed_job = False
+        self.is_timed_job = (self.job_counter % self.timed_job_interval == 0)
         
         # Determine time limit if this is a timed job
         time_limit = self.timed_job_duration if self.is_timed_job else None
 
-        # Randomly select two different pickup locations for pickup and delivery
-        locs = random.sample(self.pickup_tile_locations, 2)
-        self.current_job = Job(locs[0], locs[1], is_timed=self.is_timed_job, time_limit=time_limit)
-
+        self.current_request = request
+        self.current_job = request.to_job(is_timed=self.is_timed_job, time_limit=time_limit)
         self.job_state = "pickup"
         self.pending_job = None
-        print(f"[JOB] New job created: {locs} | Timed: {self.is_timed_job}")
-
-        if self.pending_job:
-            self.current_job = self.pending_job
-            self.job_state = "pickup"
-            self.pending_job = None
+        print(f"[JOB] New job created: {[request.pickup_tile_loc, request.delivery_tile_loc]} | Timed: {self.is_timed_job}")
 
         # Start timer if job is timed
         if self.current_job.is_timed:
-            self.timed_job_timer = self.current_job.time_limit
-            print(f"[TIMER] Started countdown: {self.timed_job_timer}s")
+            self.timed_job_timer = self.timers.schedule(
+                self.current_job.time_limit,
+                on_expire=self.on_timed_job_expired,
+                bonus=self.calculate_timed_job_bonus
+            )
+            print(f"[TIMER] Started countdown: {self.current_job.time_limit}s")
+
+    def on_timed_job_expired(self, deadline):
+        """Called by the timers when the current timed job runs out of time."""
+
+        if self.current_job and self.current_job.is_timed and deadline is self.timed_job_timer:
+            self.current_job.time_remaining = 0
+            self.current_job.completed_in_time = False
+        self.timed_job_timer = None
+        print("[TIMER] Timed job expired — no bonus.")
 
+    def calculate_timed_job_bonus(self, remaining):
+        """Returns the bonus for finishing a timed job with the given seconds to spare."""
 
-    def _create_minimap(self):
-        """Creates the minimap surface from the tile_map."""
+        self.current_job.time_remaining = remaining
+        return int(self.timed_job_bonus * remaining / self.current_job.time_limit)
 
-        map_w = len(self.tile_map[0])
-        map_h = len(self.tile_map)
-        scale = self.minimap_scale
-        surf = pygame.Surface((int(map_w * scale), int(map_h * scale)))
-        surf.fill((30, 30, 30))
-        for y, row in enumerate(self.tile_map):
-            for x, tile_id in enumerate(row):
-                color = self.tile_colors.get(tile_id, (80, 80, 80))
-                rect = pygame.Rect(int(x * scale), int(y * scale), max(1, int(scale)), max(1, int(scale)))
-                surf.fill(color, rect)
-        return surf
+
+    def _build_minimap_icons(self):
+        """Builds the blit sequence of the pump, food and service icons on the minimap.
+
+        The icons only move when the map is edited, so the sequence is kept
+        and rebuilt only then.
+        """
+
+        icons = []
+        for locations, icon in (
+            (self.pump_tile_locations, self.pump_icon_img),
+            (self.food_tile_locations, self.food_icon_img),
+            (self.service_tile_locations, self.service_icon_img),
+        ):
+            for tx, ty in locations:
+                icon_x = int(tx * self.minimap_scale - icon.get_width() // 2)
+                icon_y = int(ty * self.minimap_scale - icon.get_height() // 2)
+                icons.append((icon, (icon_x, icon_y)))
+        return icons
+
+    def edit_map(self, changes):
+        """Changes tiles of the map while the game is running, e.g. to close a road or open a station.
+
+        Only the edited tiles are processed: the tile locations, walkability
+        and minimap are updated by the map index, the road network recomputes
+        just the affected area, and pickup tiles are added to or removed from
+        the dispatch.
+
+        Args:
+            changes: Iterable of (x, y, tile_id).
+
+        Returns:
+            MapChange: The tiles that actually changed.
+        """
+
+        change = self.map_index.set_tiles(changes)
+        if not change:
+            return change
+
+        self.road_network.tiles_changed(change.walkability)
+        self.dispatch.trip_distances = self.map_index.pickup_distances
+        for tile, category in change.removed:
+            if category == "pickup":
+                self.dispatch.remove_pickup_tile(tile)
+        for tile, category in change.added:
+            if category == "pickup":
+                self.dispatch.add_pickup_tile(tile)
+        if change.categories - {"pickup"}:
+            self.minimap_icons = self._build_minimap_icons()
+
+        self.main.renderer.invalidate()
+        self.events.publish(MAP_CHANGED, change=change)
+        return change
+
+    def draw_map(self, camera_x, camera_y, area=None):
+        """Draws the visible part of the tile map onto the screen.
+
+        Only the tiles intersecting the drawn area are visited, and all of them
+        are submitted to the screen with a single batched blit.
+
+        Args:
+            camera_x (float): The camera's x position in world space.
+            camera_y (float): The camera's y position in world space.
+            area (pygame.Rect, optional): Screen region to redraw. Defaults to the whole screen.
+        """
+
+        screen = self.main.screen
+        if area is None:
+            area = screen.get_rect()
+        else:
+            screen.set_clip(area)
+        screen.fill((50, 50, 50), area)
+
+        first_x = max(0, math.floor((camera_x + area.left) / self.tile_size))
+        last_x = min(len(self.tile_map[0]), math.ceil((camera_x + area.right) / self.tile_size))
+        first_y = max(0, math.floor((camera_y + area.top) / self.tile_size))
+        last_y = min(len(self.tile_map), math.ceil((camera_y + area.bottom) / self.tile_size))
+
+        atlas = self.tile_atlas.surface
+        rects = self.tile_atlas.rects
+        batch = self.map_batch
+        for y in range(first_y, last_y):
+            row = self.tile_map[y]
+            pos_y = y * self.tile_size - camera_y
+            for x in range(first_x, last_x):
+                tile_rect = rects.get(row[x])
+                if tile_rect:
+                    batch.add(atlas, (x * self.tile_size - camera_x, pos_y), tile_rect)
+        batch.flush(screen)
+        screen.set_clip(None)
 
     def is_walkable(self, x, y): 
         """Determines if a given world coordinate (x, y) is on a walkable tile.
@@ -246,28 +593,6 @@ class Game:
             return tile in self.WALKABLE_TILES
         return False
 
-    def is_on_pump_tile(self):
-        """Checks if the car is currently located on a pump tile.
-
-        Returns:
-            bool: True if car is on a pump tile, False otherwise.
-        """
-
-        car_tile_x = int(self.car.pos.x) // self.tile_size
-        car_tile_y = int(self.car.pos.y) // self.tile_size
-        return (car_tile_x, car_tile_y) in self.pump_tile_locations
-
-    def is_on_food_tile(self):
-        # Returns True if the car is currently on a food tile
-        car_tile_x = int(self.car.pos.x) // self.tile_size
-        car_tile_y = int(self.car.pos.y) // self.tile_size
-        return (car_tile_x, car_tile_y) in self.food_tile_locations
-
-    def is_on_service_tile(self):
-        car_tile_x = int(self.car.pos.x) // self.tile_size
-        car_tile_y = int(self.car.pos.y) // self.tile_size
-        return (car_tile_x, car_tile_y) in self.service_tile_locations
-
     def get_nearest_pump_tile(self):
         """Finds the nearest fuel pump to the car's current position.
 
@@ -300,16 +625,18 @@ class Game:
         MAX_SPEED_LIMIT = 16  # Prevent unlimited upgrades 16 = 80Km/h
 
         screen = self.main.screen
-        self.passenger_manager.update(dt)
 
         # Handle events (quit, handbrake, menu, FPS toggle, job accept)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                self.record_session("quit")
                 self.main.quit()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     self.car.toggle_handbrake()
+                    self.events.publish(HANDBRAKE_CHANGED, engaged=self.car.handbrake_engaged)
                 elif event.key == pygame.K_ESCAPE:
+                    self.record_session("quit")
                     from scenes.mainmenu import MainMenu
                     self.main.current_scene = MainMenu(self.main, skip_intro=True)
                 elif event.key == pygame.K_l:
@@ -321,60 +648,33 @@ class Game:
                         self.new_job()
                 elif event.key == pygame.K_F1:
                     self.show_help = not self.show_help
+                    self.main.renderer.invalidate()
 
         camera_x = max(0, min(self.car.pos.x - self.main.WIDTH // 2, self.MAP_WIDTH - self.main.WIDTH))
         camera_y = max(0, min(self.car.pos.y - self.main.HEIGHT // 2, self.MAP_HEIGHT - self.main.HEIGHT))
 
         keys = pygame.key.get_pressed()
         self.brake_pressed = keys[pygame.K_x]
+        previous_pos = pygame.Vector2(self.car.pos)
         self.car.update(self, camera_x, camera_y, keys)
-        self.passenger_group.update(dt)
-
-        # === Job Progress Logic ===
-        if self.current_job and self.job_state:
-            if self.job_state == "pickup":
-                # If at pickup location, handbrake is engaged, and car is stopped, switch to dropoff
-                if self.is_at_tile(self.current_job.pickup_tile_loc) and self.car.is_handbraking() and abs(self.car.speed) < 0.2:
-                    print("[JOB] Passenger picked up.")
-                    self.passenger_manager.remove_passenger()
-                    self.job_state = "dropoff"
-
-            elif self.job_state == "dropoff":
-                # If at delivery location, handbrake is engaged, and car is stopped, complete job and start new one
-                if self.is_at_tile(self.current_job.delivery_tile_loc) and self.car.is_handbraking() and abs(self.car.speed) < 0.2:
-                    print("[JOB] Passenger dropped off. Job complete.")
-
-                    # Calculate payment
-                    base_rate = 0.5  
-                    distance = self.current_job.distance(self.tile_size) / 100
-                    earned = int(base_rate * distance)
-                    self.money += earned
-                    self.customers_served += 1  # Increment score
-                    self.cash_animations.append({
-                        "text":f"+${earned}",
-                        "color": (0, 255, 100),  # green for earning
-                        "pos": pygame.Vector2(self.car.pos.x, self.car.pos.y - 50),
-                        "alpha": 255,
-                        "lifetime": 1.0 
-                    })
-
-                    if len(self.cash_animations) > 5:
-                        self.cash_animations.pop(0)
-
-                    # Clean up job
-                    self.passenger_manager.remove_passenger()
-                    self.job_state = None
-                    self.current_job = None
-                    if self.accepting_jobs:
-                        self.new_job()
-
-
-        # === Passenger Spawning via PassengerManager ===
-        if self.job_state == "pickup" and not self.passenger_manager.visible:
-            tile_x, tile_y = self.current_job.pickup_tile_loc
-            pixel_x = tile_x * self.tile_size
-            pixel_y = tile_y * self.tile_size
-            self.passenger_manager.start_entry_animation(pixel_x, pixel_y)
+        # Traffic cars block the player just like walls do
+        if self.traffic.blocks(self.car.pos, self.car.angle, previous_pos):
+            self.car.pos.update(previous_pos)
+            self.car.rect.center = (self.car.pos.x - camera_x, self.car.pos.y - camera_y)
+        view_rect = pygame.Rect(camera_x, camera_y, self.main.WIDTH, self.main.HEIGHT)
+        self.traffic.update(self.car, view_rect)
+        self.update_car_state()
+        self.distance_driven += self.car.pos.distance_to(previous_pos)
+
+        # After recovering (e.g. refueling), the next game-over is a new event to record
+        if self.car.fuel > 0 and self.hunger > 0:
+            self.session_recorded = False
+
+        # === Dispatch: ride requests arrive and expire even while the player is busy ===
+        if self.accepting_jobs and not self.current_job:
+            self.new_job()
+        else:
+            self.dispatch.update(self.now())
 
         # Refueling logic (now only allowed when no passenger is in the car)
         self.is_refueling = False
@@ -382,7 +682,7 @@ class Game:
         can_refuel = not (self.current_job and self.job_state == "dropoff")
 
         # --- Refueling session logic ---
-        if can_refuel and self.is_on_pump_tile() and self.car.is_handbraking():
+        if can_refuel and self.tile_category == "pump" and self.car.handbrake_engaged:
             if keys[pygame.K_f]:
                 self.is_refueling = True
                 if self.tank_session is None:
@@ -395,52 +695,29 @@ class Game:
                 # Only add fuel if enough money and not full and fuel_to_add > 0
                 if self.car.fuel < self.car.max_fuel and self.money >= cost and fuel_to_add > 0:
                     self.car.fuel += fuel_to_add
+                    self.fuel_bought += fuel_to_add
                     self.money -= cost  # Money is deducted immediately for precise control
                     self.tank_session["fuel_added"] += fuel_to_add
                     self.tank_session["cost"] += cost
                 # If can't afford next step or no fuel to add, finish session and show animation
                 if fuel_to_add <= 0 or self.money < (0.5 / FUEL_PER_DOLLAR):
                     if self.tank_session and self.tank_session["fuel_added"] > 0:
-                        self.cash_animations.append({
-                            "text": f"-${int(round(self.tank_session['cost']))}",
-                            "color": (255, 40, 40),
-                            "pos": pygame.Vector2(self.car.pos.x, self.car.pos.y - 80),
-                            "alpha": 200,
-                            "lifetime": 0.7
-                        })
+                        self.floating_texts.spawn(f"-${int(round(self.tank_session['cost']))}", (255, 40, 40), self.car.pos.x, self.car.pos.y - 80, alpha=200, lifetime=0.7)
                     self.tank_session = None
             else:
                 # F released or not pressed
                 if self.tank_session and self.tank_session["fuel_added"] > 0:
-                    self.cash_animations.append({
-                        "text": f"-${int(round(self.tank_session['cost']))}",
-                        "color": (255, 40, 40),
-                        "pos": pygame.Vector2(self.car.pos.x, self.car.pos.y - 80),
-                        "alpha": 200,
-                        "lifetime": 0.7
-                    })
+                    self.floating_texts.spawn(f"-${int(round(self.tank_session['cost']))}", (255, 40, 40), self.car.pos.x, self.car.pos.y - 80, alpha=200, lifetime=0.7)
                 self.tank_session = None
         else:
             # Not on pump or can't refuel
             if self.tank_session and self.tank_session["fuel_added"] > 0:
-                self.cash_animations.append({
-                    "text": f"-${int(round(self.tank_session['cost']))}",
-                    "color": (255, 40, 40),
-                    "pos": pygame.Vector2(self.car.pos.x, self.car.pos.y - 80),
-                    "alpha": 200,
-                    "lifetime": 0.7
-                })
+                self.floating_texts.spawn(f"-${int(round(self.tank_session['cost']))}", (255, 40, 40), self.car.pos.x, self.car.pos.y - 80, alpha=200, lifetime=0.7)
             self.tank_session = None
 
         # If tank is full during refueling, finish session and show animation
         if self.tank_session and self.car.fuel >= self.car.max_fuel and self.tank_session["fuel_added"] > 0:
-            self.cash_animations.append({
-                "text": f"-${int(round(self.tank_session['cost']))}",
-                "color": (255, 40, 40),
-                "pos": pygame.Vector2(self.car.pos.x, self.car.pos.y - 80),
-                "alpha": 200,
-                "lifetime": 0.7
-            })
+            self.floating_texts.spawn(f"-${int(round(self.tank_session['cost']))}", (255, 40, 40), self.car.pos.x, self.car.pos.y - 80, alpha=200, lifetime=0.7)
             self.tank_session = None
 
         # === Hunger logic ===
@@ -452,8 +729,8 @@ class Game:
         self.is_eating = False
         FOOD_PRICE = 20
         can_eat = (
-            self.is_on_food_tile()
-            and self.car.is_handbraking()
+            self.tile_category == "food"
+            and self.car.handbrake_engaged
             and self.money >= FOOD_PRICE
             and not (self.current_job and self.job_state == "dropoff")  # No customer in car
         )
@@ -462,71 +739,44 @@ class Game:
                 self.is_eating = True
                 self.hunger = self.max_hunger
                 self.money -= FOOD_PRICE
-                self.cash_animations.append({
-                    "text": f"-${FOOD_PRICE}",
-                    "color": (255, 40, 40),
-                    "pos": pygame.Vector2(self.car.pos.x, self.car.pos.y - 110),
-                    "alpha": 200,
-                    "lifetime": 0.7
-                })
+                self.floating_texts.spawn(f"-${FOOD_PRICE}", (255, 40, 40), self.car.pos.x, self.car.pos.y - 110, alpha=200, lifetime=0.7)
 
         # === Out of hunger (starvation) ===
         if self.hunger <= 0:
-            self.save_high_score()
+            self.record_session("starved")
             self.car.speed = 0  # Stop the car
             # Show "STARVED TO DEATH" message in the center of the screen
-            message = "STARVED TO DEATH"
-            font = pygame.font.Font(self.font_path, 64)
-            text_color = (255, 255, 255)
-            shadow_color = (40, 40, 40)
-            text_surface = font.render(message, True, text_color)
-            shadow_surface = font.render(message, True, shadow_color)
-            screen_rect = self.main.screen.get_rect()
-            text_rect = text_surface.get_rect(center=screen_rect.center)
-            shadow_rect = text_rect.copy()
-            shadow_rect.x += 4
-            shadow_rect.y += 4
-
-            bg_width = text_rect.width + 80
-            bg_height = text_rect.height + 60
-            bg_img = pygame.transform.scale(self.dashboard_bg_img, (bg_width, bg_height))
-            bg_rect = bg_img.get_rect(center=screen_rect.center)
-            self.main.screen.blit(bg_img, bg_rect)
-
-            self.main.screen.blit(shadow_surface, shadow_rect)
-            self.main.screen.blit(text_surface, text_rect)
-
-            pygame.display.flip()
+            self.draw_message("STARVED TO DEATH", 64, self.main.screen.get_rect().center, (80, 60))
+
+            self.main.renderer.present()
             return  # Skip rest of loop if dead
         
-        # === Timed Job Countdown ===
-        if self.current_job and self.current_job.is_timed and self.timed_job_timer is not None:
-            self.timed_job_timer -= dt
-            if self.timed_job_timer <= 0:
-                self.timed_job_timer = None
-                print("[TIMER] Timed job expired — no bonus.")
-
-
-        # Draw game map
-        screen.fill((50, 50, 50))
-        for y, row in enumerate(self.tile_map):
-            for x, tile_id in enumerate(row):
-                pos = (x * self.tile_size - camera_x, y * self.tile_size - camera_y)
-                tile_img = self.tile_images.get(tile_id)
-                if tile_img and pos[0] > -self.tile_size and pos[0] < self.main.WIDTH and pos[1] > -self.tile_size and pos[1] < self.main.HEIGHT:
-                    screen.blit(tile_img, pos)
-
-        self.sprites.draw(screen)
+        # === Timed Job Deadlines ===
+        self.timers.poll()
+
+
+        # Draw game map. The whole map is redrawn only when the camera moves,
+        # otherwise just the regions covered by the HUD and sprites last frame are restored.
+        renderer = self.main.renderer
+        if (camera_x, camera_y) != self.last_camera or self.show_help:
+            renderer.invalidate()
+            self.last_camera = (camera_x, camera_y)
+        if renderer.needs_full_redraw():
+            self.draw_map(camera_x, camera_y)
+        else:
+            for rect in renderer.previous_rects:
+                self.draw_map(camera_x, camera_y, rect)
 
         # Draw FPS only if toggled on
         if self.show_fps:
             fps_text = f"FPS: {self.main.clock.get_fps():.0f}"
             fps_shadow = self.small_font.render(fps_text, True, (40, 40, 40))
             fps_surface = self.small_font.render(fps_text, True, (0, 255, 0))
-            screen.blit(fps_shadow, (2, 2))
-            screen.blit(fps_surface, (0, 0))
+            renderer.add(screen.blit(fps_shadow, (2, 2)))
+            renderer.add(screen.blit(fps_surface, (0, 0)))
 
         self.draw_dashboard()
+        self.floating_texts.update(dt / 1000)
         self.draw_minimap()  # Draw the minimap
 
         # === ARROW TO CURRENT JOB TARGET ===
@@ -558,144 +808,25 @@ class Game:
                      arrow_center.y - math.sin(math.radians(angle - 140)) * (arrow_size // 2)),
                 ]
                 shadow_points = [(x+3, y+3) for x, y in points]
-                pygame.draw.polygon(screen, (40, 40, 40), shadow_points)
-                pygame.draw.polygon(screen, arrow_color, points)
+                renderer.add(pygame.draw.polygon(screen, (40, 40, 40), shadow_points))
+                renderer.add(pygame.draw.polygon(screen, arrow_color, points))
 
         # OUT OF FUEL MESSAGE
         if self.car.fuel <= 0:
-            self.save_high_score()
+            self.record_session("out_of_fuel")
             # Show "OUT OF FUEL" message in the center of the screen
-            message = "OUT OF FUEL"
-            font = pygame.font.Font(self.font_path, 64)
-            text_color = (255, 255, 255)
-            shadow_color = (40, 40, 40)
-            text_surface = font.render(message, True, text_color)
-            shadow_surface = font.render(message, True, shadow_color)
-            screen_rect = self.main.screen.get_rect()
-            text_rect = text_surface.get_rect(center=screen_rect.center)
-            shadow_rect = text_rect.copy()
-            shadow_rect.x += 4
-            shadow_rect.y += 4
-
-            bg_width = text_rect.width + 80
-            bg_height = text_rect.height + 60
-            bg_img = pygame.transform.scale(self.dashboard_bg_img, (bg_width, bg_height))
-            bg_rect = bg_img.get_rect(center=screen_rect.center)
-            self.main.screen.blit(bg_img, bg_rect)
-
-            self.main.screen.blit(shadow_surface, shadow_rect)
-            self.main.screen.blit(text_surface, text_rect)
-
-        # === REFUEL & FOOD MESSAGES (above dashboard, English, with all conditions) ===
-        FUEL_PER_DOLLAR = 2.0
-        FOOD_PRICE = 20
+            self.draw_message("OUT OF FUEL", 64, self.main.screen.get_rect().center, (80, 60))
 
-        # Refuel message logic
-        if self.is_on_pump_tile() and self.car.is_handbraking():
-            if self.current_job and self.job_state == "dropoff":
-                message = "Cannot refuel customer in car"
-            elif self.car.fuel < self.car.max_fuel:
-                if self.money < (0.5 / FUEL_PER_DOLLAR):
-                    message = "Not enough money for refueling"
-                else:
-                    message = "Hold F to refuel"
-            else:
-                message = None
-            if message:
-                font = pygame.font.Font(self.font_path, 40)
-                text_color = (255, 255, 255)
-                shadow_color = (40, 40, 40)
-                text_surface = font.render(message, True, text_color)
-                shadow_surface = font.render(message, True, shadow_color)
-                screen_rect = self.main.screen.get_rect()
-                text_rect = text_surface.get_rect()
-                group_center = (screen_rect.centerx, screen_rect.height - 60)
-                text_rect.center = group_center
-                shadow_rect = text_rect.copy()
-                shadow_rect.x += 4
-                shadow_rect.y += 4
-
-                bg_width = text_rect.width + 60
-                bg_height = text_rect.height + 30
-                bg_img = pygame.transform.scale(self.dashboard_bg_img, (bg_width, bg_height))
-                bg_rect = bg_img.get_rect()
-                bg_rect.center = group_center
-                self.main.screen.blit(bg_img, bg_rect)
-
-                self.main.screen.blit(shadow_surface, shadow_rect)
-                self.main.screen.blit(text_surface, text_rect)
-
-        # Food message logic
-        if self.is_on_food_tile() and self.car.is_handbraking():
-            if self.current_job and self.job_state == "dropoff":
-                message = "Cannot eat customer in car"
-            elif self.hunger < self.max_hunger:
-                if self.money >= FOOD_PRICE:
-                    message = "Press F to eat"
-                else:
-                    message = "Not enough money for food"
-            else:
-                message = None
-            if message:
-                font = pygame.font.Font(self.font_path, 40)
-                text_color = (255, 255, 255)
-                shadow_color = (40, 40, 40)
-                text_surface = font.render(message, True, text_color)
-                shadow_surface = font.render(message, True, shadow_color)
-                screen_rect = self.main.screen.get_rect()
-                text_rect = text_surface.get_rect()
-                group_center = (screen_rect.centerx, screen_rect.height - 60)
-                text_rect.center = group_center
-                shadow_rect = text_rect.copy()
-                shadow_rect.x += 4
-                shadow_rect.y += 4
-
-                bg_width = text_rect.width + 60
-                bg_height = text_rect.height + 30
-                bg_img = pygame.transform.scale(self.dashboard_bg_img, (bg_width, bg_height))
-                bg_rect = bg_img.get_rect()
-                bg_rect.center = group_center
-                self.main.screen.blit(bg_img, bg_rect)
-
-                self.main.screen.blit(shadow_surface, shadow_rect)
-                self.main.screen.blit(text_surface, text_rect)
-
-        # Service message logic
-        if self.is_on_service_tile() and self.car.is_handbraking():
-            if self.current_job and self.job_state == "dropoff":
-                message = "Cannot upgrade customer in car"
-            elif self.car.max_speed >= MAX_SPEED_LIMIT:
-                message = "Maximum speed reached"
-            elif self.money >= SERVICE_PRICE:
-                message = "Press F to upgrade speed ($20)"
-            else:
-                message = "Not enough money for upgrade"
-            if message:
-                font = pygame.font.Font(self.font_path, 40)
-                text_color = (255, 255, 255)
-                shadow_color = (40, 40, 40)
-                text_surface = font.render(message, True, text_color)
-                shadow_surface = font.render(message, True, shadow_color)
-                screen_rect = self.main.screen.get_rect()
-                text_rect = text_surface.get_rect()
-                group_center = (screen_rect.centerx, screen_rect.height - 120)
-                text_rect.center = group_center
-                shadow_rect = text_rect.copy()
-                shadow_rect.x += 4
-                shadow_rect.y += 4
-
-                bg_width = text_rect.width + 60
-                bg_height = text_rect.height + 30
-                bg_img = pygame.transform.scale(self.dashboard_bg_img, (bg_width, bg_height))
-                bg_rect = bg_img.get_rect()
-                bg_rect.center = group_center
-                self.main.screen.blit(bg_img, bg_rect)
-
-                self.main.screen.blit(shadow_surface, shadow_rect)
-                self.main.screen.blit(text_surface, text_rect)
+        # === REFUEL, FOOD & SERVICE PROMPTS (above dashboard) ===
+        if self.prompts_dirty:
+            self.prompts = self.build_prompts(SERVICE_PRICE, MAX_SPEED_LIMIT)
+            self.prompts_dirty = False
+        screen_rect = screen.get_rect()
+        for message, bottom_offset in self.prompts:
+            self.draw_message(message, 40, (screen_rect.centerx, screen_rect.height - bottom_offset), (60, 30))
 
         # FUEL ARROW TO PUMP
-        if 0 < self.car.fuel < 30 and self.pump_tile_locations:
+        if self.fuel_low and self.car.fuel > 0 and self.pump_tile_locations:
             # Show arrow to nearest pump if fuel is low
             nearest_pump = self.get_nearest_pump_tile()
             if nearest_pump:
@@ -723,21 +854,23 @@ class Game:
                     ]
                     # Draw shadow under the arrow first
                     shadow_points = [(x+3, y+3) for x, y in points]
-                    pygame.draw.polygon(screen, (40, 40, 40), shadow_points)
+                    renderer.add(pygame.draw.polygon(screen, (40, 40, 40), shadow_points))
                     # Then draw the red arrow
-                    pygame.draw.polygon(screen, (220, 40, 40), points)
+                    renderer.add(pygame.draw.polygon(screen, (220, 40, 40), points))
 
         self.passenger_manager.update(dt)
-        self.passenger_manager.draw(screen, camera_x, camera_y)
+        self.passenger_manager.draw(screen, camera_x, camera_y, self.sprite_batch)
 
         # Draw the game objects
-        self.sprites.draw(screen)
-        self.passenger_group.draw(screen)  # Draw the passenger
+        self.traffic.draw(self.sprite_batch, camera_x, camera_y, view_rect)
+        for sprite in self.sprites:
+            self.sprite_batch.add(sprite.image, sprite.rect)
+        self.sprite_batch.flush(screen, renderer)
 
         # === Service upgrade logic ===
         can_upgrade = (
-            self.is_on_service_tile()
-            and self.car.is_handbraking()
+            self.tile_category == "service"
+            and self.car.handbrake_engaged
             and self.money >= SERVICE_PRICE
             and not (self.current_job and self.job_state == "dropoff")
             and self.car.max_speed < MAX_SPEED_LIMIT
@@ -745,19 +878,14 @@ class Game:
         if can_upgrade and keys[pygame.K_f]:
             self.car.max_speed = min(self.car.max_speed + SPEED_BOOST, MAX_SPEED_LIMIT)
             self.money -= SERVICE_PRICE
-            self.cash_animations.append({
-                "text": f"-${SERVICE_PRICE}",
-                "color": (40, 180, 255),
-                "pos": pygame.Vector2(self.car.pos.x, self.car.pos.y - 140),
-                "alpha": 200,
-                "lifetime": 0.7
-            })
+            self.floating_texts.spawn(f"-${SERVICE_PRICE}", (40, 180, 255), self.car.pos.x, self.car.pos.y - 140, alpha=200, lifetime=0.7)
         
         # === Draw Timer ===
         if self.current_job and self.current_job.is_timed and self.timed_job_timer is not None:
-            timer_surface = self.font_big.render(f"{(self.timed_job_timer/1000):.1f}s", True, (240, 0, 0))
+            remaining = self.timers.remaining(self.timed_job_timer)
+            timer_surface = self.font_big.render(f"{remaining:.1f}s", True, (240, 0, 0))
             timer_rect = timer_surface.get_rect(center=(self.main.WIDTH // 2, 60))
-            screen.blit(timer_surface, timer_rect)
+            renderer.add(screen.blit(timer_surface, timer_rect))
 
         # Render car hitbox for debugging
         if False and self.car.collision_points is not None:
@@ -770,33 +898,57 @@ class Game:
             self.draw_help_overlay()
         else:
             #  Draw the help text in the top-right corner
-            font = pygame.font.Font(self.font_path, 28)
-            text = "Press F1 for help"
-            surface = font.render(text, True, (255, 255, 255))
-            shadow = font.render(text, True, (40, 40, 40))
+            surface, shadow = self.render_hud_text("help", "Press F1 for help", 28)
             x = self.main.WIDTH - surface.get_width() - 40
             y = 30
-            self.main.screen.blit(shadow, (x + 2, y + 2))
-            self.main.screen.blit(surface, (x, y))
-
-        pygame.display.flip()
-
-    def save_high_score(self):
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        score_file = os.path.join(base_path, "highscore.txt")
-        try:
-            # When file exists, read the old score
-            if os.path.exists(score_file):
-                with open(score_file, "r") as f:
-                    old_score = int(f.read().strip())
-            else:
-                old_score = 0
-            # Save only if the new score is higher
-            if self.customers_served > old_score:
-                with open(score_file, "w") as f:
-                    f.write(str(self.customers_served))
-        except Exception as e:
-            print(f"Error saving score: {e}")
+            renderer.add(self.main.screen.blit(shadow, (x + 2, y + 2)))
+            renderer.add(self.main.screen.blit(surface, (x, y)))
+
+        renderer.present()
+
+    def record_session(self, cause):
+        """Stores the session stats, once per game-over event.
+
+        The score is submitted only when the game is over (out of fuel or
+        starved), not when the player quits an unfinished game. The write
+        itself happens on the store's background thread.
+
+        Args:
+            cause (str): Why the session ended (``"out_of_fuel"``, ``"starved"`` or ``"quit"``).
+        """
+
+        if self.session_recorded:
+            return
+        self.session_recorded = True
+        self.main.high_scores.record_session(
+            self.session_id, cause, self.customers_served,
+            self.money_earned, self.distance_driven, self.fuel_bought
+        )
+        if cause != "quit":
+            self.main.high_scores.submit(self.customers_served)
+
+    def render_hud_text(self, slot, text, size, color=(255, 255, 255)):
+        """Returns the text and shadow surfaces of a HUD element.
+
+        The surfaces are kept per HUD slot and rendered again only when the
+        text or color of the slot changes.
+
+        Args:
+            slot (str): Name of the HUD element.
+            text (str): The text to show.
+            size (int): Font size.
+            color (tuple[int, int, int]): Text color, the shadow is dark grey.
+
+        Returns:
+            tuple[pygame.Surface, pygame.Surface]: The text and shadow surfaces.
+        """
+
+        cached = self.hud_text.get(slot)
+        if cached is None or cached[0] != (text, size, color):
+            font = self.get_font(size)
+            cached = ((text, size, color), font.render(text, True, color), font.render(text, True, (40, 40, 40)))
+            self.hud_text[slot] = cached
+        return cached[1], cached[2]
 
     def draw_dashboard(self):
         """Draws the lower-left dashboard area of the screen, including:
@@ -810,8 +962,10 @@ class Game:
         dash_rect = pygame.Rect(20, self.main.screen.get_height() - 220, 240, 200)
         dash_bg_rect = dash_rect.inflate(24, 32)
 
-        dashboard_bg_scaled = pygame.transform.scale(self.dashboard_bg_img, (dash_bg_rect.width, dash_bg_rect.height))
-        self.main.screen.blit(dashboard_bg_scaled, dash_bg_rect.topleft)
+        if self.dashboard_bg_scaled is None:
+            self.dashboard_bg_scaled = pygame.transform.scale(self.dashboard_bg_img, (dash_bg_rect.width, dash_bg_rect.height))
+        self.main.screen.blit(self.dashboard_bg_scaled, dash_bg_rect.topleft)
+        self.main.renderer.add(dash_bg_rect)
 
         center_x = dash_bg_rect.x + dash_bg_rect.width // 2
 
@@ -821,17 +975,10 @@ class Game:
         fuel_label = "Fuel"
         hunger_label = "Hunger"
 
-        font_speed = pygame.font.Font(self.font_path, 36)
-        font_fuel = pygame.font.Font(self.font_path, 24)
-        font_hunger = pygame.font.Font(self.font_path, 24)
-
-        # Render text surfaces and their shadows
-        speed_surface = font_speed.render(speed_text, True, (255, 255, 255))
-        speed_shadow = font_speed.render(speed_text, True, (40, 40, 40))
-        fuel_surface = font_fuel.render(fuel_label, True, (255, 255, 255))
-        fuel_shadow = font_fuel.render(fuel_label, True, (40, 40, 40))
-        hunger_surface = font_hunger.render(hunger_label, True, (255, 255, 255))
-        hunger_shadow = font_hunger.render(hunger_label, True, (40, 40, 40))
+        # Text surfaces and their shadows, re-rendered only when the text changes
+        speed_surface, speed_shadow = self.render_hud_text("speed", speed_text, 36)
+        fuel_surface, fuel_shadow = self.render_hud_text("fuel", fuel_label, 24)
+        hunger_surface, hunger_shadow = self.render_hud_text("hunger", hunger_label, 24)
 
         # Calculate vertical positions for centering (now with more space)
         total_height = (
@@ -904,9 +1051,7 @@ class Game:
             circle_x = dash_rect.right - 30
             circle_y = dash_rect.y + 30
             pygame.draw.circle(self.main.screen, (200, 0, 0), (circle_x, circle_y), 16)
-            font_p = pygame.font.Font(self.font_path, 24)
-            p_surface = font_p.render("P", True, (255, 255, 255))
-            p_shadow = font_p.render("P", True, (40, 40, 40))
+            p_surface, p_shadow = self.render_hud_text("handbrake", "P", 24)
             px = circle_x - p_surface.get_width() // 2
             py = circle_y - p_surface.get_height() // 2
             self.main.screen.blit(p_shadow, (px + 2, py + 2))
@@ -914,69 +1059,46 @@ class Game:
 
         # === Display Cash ===
         cash_text = f"${int(self.money)}"
-        font_cash = pygame.font.Font(self.font_path, 36)
-
-        cash_surface = font_cash.render(cash_text, True, (255, 255, 255))
-        cash_shadow = font_cash.render(cash_text, True, (40, 40, 40))
+        cash_surface, cash_shadow = self.render_hud_text("cash", cash_text, 36)
 
         cash_x = 20
         cash_y = 20
 
-        self.main.screen.blit(cash_shadow, (cash_x + 2, cash_y + 2))
-        self.main.screen.blit(cash_surface, (cash_x, cash_y))
+        self.main.renderer.add(self.main.screen.blit(cash_shadow, (cash_x + 2, cash_y + 2)))
+        self.main.renderer.add(self.main.screen.blit(cash_surface, (cash_x, cash_y)))
 
         # === Display Score (Customers Served) ===
         score_text = f"Score: {self.customers_served}"
-        font_score = pygame.font.Font(self.font_path, 28)
-        score_surface = font_score.render(score_text, True, (252, 186, 3))
-        score_shadow = font_score.render(score_text, True, (40, 40, 40))
+        score_surface, score_shadow = self.render_hud_text("score", score_text, 28, (252, 186, 3))
         score_x = 20
         score_y = cash_y + cash_surface.get_height() + 8
-        self.main.screen.blit(score_shadow, (score_x + 2, score_y + 2))
-        self.main.screen.blit(score_surface, (score_x, score_y))
+        self.main.renderer.add(self.main.screen.blit(score_shadow, (score_x + 2, score_y + 2)))
+        self.main.renderer.add(self.main.screen.blit(score_surface, (score_x, score_y)))
 
         # === Display Customer Status ===
         if self.current_job and self.job_state == "dropoff":
             customer_status = "Customer: IN CAR"
         else:
             customer_status = "Customer: NONE"
-        font_cust = pygame.font.Font(self.font_path, 24)
-        cust_surface = font_cust.render(customer_status, True, (255, 255, 255))
-        cust_shadow = font_cust.render(customer_status, True, (40, 40, 40))
+        cust_surface, cust_shadow = self.render_hud_text("customer", customer_status, 24)
         cust_x = 20
         cust_y = score_y + score_surface.get_height() + 4
-        self.main.screen.blit(cust_shadow, (cust_x + 2, cust_y + 2))
-        self.main.screen.blit(cust_surface, (cust_x, cust_y))
+        self.main.renderer.add(self.main.screen.blit(cust_shadow, (cust_x + 2, cust_y + 2)))
+        self.main.renderer.add(self.main.screen.blit(cust_surface, (cust_x, cust_y)))
 
         # === Display Accepting Jobs Status ===
         jobs_status = "Accepting jobs: ON" if self.accepting_jobs else "Accepting jobs: OFF"
         jobs_color = (252, 186, 3) if self.accepting_jobs else (180, 60, 60)
-        font_jobs = pygame.font.Font(self.font_path, 22)
-        jobs_surface = font_jobs.render(jobs_status, True, jobs_color)
-        jobs_shadow = font_jobs.render(jobs_status, True, (40, 40, 40))
+        jobs_surface, jobs_shadow = self.render_hud_text("jobs", jobs_status, 22, jobs_color)
         jobs_x = 20
         jobs_y = cust_y + cust_surface.get_height() + 4
-        self.main.screen.blit(jobs_shadow, (jobs_x + 2, jobs_y + 2))
-        self.main.screen.blit(jobs_surface, (jobs_x, jobs_y))
+        self.main.renderer.add(self.main.screen.blit(jobs_shadow, (jobs_x + 2, jobs_y + 2)))
+        self.main.renderer.add(self.main.screen.blit(jobs_surface, (jobs_x, jobs_y)))
 
         # === Floating Money Animation ===
-        for anim in self.cash_animations[:]:
-            font_float = pygame.font.Font(self.font_path, 28)
-            # Use color from animation dict, fallback to green if not present
-            color = anim.get("color", (0, 255, 100))
-            surface = font_float.render(anim["text"], True, color)
-            surface.set_alpha(anim["alpha"])
-            screen_x = anim["pos"].x - self.car.pos.x + self.main.WIDTH // 2
-            screen_y = anim["pos"].y - self.car.pos.y + self.main.HEIGHT // 2
-            self.main.screen.blit(surface, (screen_x, screen_y))
-
-            # Animate upward
-            anim["pos"].y -= 0.5
-            anim["lifetime"] -= 1 / 60
-            anim["alpha"] = max(0, int(anim["alpha"] - 5))
-
-            if anim["lifetime"] <= 0 or anim["alpha"] <= 0:
-                self.cash_animations.remove(anim)
+        camera_x = self.car.pos.x - self.main.WIDTH // 2
+        camera_y = self.car.pos.y - self.main.HEIGHT // 2
+        self.floating_texts.draw(self.main.screen, camera_x, camera_y, self.main.renderer)
 
     def draw_minimap(self):
         """Displays the minimap in the bottom right corner and highlights the car position, current target, and pump/food/service icons."""
@@ -986,23 +1108,8 @@ class Game:
         car_y = int(self.car.pos.y / self.tile_size * scale)
         pygame.draw.circle(minimap, (255, 0, 0), (car_x, car_y), max(3, int(3 * scale)))
 
-        # Draw pump icons on minimap
-        for tx, ty in self.pump_tile_locations:
-            icon_x = int(tx * scale - self.pump_icon_img.get_width() // 2)
-            icon_y = int(ty * scale - self.pump_icon_img.get_height() // 2)
-            minimap.blit(self.pump_icon_img, (icon_x, icon_y))
-
-        # Draw food icons on minimap
-        for tx, ty in self.food_tile_locations:
-            icon_x = int(tx * scale - self.food_icon_img.get_width() // 2)
-            icon_y = int(ty * scale - self.food_icon_img.get_height() // 2)
-            minimap.blit(self.food_icon_img, (icon_x, icon_y))
-
-        # Draw service icons on minimap
-        for tx, ty in self.service_tile_locations:
-            icon_x = int(tx * scale - self.service_icon_img.get_width() // 2)
-            icon_y = int(ty * scale - self.service_icon_img.get_height() // 2)
-            minimap.blit(self.service_icon_img, (icon_x, icon_y))
+        # Draw pump, food and service icons on minimap
+        minimap.blits(self.minimap_icons, doreturn=False)
 
         # Show only the current target (pickup or dropoff)
         if self.current_job is not None and self.job_state:
@@ -1021,6 +1128,7 @@ class Game:
         border_rect = minimap_rect.inflate(16, 16)
         pygame.draw.rect(self.main.screen, border_color, border_rect, border_radius=12)
         pygame.draw.rect(self.main.screen, border_color, border_rect, width=6, border_radius=12)
+        self.main.renderer.add(border_rect)
 
         # Center minimap inside the border
         minimap_center_x = border_rect.x + (border_rect.width - minimap_rect.width) // 2
@@ -1066,12 +1174,17 @@ class Game:
         """
 
         # Use Kenney_Future font for all text
-        font = pygame.font.Font(self.font_path, size)
+        font = self.get_font(size)
         surface = font.render(text, True, color)
         self.main.screen.blit(surface, (x, y))
 
     def draw_help_overlay(self):
         """Draws a semi-transparent help overlay over the entire screen with colored keys and headings."""
+        # The help never changes, so it is rendered only the first time
+        if self.help_overlay is not None:
+            self.main.screen.blit(self.help_overlay, (0, 0))
+            return
+
         overlay = pygame.Surface((self.main.WIDTH, self.main.HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 200))  # Semi-transparent black
 
@@ -1115,7 +1228,7 @@ class Game:
             [("Press F1 to close this help.", white)]
         ]
 
-        font = pygame.font.Font(self.font_path, 24)
+        font = self.get_font(24)
         y = 80
         for line in help_lines:
             if not line:
@@ -1137,4 +1250,5 @@ class Game:
                 x += surf.get_width()
             y += font.get_height() + 6
 
+        self.help_overlay = overlay
         self.main.screen.blit(overlay, (0, 0))
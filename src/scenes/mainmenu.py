@@ -45,14 +45,7 @@ class MainMenu():
 
         # --- Reset High Score Button (directly under PLAY, same style/size) ---
         def reset_high_score():
-            base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            score_file = os.path.join(base_path, "highscore.txt")
-            try:
-                with open(score_file, "w") as f:
-                    f.write("0")
-            except Exception as e:
-                print(f"Error resetting high score: {e}")
-            self.high_score = 0
+            self.main.high_scores.reset()
 
         blue_icon = os.path.join(base_path, "tiles/menu/button_round_flat.png")
         if not os.path.exists(blue_icon):
@@ -95,18 +88,50 @@ class MainMenu():
         )
         self.buttons.add(exit_button)
 
-        self.high_score = self.load_high_score()
+        # --- Intro texts (fonts and surfaces are rendered once, only alpha changes per frame) ---
+        authors = [
+            "Jiří Hošek",
+            "Martin Nebehay",
+            "Jiří Mrkvica",
+            "Samuel Všelko"
+        ]
+        present_text = "present the game..."
+        authors_font = pygame.font.SysFont(None, 36)
+        studio_font = pygame.font.SysFont(None, 48)
+        present_font = pygame.font.SysFont(None, 32)
+        self.studio_surfaces = self._render_with_shadow(studio_font, "Team 12 - summer 2025", (252, 186, 3))
+        self.author_surfaces = [self._render_with_shadow(authors_font, author, (252, 186, 3)) for author in authors]
+        self.present_surfaces = self._render_with_shadow(present_font, present_text, (252, 186, 3))
+
+        # --- Title and high score ---
+        self.title_surface, self.title_shadow = self._render_with_shadow(self.title_font, self.title_text, self.title_color)
+        self.high_score_font = pygame.font.SysFont(None, 48)
+        self.main.high_scores.subscribe(self.on_high_score_changed)
+        self.on_high_score_changed(self.main.high_scores.value)
+
+        # A new scene always starts with a full redraw
+        self.main.renderer.invalidate()
+
+    def _render_with_shadow(self, font, text, color):
+        """Renders a text and its dark shadow.
+
+        Returns:
+            tuple: (text surface, shadow surface)
+        """
+
+        return font.render(text, True, color), font.render(text, True, (40, 40, 40))
+
+    def on_high_score_changed(self, high_score):
+        """Re-renders the high score text when the stored high score changes.
 
-    def load_high_score(self):
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        score_file = os.path.join(base_path, "highscore.txt")
-        try:
-            if os.path.exists(score_file):
-                with open(score_file, "r") as f:
-                    return int(f.read().strip())
-        except Exception as e:
-            print(f"Error loading high score: {e}")
-        return 0
+        Args:
+            high_score (int): The new high score.
+        """
+
+        self.high_score = high_score
+        self.high_score_surface, self.high_score_shadow = self._render_with_shadow(
+            self.high_score_font, f"High Score: {self.high_score}", (255, 255, 255)
+        )
 
     def loop(self, dt):
         """Performs the Event, Update, Render cycle.
@@ -116,6 +141,7 @@ class MainMenu():
         """
 
         screen = self.main.screen
+        renderer = self.main.renderer
 
         # Event
         for event in pygame.event.get():
@@ -136,95 +162,80 @@ class MainMenu():
 
         self.buttons.update()
 
-        # Render background image
-        screen.blit(self.background, (0, 0))
+        # Render background image (only under the regions drawn last frame if nothing else changed)
+        if renderer.needs_full_redraw():
+            screen.blit(self.background, (0, 0))
+        else:
+            for rect in renderer.previous_rects:
+                screen.blit(self.background, rect, rect)
 
         if intro:
             # --- Custom intro animation ---
             studio_fadein = 1000
             author_fadein = 800
             fade_time = 500
-            authors = [
-                "Jiří Hošek",
-                "Martin Nebehay",
-                "Jiří Mrkvica",
-                "Samuel Všelko"
-            ]
-            present_text = "present the game..."
-            authors_font = pygame.font.SysFont(None, 36)
-            studio_font = pygame.font.SysFont(None, 48)
-            present_font = pygame.font.SysFont(None, 32)
             elapsed = self.intro_duration - self.intro_timer
 
             # 1. Studio name fade-in (text + shadow only)
             studio_alpha = min(255, int(255 * (elapsed / studio_fadein)))
-            studio_surface = studio_font.render("Team 12 - summer 2025", True, (252, 186, 3))
-            studio_shadow = studio_font.render("Team 12 - summer 2025", True, (40, 40, 40))
+            studio_surface, studio_shadow = self.studio_surfaces
             studio_x = (screen.get_width() - studio_surface.get_width()) // 2
             studio_y = screen.get_height() // 2 - 350
 
             studio_shadow.set_alpha(studio_alpha)
             studio_surface.set_alpha(studio_alpha)
-            screen.blit(studio_shadow, (studio_x + 2, studio_y + 2))
-            screen.blit(studio_surface, (studio_x, studio_y))
+            renderer.add(screen.blit(studio_shadow, (studio_x + 2, studio_y + 2)))
+            renderer.add(screen.blit(studio_surface, (studio_x, studio_y)))
 
             # 2. Authors fade-in one by one (text + shadow only)
-            for i, author in enumerate(authors):
+            for i, (author_surface, author_shadow) in enumerate(self.author_surfaces):
                 appear_time = studio_fadein + i * author_fadein
                 if elapsed > appear_time:
                     alpha = min(255, int(255 * ((elapsed - appear_time) / fade_time)))
                     alpha = max(0, min(alpha, 255))
-                    author_surface = authors_font.render(author, True, (252, 186, 3))
-                    author_shadow = authors_font.render(author, True, (40, 40, 40))
                     author_x = (screen.get_width() - author_surface.get_width()) // 2
                     author_y = studio_y + 80 + i * 50
 
                     author_shadow.set_alpha(alpha)
                     author_surface.set_alpha(alpha)
-                    screen.blit(author_shadow, (author_x + 2, author_y + 2))
-                    screen.blit(author_surface, (author_x, author_y))
+                    renderer.add(screen.blit(author_shadow, (author_x + 2, author_y + 2)))
+                    renderer.add(screen.blit(author_surface, (author_x, author_y)))
 
             # 3. "present the game..." fade-in after all authors (text + shadow only)
-            present_appear_time = studio_fadein + len(authors) * author_fadein
+            present_appear_time = studio_fadein + len(self.author_surfaces) * author_fadein
             if elapsed > present_appear_time:
                 alpha = min(255, int(255 * ((elapsed - present_appear_time) / fade_time)))
                 alpha = max(0, min(alpha, 255))
-                present_surface = present_font.render(present_text, True, (252, 186, 3))
-                present_shadow = present_font.render(present_text, True, (40, 40, 40))
+                present_surface, present_shadow = self.present_surfaces
                 present_x = (screen.get_width() - present_surface.get_width()) // 2
-                present_y = studio_y + 80 + len(authors) * 50 + 30
+                present_y = studio_y + 80 + len(self.author_surfaces) * 50 + 30
 
                 present_shadow.set_alpha(alpha)
                 present_surface.set_alpha(alpha)
-                screen.blit(present_shadow, (present_x + 2, present_y + 2))
-                screen.blit(present_surface, (present_x, present_y))
+                renderer.add(screen.blit(present_shadow, (present_x + 2, present_y + 2)))
+                renderer.add(screen.blit(present_surface, (present_x, present_y)))
 
         if menu:
             # Animated title (wobble effect) - show only after intro
             amplitude = 10
             frequency = 2
             offset_y = int(amplitude * math.sin(self.title_anim_time * frequency))
-            title_surface = self.title_font.render(self.title_text, True, self.title_color)
-            shadow_surface = self.title_font.render(self.title_text, True, (40, 40, 40))
+            title_surface = self.title_surface
+            shadow_surface = self.title_shadow
             title_x = (screen.get_width() - title_surface.get_width()) // 2
             title_y = 40 + offset_y
-            screen.blit(shadow_surface, (title_x + 2, title_y + 2))
-            screen.blit(title_surface, (title_x, title_y))
-
-            # Show high score below the title
-            high_score_font = pygame.font.SysFont(None, 48)
-            high_score_text = f"High Score: {self.high_score}"
-            high_score_surface = high_score_font.render(high_score_text, True, (255, 255, 255))
-            high_score_shadow = high_score_font.render(high_score_text, True, (40, 40, 40))
+            renderer.add(screen.blit(shadow_surface, (title_x + 2, title_y + 2)))
+            renderer.add(screen.blit(title_surface, (title_x, title_y)))
+
+            # Show high score below the title (re-rendered only when it changes)
+            high_score_surface = self.high_score_surface
+            high_score_shadow = self.high_score_shadow
             high_score_x = (screen.get_width() - high_score_surface.get_width()) // 2
             high_score_y = title_y + title_surface.get_height() + 20
-            screen.blit(high_score_shadow, (high_score_x + 2, high_score_y + 2))
-            screen.blit(high_score_surface, (high_score_x, high_score_y))
-
-            # --- Update high score in case it was reset ---
-            self.high_score = self.load_high_score()
+            renderer.add(screen.blit(high_score_shadow, (high_score_x + 2, high_score_y + 2)))
+            renderer.add(screen.blit(high_score_surface, (high_score_x, high_score_y)))
 
             for button in self.buttons:
-                button.draw(screen)
+                renderer.add(button.draw(screen))
 
-        pygame.display.flip()
+        renderer.present()
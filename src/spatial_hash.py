@@ -0,0 +1,76 @@
+import numpy as np
+
+# Neighbouring cells checked for pairs. Only half of the 3x3 neighbourhood is
+# needed, every pair of cells is then visited exactly once.
+_PAIR_OFFSETS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class SpatialHash:
+    """Uniform grid that buckets objects by position to find nearby pairs quickly.
+
+    The grid is rebuilt from scratch every tick, which costs O(n). Objects only
+    need to be compared with objects in the same or neighbouring cells, so with
+    a cell size at least as large as the objects this replaces O(n²) pairwise
+    checks.
+    """
+
+    def __init__(self, cell_size):
+        """Initializes an empty hash.
+
+        Args:
+            cell_size (float): Size of one grid cell in world pixels.
+        """
+
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def cell_of(self, x, y):
+        """Returns the grid cell (column, row) containing a world position."""
+
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def rebuild(self, positions):
+        """Buckets all objects by position.
+
+        Args:
+            positions (numpy.ndarray): (N, 2) world positions. Object i is stored as index i.
+        """
+
+        self.cells.clear()
+        keys = np.floor_divide(positions, self.cell_size).astype(np.int64).tolist()
+        for i, key in enumerate(keys):
+            self.cells.setdefault((key[0], key[1]), []).append(i)
+
+    def query(self, x, y):
+        """Returns indices of all objects in the cell containing (x, y) and its eight neighbours."""
+
+        column, row = self.cell_of(x, y)
+        found = []
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                found.extend(self.cells.get((column + dx, row + dy), ()))
+        return found
+
+    def candidate_pairs(self):
+        """Returns every pair of objects in the same or neighbouring cells.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Index arrays (first, second), one entry per pair.
+        """
+
+        first = []
+        second = []
+        cells = self.cells
+        for (column, row), members in cells.items():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    first.append(members[a])
+                    second.append(members[b])
+            for dx, dy in _PAIR_OFFSETS:
+                others = cells.get((column + dx, row + dy))
+                if others:
+                    for i in members:
+                        for j in others:
+                            first.append(i)
+                            second.append(j)
+        return np.array(first, dtype=np.int64), np.array(second, dtype=np.int64)
@@ -0,0 +1,55 @@
+import pygame
+
+class TileAtlas:
+    """All map tiles packed into a single pre-scaled surface.
+
+    Instead of keeping one ``pygame.Surface`` per tile ID, every tile is scaled
+    once and copied into one atlas surface. Tiles are then drawn with
+    ``blit(atlas, dest, area=rect)`` using the precomputed rect table.
+    """
+
+    def __init__(self, sprite_sheet, tile_dict, tile_size, sprite_tile_size=16, tile_spacing=1, tile_margin=0):
+        """Builds the atlas from the sprite sheet.
+
+        Args:
+            sprite_sheet (pygame.Surface): The tileset image.
+            tile_dict (dict): Mapping of tile ID -> ((x, y), description).
+            tile_size (int): Size of one tile in the atlas (and on screen) in pixels.
+            sprite_tile_size (int): Size of one tile in the sprite sheet in pixels.
+            tile_spacing (int): Spacing between tiles in the sprite sheet.
+            tile_margin (int): Margin around the tiles in the sprite sheet.
+        """
+
+        self.tile_size = tile_size
+
+        columns = max(x for (x, _), _ in tile_dict.values()) + 1
+        rows = max(y for (_, y), _ in tile_dict.values()) + 1
+        self.surface = pygame.Surface((columns * tile_size, rows * tile_size), pygame.SRCALPHA).convert_alpha()
+
+        # Rect table: tile ID -> area of the tile inside the atlas
+        self.rects = {}
+        step = sprite_tile_size + tile_spacing
+        for tile_id, ((x, y), _) in tile_dict.items():
+            src_rect = pygame.Rect(tile_margin + x * step, tile_margin + y * step, sprite_tile_size, sprite_tile_size)
+            dest_rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
+            tile = pygame.transform.scale(sprite_sheet.subsurface(src_rect), (tile_size, tile_size))
+            self.surface.blit(tile, dest_rect)
+            self.rects[tile_id] = dest_rect
+
+    def get_rect(self, tile_id):
+        """Returns the area of a tile inside the atlas, or None for unknown IDs."""
+
+        return self.rects.get(tile_id)
+
+    def blit(self, target, tile_id, pos):
+        """Draws a single tile onto the target surface.
+
+        Args:
+            target (pygame.Surface): The surface to draw on.
+            tile_id (int): ID of the tile to draw.
+            pos (tuple): Top-left destination position.
+        """
+
+        rect = self.rects.get(tile_id)
+        if rect:
+            target.blit(self.surface, pos, rect)
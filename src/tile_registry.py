@@ -0,0 +1,104 @@
+"""
+Tile registry shared by the game and the editor.
+
+The tileset has 35 columns × 26 rows of tiles (16×16 px + 1 px spacing).
+A tile's ID is its position in the tileset read row by row, so its
+coordinates are computed from the ID instead of being listed. The only
+exceptions are the tiles in :data:`COORDS_OVERRIDES`.
+
+:data:`tile_dict` keeps the old ``{id: ((x, y), description)}`` interface
+for code iterating all tiles, while the functions below look up single
+tiles without building anything. Descriptions are created on first use.
+"""
+
+from collections.abc import Mapping
+
+COLUMNS = 35
+ROWS = 26
+TILE_COUNT = COLUMNS * ROWS
+
+# Tiles drawn from a different place than their ID says: the empty tile 0
+# uses a tile from the last row, and tiles 676 (service) and 850 are swapped
+COORDS_OVERRIDES = {0: (0, 25), 676: (10, 24), 850: (11, 19)}
+
+WALKABLE_TILES = frozenset((0, 22, 676, 814, 850, 851, 852, 779, 674, 709, 782))  # ID's of walkable tiles
+CATEGORY_TILES = {851: "pickup", 852: "pump", 814: "food", 676: "service"}  # Special tiles by ID
+
+_descriptions = {}  # tile ID -> description, filled on first use
+
+
+def is_tile(tile_id):
+    """Returns True if the ID belongs to a tile of the tileset."""
+
+    return isinstance(tile_id, int) and 0 <= tile_id < TILE_COUNT
+
+
+def tile_coords(tile_id):
+    """Returns the (column, row) of a tile in the tileset.
+
+    Args:
+        tile_id (int): ID of the tile.
+
+    Returns:
+        tuple[int, int]: Coordinates of the tile in the tileset.
+    """
+
+    coords = COORDS_OVERRIDES.get(tile_id)
+    if coords is None:
+        coords = (tile_id % COLUMNS, tile_id // COLUMNS)
+    return coords
+
+
+def tile_description(tile_id):
+    """Returns the description of a tile shown in the editor."""
+
+    description = _descriptions.get(tile_id)
+    if description is None:
+        x, y = tile_coords(tile_id)
+        description = _descriptions[tile_id] = f"dlaždice ({x}, {y})"
+    return description
+
+
+def is_walkable(tile_id):
+    """Returns True if cars can drive on the tile."""
+
+    return tile_id in WALKABLE_TILES
+
+
+def tile_category(tile_id):
+    """Returns the category of a special tile ("pickup", "pump", "food" or "service"), or None."""
+
+    return CATEGORY_TILES.get(tile_id)
+
+
+def minimap_color(tile_id):
+    """Returns the color of the tile on the minimap."""
+
+    return (100 + tile_id * 10 % 155, 100 + tile_id * 20 % 155, 100 + tile_id * 30 % 155)
+
+
+def minimap_colors(tile_ids):
+    """Returns the minimap color of each tile ID."""
+
+    return {i: minimap_color(i) for i in tile_ids}
+
+
+class TileDict(Mapping):
+    """Read-only ``{id: ((x, y), description)}`` view of all tiles, computed on access."""
+
+    def __getitem__(self, tile_id):
+        if not is_tile(tile_id):
+            raise KeyError(tile_id)
+        return tile_coords(tile_id), tile_description(tile_id)
+
+    def __iter__(self):
+        return iter(range(TILE_COUNT))
+
+    def __len__(self):
+        return TILE_COUNT
+
+    def __contains__(self, tile_id):
+        return is_tile(tile_id)
+
+
+tile_dict = TileDict()
@@ -1,917 +0,0 @@
-"""
-tile_dict for 35 columns × 26 rows
-# Each ID is tile (16×16 px + 1 px spacing)
-"""
-
-tile_dict = {
-    0: ((0, 25), "dlaždice (0, 25)"),
-    1: ((1, 0), "dlaždice (1, 0)"),
-    2: ((2, 0), "dlaždice (2, 0)"),
-    3: ((3, 0), "dlaždice (3, 0)"),
-    4: ((4, 0), "dlaždice (4, 0)"),
-    5: ((5, 0), "dlaždice (5, 0)"),
-    6: ((6, 0), "dlaždice (6, 0)"),
-    7: ((7, 0), "dlaždice (7, 0)"),
-    8: ((8, 0), "dlaždice (8, 0)"),
-    9: ((9, 0), "dlaždice (9, 0)"),
-    10: ((10, 0), "dlaždice (10, 0)"),
-    11: ((11, 0), "dlaždice (11, 0)"),
-    12: ((12, 0), "dlaždice (12, 0)"),
-    13: ((13, 0), "dlaždice (13, 0)"),
-    14: ((14, 0), "dlaždice (14, 0)"),
-    15: ((15, 0), "dlaždice (15, 0)"),
-    16: ((16, 0), "dlaždice (16, 0)"),
-    17: ((17, 0), "dlaždice (17, 0)"),
-    18: ((18, 0), "dlaždice (18, 0)"),
-    19: ((19, 0), "dlaždice (19, 0)"),
-    20: ((20, 0), "dlaždice (20, 0)"),
-    21: ((21, 0), "dlaždice (21, 0)"),
-    22: ((22, 0), "dlaždice (22, 0)"),
-    23: ((23, 0), "dlaždice (23, 0)"),
-    24: ((24, 0), "dlaždice (24, 0)"),
-    25: ((25, 0), "dlaždice (25, 0)"),
-    26: ((26, 0), "dlaždice (26, 0)"),
-    27: ((27, 0), "dlaždice (27, 0)"),
-    28: ((28, 0), "dlaždice (28, 0)"),
-    29: ((29, 0), "dlaždice (29, 0)"),
-    30: ((30, 0), "dlaždice (30, 0)"),
-    31: ((31, 0), "dlaždice (31, 0)"),
-    32: ((32, 0), "dlaždice (32, 0)"),
-    33: ((33, 0), "dlaždice (33, 0)"),
-    34: ((34, 0), "dlaždice (34, 0)"),
-    35: ((0, 1), "dlaždice (0, 1)"),
-    36: ((1, 1), "dlaždice (1, 1)"),
-    37: ((2, 1), "dlaždice (2, 1)"),
-    38: ((3, 1), "dlaždice (3, 1)"),
-    39: ((4, 1), "dlaždice (4, 1)"),
-    40: ((5, 1), "dlaždice (5, 1)"),
-    41: ((6, 1), "dlaždice (6, 1)"),
-    42: ((7, 1), "dlaždice (7, 1)"),
-    43: ((8, 1), "dlaždice (8, 1)"),
-    44: ((9, 1), "dlaždice (9, 1)"),
-    45: ((10, 1), "dlaždice (10, 1)"),
-    46: ((11, 1), "dlaždice (11, 1)"),
-    47: ((12, 1), "dlaždice (12, 1)"),
-    48: ((13, 1), "dlaždice (13, 1)"),
-    49: ((14, 1), "dlaždice (14, 1)"),
-    50: ((15, 1), "dlaždice (15, 1)"),
-    51: ((16, 1), "dlaždice (16, 1)"),
-    52: ((17, 1), "dlaždice (17, 1)"),
-    53: ((18, 1), "dlaždice (18, 1)"),
-    54: ((19, 1), "dlaždice (19, 1)"),
-    55: ((20, 1), "dlaždice (20, 1)"),
-    56: ((21, 1), "dlaždice (21, 1)"),
-    57: ((22, 1), "dlaždice (22, 1)"),
-    58: ((23, 1), "dlaždice (23, 1)"),
-    59: ((24, 1), "dlaždice (24, 1)"),
-    60: ((25, 1), "dlaždice (25, 1)"),
-    61: ((26, 1), "dlaždice (26, 1)"),
-    62: ((27, 1), "dlaždice (27, 1)"),
-    63: ((28, 1), "dlaždice (28, 1)"),
-    64: ((29, 1), "dlaždice (29, 1)"),
-    65: ((30, 1), "dlaždice (30, 1)"),
-    66: ((31, 1), "dlaždice (31, 1)"),
-    67: ((32, 1), "dlaždice (32, 1)"),
-    68: ((33, 1), "dlaždice (33, 1)"),
-    69: ((34, 1), "dlaždice (34, 1)"),
-    70: ((0, 2), "dlaždice (0, 2)"),
-    71: ((1, 2), "dlaždice (1, 2)"),
-    72: ((2, 2), "dlaždice (2, 2)"),
-    73: ((3, 2), "dlaždice (3, 2)"),
-    74: ((4, 2), "dlaždice (4, 2)"),
-    75: ((5, 2), "dlaždice (5, 2)"),
-    76: ((6, 2), "dlaždice (6, 2)"),
-    77: ((7, 2), "dlaždice (7, 2)"),
-    78: ((8, 2), "dlaždice (8, 2)"),
-    79: ((9, 2), "dlaždice (9, 2)"),
-    80: ((10, 2), "dlaždice (10, 2)"),
-    81: ((11, 2), "dlaždice (11, 2)"),
-    82: ((12, 2), "dlaždice (12, 2)"),
-    83: ((13, 2), "dlaždice (13, 2)"),
-    84: ((14, 2), "dlaždice (14, 2)"),
-    85: ((15, 2), "dlaždice (15, 2)"),
-    86: ((16, 2), "dlaždice (16, 2)"),
-    87: ((17, 2), "dlaždice (17, 2)"),
-    88: ((18, 2), "dlaždice (18, 2)"),
-    89: ((19, 2), "dlaždice (19, 2)"),
-    90: ((20, 2), "dlaždice (20, 2)"),
-    91: ((21, 2), "dlaždice (21, 2)"),
-    92: ((22, 2), "dlaždice (22, 2)"),
-    93: ((23, 2), "dlaždice (23, 2)"),
-    94: ((24, 2), "dlaždice (24, 2)"),
-    95: ((25, 2), "dlaždice (25, 2)"),
-    96: ((26, 2), "dlaždice (26, 2)"),
-    97: ((27, 2), "dlaždice (27, 2)"),
-    98: ((28, 2), "dlaždice (28, 2)"),
-    99: ((29, 2), "dlaždice (29, 2)"),
-    100: ((30, 2), "dlaždice (30, 2)"),
-    101: ((31, 2), "dlaždice (31, 2)"),
-    102: ((32, 2), "dlaždice (32, 2)"),
-    103: ((33, 2), "dlaždice (33, 2)"),
-    104: ((34, 2), "dlaždice (34, 2)"),
-    105: ((0, 3), "dlaždice (0, 3)"),
-    106: ((1, 3), "dlaždice (1, 3)"),
-    107: ((2, 3), "dlaždice (2, 3)"),
-    108: ((3, 3), "dlaždice (3, 3)"),
-    109: ((4, 3), "dlaždice (4, 3)"),
-    110: ((5, 3), "dlaždice (5, 3)"),
-    111: ((6, 3), "dlaždice (6, 3)"),
-    112: ((7, 3), "dlaždice (7, 3)"),
-    113: ((8, 3), "dlaždice (8, 3)"),
-    114: ((9, 3), "dlaždice (9, 3)"),
-    115: ((10, 3), "dlaždice (10, 3)"),
-    116: ((11, 3), "dlaždice (11, 3)"),
-    117: ((12, 3), "dlaždice (12, 3)"),
-    118: ((13, 3), "dlaždice (13, 3)"),
-    119: ((14, 3), "dlaždice (14, 3)"),
-    120: ((15, 3), "dlaždice (15, 3)"),
-    121: ((16, 3), "dlaždice (16, 3)"),
-    122: ((17, 3), "dlaždice (17, 3)"),
-    123: ((18, 3), "dlaždice (18, 3)"),
-    124: ((19, 3), "dlaždice (19, 3)"),
-    125: ((20, 3), "dlaždice (20, 3)"),
-    126: ((21, 3), "dlaždice (21, 3)"),
-    127: ((22, 3), "dlaždice (22, 3)"),
-    128: ((23, 3), "dlaždice (23, 3)"),
-    129: ((24, 3), "dlaždice (24, 3)"),
-    130: ((25, 3), "dlaždice (25, 3)"),
-    131: ((26, 3), "dlaždice (26, 3)"),
-    132: ((27, 3), "dlaždice (27, 3)"),
-    133: ((28, 3), "dlaždice (28, 3)"),
-    134: ((29, 3), "dlaždice (29, 3)"),
-    135: ((30, 3), "dlaždice (30, 3)"),
-    136: ((31, 3), "dlaždice (31, 3)"),
-    137: ((32, 3), "dlaždice (32, 3)"),
-    138: ((33, 3), "dlaždice (33, 3)"),
-    139: ((34, 3), "dlaždice (34, 3)"),
-    140: ((0, 4), "dlaždice (0, 4)"),
-    141: ((1, 4), "dlaždice (1, 4)"),
-    142: ((2, 4), "dlaždice (2, 4)"),
-    143: ((3, 4), "dlaždice (3, 4)"),
-    144: ((4, 4), "dlaždice (4, 4)"),
-    145: ((5, 4), "dlaždice (5, 4)"),
-    146: ((6, 4), "dlaždice (6, 4)"),
-    147: ((7, 4), "dlaždice (7, 4)"),
-    148: ((8, 4), "dlaždice (8, 4)"),
-    149: ((9, 4), "dlaždice (9, 4)"),
-    150: ((10, 4), "dlaždice (10, 4)"),
-    151: ((11, 4), "dlaždice (11, 4)"),
-    152: ((12, 4), "dlaždice (12, 4)"),
-    153: ((13, 4), "dlaždice (13, 4)"),
-    154: ((14, 4), "dlaždice (14, 4)"),
-    155: ((15, 4), "dlaždice (15, 4)"),
-    156: ((16, 4), "dlaždice (16, 4)"),
-    157: ((17, 4), "dlaždice (17, 4)"),
-    158: ((18, 4), "dlaždice (18, 4)"),
-    159: ((19, 4), "dlaždice (19, 4)"),
-    160: ((20, 4), "dlaždice (20, 4)"),
-    161: ((21, 4), "dlaždice (21, 4)"),
-    162: ((22, 4), "dlaždice (22, 4)"),
-    163: ((23, 4), "dlaždice (23, 4)"),
-    164: ((24, 4), "dlaždice (24, 4)"),
-    165: ((25, 4), "dlaždice (25, 4)"),
-    166: ((26, 4), "dlaždice (26, 4)"),
-    167: ((27, 4), "dlaždice (27, 4)"),
-    168: ((28, 4), "dlaždice (28, 4)"),
-    169: ((29, 4), "dlaždice (29, 4)"),
-    170: ((30, 4), "dlaždice (30, 4)"),
-    171: ((31, 4), "dlaždice (31, 4)"),
-    172: ((32, 4), "dlaždice (32, 4)"),
-    173: ((33, 4), "dlaždice (33, 4)"),
-    174: ((34, 4), "dlaždice (34, 4)"),
-    175: ((0, 5), "dlaždice (0, 5)"),
-    176: ((1, 5), "dlaždice (1, 5)"),
-    177: ((2, 5), "dlaždice (2, 5)"),
-    178: ((3, 5), "dlaždice (3, 5)"),
-    179: ((4, 5), "dlaždice (4, 5)"),
-    180: ((5, 5), "dlaždice (5, 5)"),
-    181: ((6, 5), "dlaždice (6, 5)"),
-    182: ((7, 5), "dlaždice (7, 5)"),
-    183: ((8, 5), "dlaždice (8, 5)"),
-    184: ((9, 5), "dlaždice (9, 5)"),
-    185: ((10, 5), "dlaždice (10, 5)"),
-    186: ((11, 5), "dlaždice (11, 5)"),
-    187: ((12, 5), "dlaždice (12, 5)"),
-    188: ((13, 5), "dlaždice (13, 5)"),
-    189: ((14, 5), "dlaždice (14, 5)"),
-    190: ((15, 5), "dlaždice (15, 5)"),
-    191: ((16, 5), "dlaždice (16, 5)"),
-    192: ((17, 5), "dlaždice (17, 5)"),
-    193: ((18, 5), "dlaždice (18, 5)"),
-    194: ((19, 5), "dlaždice (19, 5)"),
-    195: ((20, 5), "dlaždice (20, 5)"),
-    196: ((21, 5), "dlaždice (21, 5)"),
-    197: ((22, 5), "dlaždice (22, 5)"),
-    198: ((23, 5), "dlaždice (23, 5)"),
-    199: ((24, 5), "dlaždice (24, 5)"),
-    200: ((25, 5), "dlaždice (25, 5)"),
-    201: ((26, 5), "dlaždice (26, 5)"),
-    202: ((27, 5), "dlaždice (27, 5)"),
-    203: ((28, 5), "dlaždice (28, 5)"),
-    204: ((29, 5), "dlaždice (29, 5)"),
-    205: ((30, 5), "dlaždice (30, 5)"),
-    206: ((31, 5), "dlaždice (31, 5)"),
-    207: ((32, 5), "dlaždice (32, 5)"),
-    208: ((33, 5), "dlaždice (33, 5)"),
-    209: ((34, 5), "dlaždice (34, 5)"),
-    210: ((0, 6), "dlaždice (0, 6)"),
-    211: ((1, 6), "dlaždice (1, 6)"),
-    212: ((2, 6), "dlaždice (2, 6)"),
-    213: ((3, 6), "dlaždice (3, 6)"),
-    214: ((4, 6), "dlaždice (4, 6)"),
-    215: ((5, 6), "dlaždice (5, 6)"),
-    216: ((6, 6), "dlaždice (6, 6)"),
-    217: ((7, 6), "dlaždice (7, 6)"),
-    218: ((8, 6), "dlaždice (8, 6)"),
-    219: ((9, 6), "dlaždice (9, 6)"),
-    220: ((10, 6), "dlaždice (10, 6)"),
-    221: ((11, 6), "dlaždice (11, 6)"),
-    222: ((12, 6), "dlaždice (12, 6)"),
-    223: ((13, 6), "dlaždice (13, 6)"),
-    224: ((14, 6), "dlaždice (14, 6)"),
-    225: ((15, 6), "dlaždice (15, 6)"),
-    226: ((16, 6), "dlaždice (16, 6)"),
-    227: ((17, 6), "dlaždice (17, 6)"),
-    228: ((18, 6), "dlaždice (18, 6)"),
-    229: ((19, 6), "dlaždice (19, 6)"),
-    230: ((20, 6), "dlaždice (20, 6)"),
-    231: ((21, 6), "dlaždice (21, 6)"),
-    232: ((22, 6), "dlaždice (22, 6)"),
-    233: ((23, 6), "dlaždice (23, 6)"),
-    234: ((24, 6), "dlaždice (24, 6)"),
-    235: ((25, 6), "dlaždice (25, 6)"),
-    236: ((26, 6), "dlaždice (26, 6)"),
-    237: ((27, 6), "dlaždice (27, 6)"),
-    238: ((28, 6), "dlaždice (28, 6)"),
-    239: ((29, 6), "dlaždice (29, 6)"),
-    240: ((30, 6), "dlaždice (30, 6)"),
-    241: ((31, 6), "dlaždice (31, 6)"),
-    242: ((32, 6), "dlaždice (32, 6)"),
-    243: ((33, 6), "dlaždice (33, 6)"),
-    244: ((34, 6), "dlaždice (34, 6)"),
-    245: ((0, 7), "dlaždice (0, 7)"),
-    246: ((1, 7), "dlaždice (1, 7)"),
-    247: ((2, 7), "dlaždice (2, 7)"),
-    248: ((3, 7), "dlaždice (3, 7)"),
-    249: ((4, 7), "dlaždice (4, 7)"),
-    250: ((5, 7), "dlaždice (5, 7)"),
-    251: ((6, 7), "dlaždice (6, 7)"),
-    252: ((7, 7), "dlaždice (7, 7)"),
-    253: ((8, 7), "dlaždice (8, 7)"),
-    254: ((9, 7), "dlaždice (9, 7)"),
-    255: ((10, 7), "dlaždice (10, 7)"),
-    256: ((11, 7), "dlaždice (11, 7)"),
-    257: ((12, 7), "dlaždice (12, 7)"),
-    258: ((13, 7), "dlaždice (13, 7)"),
-    259: ((14, 7), "dlaždice (14, 7)"),
-    260: ((15, 7), "dlaždice (15, 7)"),
-    261: ((16, 7), "dlaždice (16, 7)"),
-    262: ((17, 7), "dlaždice (17, 7)"),
-    263: ((18, 7), "dlaždice (18, 7)"),
-    264: ((19, 7), "dlaždice (19, 7)"),
-    265: ((20, 7), "dlaždice (20, 7)"),
-    266: ((21, 7), "dlaždice (21, 7)"),
-    267: ((22, 7), "dlaždice (22, 7)"),
-    268: ((23, 7), "dlaždice (23, 7)"),
-    269: ((24, 7), "dlaždice (24, 7)"),
-    270: ((25, 7), "dlaždice (25, 7)"),
-    271: ((26, 7), "dlaždice (26, 7)"),
-    272: ((27, 7), "dlaždice (27, 7)"),
-    273: ((28, 7), "dlaždice (28, 7)"),
-    274: ((29, 7), "dlaždice (29, 7)"),
-    275: ((30, 7), "dlaždice (30, 7)"),
-    276: ((31, 7), "dlaždice (31, 7)"),
-    277: ((32, 7), "dlaždice (32, 7)"),
-    278: ((33, 7), "dlaždice (33, 7)"),
-    279: ((34, 7), "dlaždice (34, 7)"),
-    280: ((0, 8), "dlaždice (0, 8)"),
-    281: ((1, 8), "dlaždice (1, 8)"),
-    282: ((2, 8), "dlaždice (2, 8)"),
-    283: ((3, 8), "dlaždice (3, 8)"),
-    284: ((4, 8), "dlaždice (4, 8)"),
-    285: ((5, 8), "dlaždice (5, 8)"),
-    286: ((6, 8), "dlaždice (6, 8)"),
-    287: ((7, 8), "dlaždice (7, 8)"),
-    288: ((8, 8), "dlaždice (8, 8)"),
-    289: ((9, 8), "dlaždice (9, 8)"),
-    290: ((10, 8), "dlaždice (10, 8)"),
-    291: ((11, 8), "dlaždice (11, 8)"),
-    292: ((12, 8), "dlaždice (12, 8)"),
-    293: ((13, 8), "dlaždice (13, 8)"),
-    294: ((14, 8), "dlaždice (14, 8)"),
-    295: ((15, 8), "dlaždice (15, 8)"),
-    296: ((16, 8), "dlaždice (16, 8)"),
-    297: ((17, 8), "dlaždice (17, 8)"),
-    298: ((18, 8), "dlaždice (18, 8)"),
-    299: ((19, 8), "dlaždice (19, 8)"),
-    300: ((20, 8), "dlaždice (20, 8)"),
-    301: ((21, 8), "dlaždice (21, 8)"),
-    302: ((22, 8), "dlaždice (22, 8)"),
-    303: ((23, 8), "dlaždice (23, 8)"),
-    304: ((24, 8), "dlaždice (24, 8)"),
-    305: ((25, 8), "dlaždice (25, 8)"),
-    306: ((26, 8), "dlaždice (26, 8)"),
-    307: ((27, 8), "dlaždice (27, 8)"),
-    308: ((28, 8), "dlaždice (28, 8)"),
-    309: ((29, 8), "dlaždice (29, 8)"),
-    310: ((30, 8), "dlaždice (30, 8)"),
-    311: ((31, 8), "dlaždice (31, 8)"),
-    312: ((32, 8), "dlaždice (32, 8)"),
-    313: ((33, 8), "dlaždice (33, 8)"),
-    314: ((34, 8), "dlaždice (34, 8)"),
-    315: ((0, 9), "dlaždice (0, 9)"),
-    316: ((1, 9), "dlaždice (1, 9)"),
-    317: ((2, 9), "dlaždice (2, 9)"),
-    318: ((3, 9), "dlaždice (3, 9)"),
-    319: ((4, 9), "dlaždice (4, 9)"),
-    320: ((5, 9), "dlaždice (5, 9)"),
-    321: ((6, 9), "dlaždice (6, 9)"),
-    322: ((7, 9), "dlaždice (7, 9)"),
-    323: ((8, 9), "dlaždice (8, 9)"),
-    324: ((9, 9), "dlaždice (9, 9)"),
-    325: ((10, 9), "dlaždice (10, 9)"),
-    326: ((11, 9), "dlaždice (11, 9)"),
-    327: ((12, 9), "dlaždice (12, 9)"),
-    328: ((13, 9), "dlaždice (13, 9)"),
-    329: ((14, 9), "dlaždice (14, 9)"),
-    330: ((15, 9), "dlaždice (15, 9)"),
-    331: ((16, 9), "dlaždice (16, 9)"),
-    332: ((17, 9), "dlaždice (17, 9)"),
-    333: ((18, 9), "dlaždice (18, 9)"),
-    334: ((19, 9), "dlaždice (19, 9)"),
-    335: ((20, 9), "dlaždice (20, 9)"),
-    336: ((21, 9), "dlaždice (21, 9)"),
-    337: ((22, 9), "dlaždice (22, 9)"),
-    338: ((23, 9), "dlaždice (23, 9)"),
-    339: ((24, 9), "dlaždice (24, 9)"),
-    340: ((25, 9), "dlaždice (25, 9)"),
-    341: ((26, 9), "dlaždice (26, 9)"),
-    342: ((27, 9), "dlaždice (27, 9)"),
-    343: ((28, 9), "dlaždice (28, 9)"),
-    344: ((29, 9), "dlaždice (29, 9)"),
-    345: ((30, 9), "dlaždice (30, 9)"),
-    346: ((31, 9), "dlaždice (31, 9)"),
-    347: ((32, 9), "dlaždice (32, 9)"),
-    348: ((33, 9), "dlaždice (33, 9)"),
-    349: ((34, 9), "dlaždice (34, 9)"),
-    350: ((0, 10), "dlaždice (0, 10)"),
-    351: ((1, 10), "dlaždice (1, 10)"),
-    352: ((2, 10), "dlaždice (2, 10)"),
-    353: ((3, 10), "dlaždice (3, 10)"),
-    354: ((4, 10), "dlaždice (4, 10)"),
-    355: ((5, 10), "dlaždice (5, 10)"),
-    356: ((6, 10), "dlaždice (6, 10)"),
-    357: ((7, 10), "dlaždice (7, 10)"),
-    358: ((8, 10), "dlaždice (8, 10)"),
-    359: ((9, 10), "dlaždice (9, 10)"),
-    360: ((10, 10), "dlaždice (10, 10)"),
-    361: ((11, 10), "dlaždice (11, 10)"),
-    362: ((12, 10), "dlaždice (12, 10)"),
-    363: ((13, 10), "dlaždice (13, 10)"),
-    364: ((14, 10), "dlaždice (14, 10)"),
-    365: ((15, 10), "dlaždice (15, 10)"),
-    366: ((16, 10), "dlaždice (16, 10)"),
-    367: ((17, 10), "dlaždice (17, 10)"),
-    368: ((18, 10), "dlaždice (18, 10)"),
-    369: ((19, 10), "dlaždice (19, 10)"),
-    370: ((20, 10), "dlaždice (20, 10)"),
-    371: ((21, 10), "dlaždice (21, 10)"),
-    372: ((22, 10), "dlaždice (22, 10)"),
-    373: ((23, 10), "dlaždice (23, 10)"),
-    374: ((24, 10), "dlaždice (24, 10)"),
-    375: ((25, 10), "dlaždice (25, 10)"),
-    376: ((26, 10), "dlaždice (26, 10)"),
-    377: ((27, 10), "dlaždice (27, 10)"),
-    378: ((28, 10), "dlaždice (28, 10)"),
-    379: ((29, 10), "dlaždice (29, 10)"),
-    380: ((30, 10), "dlaždice (30, 10)"),
-    381: ((31, 10), "dlaždice (31, 10)"),
-    382: ((32, 10), "dlaždice (32, 10)"),
-    383: ((33, 10), "dlaždice (33, 10)"),
-    384: ((34, 10), "dlaždice (34, 10)"),
-    385: ((0, 11), "dlaždice (0, 11)"),
-    386: ((1, 11), "dlaždice (1, 11)"),
-    387: ((2, 11), "dlaždice (2, 11)"),
-    388: ((3, 11), "dlaždice (3, 11)"),
-    389: ((4, 11), "dlaždice (4, 11)"),
-    390: ((5, 11), "dlaždice (5, 11)"),
-    391: ((6, 11), "dlaždice (6, 11)"),
-    392: ((7, 11), "dlaždice (7, 11)"),
-    393: ((8, 11), "dlaždice (8, 11)"),
-    394: ((9, 11), "dlaždice (9, 11)"),
-    395: ((10, 11), "dlaždice (10, 11)"),
-    396: ((11, 11), "dlaždice (11, 11)"),
-    397: ((12, 11), "dlaždice (12, 11)"),
-    398: ((13, 11), "dlaždice (13, 11)"),
-    399: ((14, 11), "dlaždice (14, 11)"),
-    400: ((15, 11), "dlaždice (15, 11)"),
-    401: ((16, 11), "dlaždice (16, 11)"),
-    402: ((17, 11), "dlaždice (17, 11)"),
-    403: ((18, 11), "dlaždice (18, 11)"),
-    404: ((19, 11), "dlaždice (19, 11)"),
-    405: ((20, 11), "dlaždice (20, 11)"),
-    406: ((21, 11), "dlaždice (21, 11)"),
-    407: ((22, 11), "dlaždice (22, 11)"),
-    408: ((23, 11), "dlaždice (23, 11)"),
-    409: ((24, 11), "dlaždice (24, 11)"),
-    410: ((25, 11), "dlaždice (25, 11)"),
-    411: ((26, 11), "dlaždice (26, 11)"),
-    412: ((27, 11), "dlaždice (27, 11)"),
-    413: ((28, 11), "dlaždice (28, 11)"),
-    414: ((29, 11), "dlaždice (29, 11)"),
-    415: ((30, 11), "dlaždice (30, 11)"),
-    416: ((31, 11), "dlaždice (31, 11)"),
-    417: ((32, 11), "dlaždice (32, 11)"),
-    418: ((33, 11), "dlaždice (33, 11)"),
-    419: ((34, 11), "dlaždice (34, 11)"),
-    420: ((0, 12), "dlaždice (0, 12)"),
-    421: ((1, 12), "dlaždice (1, 12)"),
-    422: ((2, 12), "dlaždice (2, 12)"),
-    423: ((3, 12), "dlaždice (3, 12)"),
-    424: ((4, 12), "dlaždice (4, 12)"),
-    425: ((5, 12), "dlaždice (5, 12)"),
-    426: ((6, 12), "dlaždice (6, 12)"),
-    427: ((7, 12), "dlaždice (7, 12)"),
-    428: ((8, 12), "dlaždice (8, 12)"),
-    429: ((9, 12), "dlaždice (9, 12)"),
-    430: ((10, 12), "dlaždice (10, 12)"),
-    431: ((11, 12), "dlaždice (11, 12)"),
-    432: ((12, 12), "dlaždice (12, 12)"),
-    433: ((13, 12), "dlaždice (13, 12)"),
-    434: ((14, 12), "dlaždice (14, 12)"),
-    435: ((15, 12), "dlaždice (15, 12)"),
-    436: ((16, 12), "dlaždice (16, 12)"),
-    437: ((17, 12), "dlaždice (17, 12)"),
-    438: ((18, 12), "dlaždice (18, 12)"),
-    439: ((19, 12), "dlaždice (19, 12)"),
-    440: ((20, 12), "dlaždice (20, 12)"),
-    441: ((21, 12), "dlaždice (21, 12)"),
-    442: ((22, 12), "dlaždice (22, 12)"),
-    443: ((23, 12), "dlaždice (23, 12)"),
-    444: ((24, 12), "dlaždice (24, 12)"),
-    445: ((25, 12), "dlaždice (25, 12)"),
-    446: ((26, 12), "dlaždice (26, 12)"),
-    447: ((27, 12), "dlaždice (27, 12)"),
-    448: ((28, 12), "dlaždice (28, 12)"),
-    449: ((29, 12), "dlaždice (29, 12)"),
-    450: ((30, 12), "dlaždice (30, 12)"),
-    451: ((31, 12), "dlaždice (31, 12)"),
-    452: ((32, 12), "dlaždice (32, 12)"),
-    453: ((33, 12), "dlaždice (33, 12)"),
-    454: ((34, 12), "dlaždice (34, 12)"),
-    455: ((0, 13), "dlaždice (0, 13)"),
-    456: ((1, 13), "dlaždice (1, 13)"),
-    457: ((2, 13), "dlaždice (2, 13)"),
-    458: ((3, 13), "dlaždice (3, 13)"),
-    459: ((4, 13), "dlaždice (4, 13)"),
-    460: ((5, 13), "dlaždice (5, 13)"),
-    461: ((6, 13), "dlaždice (6, 13)"),
-    462: ((7, 13), "dlaždice (7, 13)"),
-    463: ((8, 13), "dlaždice (8, 13)"),
-    464: ((9, 13), "dlaždice (9, 13)"),
-    465: ((10, 13), "dlaždice (10, 13)"),
-    466: ((11, 13), "dlaždice (11, 13)"),
-    467: ((12, 13), "dlaždice (12, 13)"),
-    468: ((13, 13), "dlaždice (13, 13)"),
-    469: ((14, 13), "dlaždice (14, 13)"),
-    470: ((15, 13), "dlaždice (15, 13)"),
-    471: ((16, 13), "dlaždice (16, 13)"),
-    472: ((17, 13), "dlaždice (17, 13)"),
-    473: ((18, 13), "dlaždice (18, 13)"),
-    474: ((19, 13), "dlaždice (19, 13)"),
-    475: ((20, 13), "dlaždice (20, 13)"),
-    476: ((21, 13), "dlaždice (21, 13)"),
-    477: ((22, 13), "dlaždice (22, 13)"),
-    478: ((23, 13), "dlaždice (23, 13)"),
-    479: ((24, 13), "dlaždice (24, 13)"),
-    480: ((25, 13), "dlaždice (25, 13)"),
-    481: ((26, 13), "dlaždice (26, 13)"),
-    482: ((27, 13), "dlaždice (27, 13)"),
-    483: ((28, 13), "dlaždice (28, 13)"),
-    484: ((29, 13), "dlaždice (29, 13)"),
-    485: ((30, 13), "dlaždice (30, 13)"),
-    486: ((31, 13), "dlaždice (31, 13)"),
-    487: ((32, 13), "dlaždice (32, 13)"),
-    488: ((33, 13), "dlaždice (33, 13)"),
-    489: ((34, 13), "dlaždice (34, 13)"),
-    490: ((0, 14), "dlaždice (0, 14)"),
-    491: ((1, 14), "dlaždice (1, 14)"),
-    492: ((2, 14), "dlaždice (2, 14)"),
-    493: ((3, 14), "dlaždice (3, 14)"),
-    494: ((4, 14), "dlaždice (4, 14)"),
-    495: ((5, 14), "dlaždice (5, 14)"),
-    496: ((6, 14), "dlaždice (6, 14)"),
-    497: ((7, 14), "dlaždice (7, 14)"),
-    498: ((8, 14), "dlaždice (8, 14)"),
-    499: ((9, 14), "dlaždice (9, 14)"),
-    500: ((10, 14), "dlaždice (10, 14)"),
-    501: ((11, 14), "dlaždice (11, 14)"),
-    502: ((12, 14), "dlaždice (12, 14)"),
-    503: ((13, 14), "dlaždice (13, 14)"),
-    504: ((14, 14), "dlaždice (14, 14)"),
-    505: ((15, 14), "dlaždice (15, 14)"),
-    506: ((16, 14), "dlaždice (16, 14)"),
-    507: ((17, 14), "dlaždice (17, 14)"),
-    508: ((18, 14), "dlaždice (18, 14)"),
-    509: ((19, 14), "dlaždice (19, 14)"),
-    510: ((20, 14), "dlaždice (20, 14)"),
-    511: ((21, 14), "dlaždice (21, 14)"),
-    512: ((22, 14), "dlaždice (22, 14)"),
-    513: ((23, 14), "dlaždice (23, 14)"),
-    514: ((24, 14), "dlaždice (24, 14)"),
-    515: ((25, 14), "dlaždice (25, 14)"),
-    516: ((26, 14), "dlaždice (26, 14)"),
-    517: ((27, 14), "dlaždice (27, 14)"),
-    518: ((28, 14), "dlaždice (28, 14)"),
-    519: ((29, 14), "dlaždice (29, 14)"),
-    520: ((30, 14), "dlaždice (30, 14)"),
-    521: ((31, 14), "dlaždice (31, 14)"),
-    522: ((32, 14), "dlaždice (32, 14)"),
-    523: ((33, 14), "dlaždice (33, 14)"),
-    524: ((34, 14), "dlaždice (34, 14)"),
-    525: ((0, 15), "dlaždice (0, 15)"),
-    526: ((1, 15), "dlaždice (1, 15)"),
-    527: ((2, 15), "dlaždice (2, 15)"),
-    528: ((3, 15), "dlaždice (3, 15)"),
-    529: ((4, 15), "dlaždice (4, 15)"),
-    530: ((5, 15), "dlaždice (5, 15)"),
-    531: ((6, 15), "dlaždice (6, 15)"),
-    532: ((7, 15), "dlaždice (7, 15)"),
-    533: ((8, 15), "dlaždice (8, 15)"),
-    534: ((9, 15), "dlaždice (9, 15)"),
-    535: ((10, 15), "dlaždice (10, 15)"),
-    536: ((11, 15), "dlaždice (11, 15)"),
-    537: ((12, 15), "dlaždice (12, 15)"),
-    538: ((13, 15), "dlaždice (13, 15)"),
-    539: ((14, 15), "dlaždice (14, 15)"),
-    540: ((15, 15), "dlaždice (15, 15)"),
-    541: ((16, 15), "dlaždice (16, 15)"),
-    542: ((17, 15), "dlaždice (17, 15)"),
-    543: ((18, 15), "dlaždice (18, 15)"),
-    544: ((19, 15), "dlaždice (19, 15)"),
-    545: ((20, 15), "dlaždice (20, 15)"),
-    546: ((21, 15), "dlaždice (21, 15)"),
-    547: ((22, 15), "dlaždice (22, 15)"),
-    548: ((23, 15), "dlaždice (23, 15)"),
-    549: ((24, 15), "dlaždice (24, 15)"),
-    550: ((25, 15), "dlaždice (25, 15)"),
-    551: ((26, 15), "dlaždice (26, 15)"),
-    552: ((27, 15), "dlaždice (27, 15)"),
-    553: ((28, 15), "dlaždice (28, 15)"),
-    554: ((29, 15), "dlaždice (29, 15)"),
-    555: ((30, 15), "dlaždice (30, 15)"),
-    556: ((31, 15), "dlaždice (31, 15)"),
-    557: ((32, 15), "dlaždice (32, 15)"),
-    558: ((33, 15), "dlaždice (33, 15)"),
-    559: ((34, 15), "dlaždice (34, 15)"),
-    560: ((0, 16), "dlaždice (0, 16)"),
-    561: ((1, 16), "dlaždice (1, 16)"),
-    562: ((2, 16), "dlaždice (2, 16)"),
-    563: ((3, 16), "dlaždice (3, 16)"),
-    564: ((4, 16), "dlaždice (4, 16)"),
-    565: ((5, 16), "dlaždice (5, 16)"),
-    566: ((6, 16), "dlaždice (6, 16)"),
-    567: ((7, 16), "dlaždice (7, 16)"),
-    568: ((8, 16), "dlaždice (8, 16)"),
-    569: ((9, 16), "dlaždice (9, 16)"),
-    570: ((10, 16), "dlaždice (10, 16)"),
-    571: ((11, 16), "dlaždice (11, 16)"),
-    572: ((12, 16), "dlaždice (12, 16)"),
-    573: ((13, 16), "dlaždice (13, 16)"),
-    574: ((14, 16), "dlaždice (14, 16)"),
-    575: ((15, 16), "dlaždice (15, 16)"),
-    576: ((16, 16), "dlaždice (16, 16)"),
-    577: ((17, 16), "dlaždice (17, 16)"),
-    578: ((18, 16), "dlaždice (18, 16)"),
-    579: ((19, 16), "dlaždice (19, 16)"),
-    580: ((20, 16), "dlaždice (20, 16)"),
-    581: ((21, 16), "dlaždice (21, 16)"),
-    582: ((22, 16), "dlaždice (22, 16)"),
-    583: ((23, 16), "dlaždice (23, 16)"),
-    584: ((24, 16), "dlaždice (24, 16)"),
-    585: ((25, 16), "dlaždice (25, 16)"),
-    586: ((26, 16), "dlaždice (26, 16)"),
-    587: ((27, 16), "dlaždice (27, 16)"),
-    588: ((28, 16), "dlaždice (28, 16)"),
-    589: ((29, 16), "dlaždice (29, 16)"),
-    590: ((30, 16), "dlaždice (30, 16)"),
-    591: ((31, 16), "dlaždice (31, 16)"),
-    592: ((32, 16), "dlaždice (32, 16)"),
-    593: ((33, 16), "dlaždice (33, 16)"),
-    594: ((34, 16), "dlaždice (34, 16)"),
-    595: ((0, 17), "dlaždice (0, 17)"),
-    596: ((1, 17), "dlaždice (1, 17)"),
-    597: ((2, 17), "dlaždice (2, 17)"),
-    598: ((3, 17), "dlaždice (3, 17)"),
-    599: ((4, 17), "dlaždice (4, 17)"),
-    600: ((5, 17), "dlaždice (5, 17)"),
-    601: ((6, 17), "dlaždice (6, 17)"),
-    602: ((7, 17), "dlaždice (7, 17)"),
-    603: ((8, 17), "dlaždice (8, 17)"),
-    604: ((9, 17), "dlaždice (9, 17)"),
-    605: ((10, 17), "dlaždice (10, 17)"),
-    606: ((11, 17), "dlaždice (11, 17)"),
-    607: ((12, 17), "dlaždice (12, 17)"),
-    608: ((13, 17), "dlaždice (13, 17)"),
-    609: ((14, 17), "dlaždice (14, 17)"),
-    610: ((15, 17), "dlaždice (15, 17)"),
-    611: ((16, 17), "dlaždice (16, 17)"),
-    612: ((17, 17), "dlaždice (17, 17)"),
-    613: ((18, 17), "dlaždice (18, 17)"),
-    614: ((19, 17), "dlaždice (19, 17)"),
-    615: ((20, 17), "dlaždice (20, 17)"),
-    616: ((21, 17), "dlaždice (21, 17)"),
-    617: ((22, 17), "dlaždice (22, 17)"),
-    618: ((23, 17), "dlaždice (23, 17)"),
-    619: ((24, 17), "dlaždice (24, 17)"),
-    620: ((25, 17), "dlaždice (25, 17)"),
-    621: ((26, 17), "dlaždice (26, 17)"),
-    622: ((27, 17), "dlaždice (27, 17)"),
-    623: ((28, 17), "dlaždice (28, 17)"),
-    624: ((29, 17), "dlaždice (29, 17)"),
-    625: ((30, 17), "dlaždice (30, 17)"),
-    626: ((31, 17), "dlaždice (31, 17)"),
-    627: ((32, 17), "dlaždice (32, 17)"),
-    628: ((33, 17), "dlaždice (33, 17)"),
-    629: ((34, 17), "dlaždice (34, 17)"),
-    630: ((0, 18), "dlaždice (0, 18)"),
-    631: ((1, 18), "dlaždice (1, 18)"),
-    632: ((2, 18), "dlaždice (2, 18)"),
-    633: ((3, 18), "dlaždice (3, 18)"),
-    634: ((4, 18), "dlaždice (4, 18)"),
-    635: ((5, 18), "dlaždice (5, 18)"),
-    636: ((6, 18), "dlaždice (6, 18)"),
-    637: ((7, 18), "dlaždice (7, 18)"),
-    638: ((8, 18), "dlaždice (8, 18)"),
-    639: ((9, 18), "dlaždice (9, 18)"),
-    640: ((10, 18), "dlaždice (10, 18)"),
-    641: ((11, 18), "dlaždice (11, 18)"),
-    642: ((12, 18), "dlaždice (12, 18)"),
-    643: ((13, 18), "dlaždice (13, 18)"),
-    644: ((14, 18), "dlaždice (14, 18)"),
-    645: ((15, 18), "dlaždice (15, 18)"),
-    646: ((16, 18), "dlaždice (16, 18)"),
-    647: ((17, 18), "dlaždice (17, 18)"),
-    648: ((18, 18), "dlaždice (18, 18)"),
-    649: ((19, 18), "dlaždice (19, 18)"),
-    650: ((20, 18), "dlaždice (20, 18)"),
-    651: ((21, 18), "dlaždice (21, 18)"),
-    652: ((22, 18), "dlaždice (22, 18)"),
-    653: ((23, 18), "dlaždice (23, 18)"),
-    654: ((24, 18), "dlaždice (24, 18)"),
-    655: ((25, 18), "dlaždice (25, 18)"),
-    656: ((26, 18), "dlaždice (26, 18)"),
-    657: ((27, 18), "dlaždice (27, 18)"),
-    658: ((28, 18), "dlaždice (28, 18)"),
-    659: ((29, 18), "dlaždice (29, 18)"),
-    660: ((30, 18), "dlaždice (30, 18)"),
-    661: ((31, 18), "dlaždice (31, 18)"),
-    662: ((32, 18), "dlaždice (32, 18)"),
-    663: ((33, 18), "dlaždice (33, 18)"),
-    664: ((34, 18), "dlaždice (34, 18)"),
-    665: ((0, 19), "dlaždice (0, 19)"),
-    666: ((1, 19), "dlaždice (1, 19)"),
-    667: ((2, 19), "dlaždice (2, 19)"),
-    668: ((3, 19), "dlaždice (3, 19)"),
-    669: ((4, 19), "dlaždice (4, 19)"),
-    670: ((5, 19), "dlaždice (5, 19)"),
-    671: ((6, 19), "dlaždice (6, 19)"),
-    672: ((7, 19), "dlaždice (7, 19)"),
-    673: ((8, 19), "dlaždice (8, 19)"),
-    674: ((9, 19), "dlaždice (9, 19)"),
-    675: ((10, 19), "dlaždice (10, 19)"),
-    850: ((11, 19), "dlaždice (11, 19)"),
-    677: ((12, 19), "dlaždice (12, 19)"),
-    678: ((13, 19), "dlaždice (13, 19)"),
-    679: ((14, 19), "dlaždice (14, 19)"),
-    680: ((15, 19), "dlaždice (15, 19)"),
-    681: ((16, 19), "dlaždice (16, 19)"),
-    682: ((17, 19), "dlaždice (17, 19)"),
-    683: ((18, 19), "dlaždice (18, 19)"),
-    684: ((19, 19), "dlaždice (19, 19)"),
-    685: ((20, 19), "dlaždice (20, 19)"),
-    686: ((21, 19), "dlaždice (21, 19)"),
-    687: ((22, 19), "dlaždice (22, 19)"),
-    688: ((23, 19), "dlaždice (23, 19)"),
-    689: ((24, 19), "dlaždice (24, 19)"),
-    690: ((25, 19), "dlaždice (25, 19)"),
-    691: ((26, 19), "dlaždice (26, 19)"),
-    692: ((27, 19), "dlaždice (27, 19)"),
-    693: ((28, 19), "dlaždice (28, 19)"),
-    694: ((29, 19), "dlaždice (29, 19)"),
-    695: ((30, 19), "dlaždice (30, 19)"),
-    696: ((31, 19), "dlaždice (31, 19)"),
-    697: ((32, 19), "dlaždice (32, 19)"),
-    698: ((33, 19), "dlaždice (33, 19)"),
-    699: ((34, 19), "dlaždice (34, 19)"),
-    700: ((0, 20), "dlaždice (0, 20)"),
-    701: ((1, 20), "dlaždice (1, 20)"),
-    702: ((2, 20), "dlaždice (2, 20)"),
-    703: ((3, 20), "dlaždice (3, 20)"),
-    704: ((4, 20), "dlaždice (4, 20)"),
-    705: ((5, 20), "dlaždice (5, 20)"),
-    706: ((6, 20), "dlaždice (6, 20)"),
-    707: ((7, 20), "dlaždice (7, 20)"),
-    708: ((8, 20), "dlaždice (8, 20)"),
-    709: ((9, 20), "dlaždice (9, 20)"),
-    710: ((10, 20), "dlaždice (10, 20)"),
-    711: ((11, 20), "dlaždice (11, 20)"),
-    712: ((12, 20), "dlaždice (12, 20)"),
-    713: ((13, 20), "dlaždice (13, 20)"),
-    714: ((14, 20), "dlaždice (14, 20)"),
-    715: ((15, 20), "dlaždice (15, 20)"),
-    716: ((16, 20), "dlaždice (16, 20)"),
-    717: ((17, 20), "dlaždice (17, 20)"),
-    718: ((18, 20), "dlaždice (18, 20)"),
-    719: ((19, 20), "dlaždice (19, 20)"),
-    720: ((20, 20), "dlaždice (20, 20)"),
-    721: ((21, 20), "dlaždice (21, 20)"),
-    722: ((22, 20), "dlaždice (22, 20)"),
-    723: ((23, 20), "dlaždice (23, 20)"),
-    724: ((24, 20), "dlaždice (24, 20)"),
-    725: ((25, 20), "dlaždice (25, 20)"),
-    726: ((26, 20), "dlaždice (26, 20)"),
-    727: ((27, 20), "dlaždice (27, 20)"),
-    728: ((28, 20), "dlaždice (28, 20)"),
-    729: ((29, 20), "dlaždice (29, 20)"),
-    730: ((30, 20), "dlaždice (30, 20)"),
-    731: ((31, 20), "dlaždice (31, 20)"),
-    732: ((32, 20), "dlaždice (32, 20)"),
-    733: ((33, 20), "dlaždice (33, 20)"),
-    734: ((34, 20), "dlaždice (34, 20)"),
-    735: ((0, 21), "dlaždice (0, 21)"),
-    736: ((1, 21), "dlaždice (1, 21)"),
-    737: ((2, 21), "dlaždice (2, 21)"),
-    738: ((3, 21), "dlaždice (3, 21)"),
-    739: ((4, 21), "dlaždice (4, 21)"),
-    740: ((5, 21), "dlaždice (5, 21)"),
-    741: ((6, 21), "dlaždice (6, 21)"),
-    742: ((7, 21), "dlaždice (7, 21)"),
-    743: ((8, 21), "dlaždice (8, 21)"),
-    744: ((9, 21), "dlaždice (9, 21)"),
-    745: ((10, 21), "dlaždice (10, 21)"),
-    746: ((11, 21), "dlaždice (11, 21)"),
-    747: ((12, 21), "dlaždice (12, 21)"),
-    748: ((13, 21), "dlaždice (13, 21)"),
-    749: ((14, 21), "dlaždice (14, 21)"),
-    750: ((15, 21), "dlaždice (15, 21)"),
-    751: ((16, 21), "dlaždice (16, 21)"),
-    752: ((17, 21), "dlaždice (17, 21)"),
-    753: ((18, 21), "dlaždice (18, 21)"),
-    754: ((19, 21), "dlaždice (19, 21)"),
-    755: ((20, 21), "dlaždice (20, 21)"),
-    756: ((21, 21), "dlaždice (21, 21)"),
-    757: ((22, 21), "dlaždice (22, 21)"),
-    758: ((23, 21), "dlaždice (23, 21)"),
-    759: ((24, 21), "dlaždice (24, 21)"),
-    760: ((25, 21), "dlaždice (25, 21)"),
-    761: ((26, 21), "dlaždice (26, 21)"),
-    762: ((27, 21), "dlaždice (27, 21)"),
-    763: ((28, 21), "dlaždice (28, 21)"),
-    764: ((29, 21), "dlaždice (29, 21)"),
-    765: ((30, 21), "dlaždice (30, 21)"),
-    766: ((31, 21), "dlaždice (31, 21)"),
-    767: ((32, 21), "dlaždice (32, 21)"),
-    768: ((33, 21), "dlaždice (33, 21)"),
-    769: ((34, 21), "dlaždice (34, 21)"),
-    770: ((0, 22), "dlaždice (0, 22)"),
-    771: ((1, 22), "dlaždice (1, 22)"),
-    772: ((2, 22), "dlaždice (2, 22)"),
-    773: ((3, 22), "dlaždice (3, 22)"),
-    774: ((4, 22), "dlaždice (4, 22)"),
-    775: ((5, 22), "dlaždice (5, 22)"),
-    776: ((6, 22), "dlaždice (6, 22)"),
-    777: ((7, 22), "dlaždice (7, 22)"),
-    778: ((8, 22), "dlaždice (8, 22)"),
-    779: ((9, 22), "dlaždice (9, 22)"),
-    780: ((10, 22), "dlaždice (10, 22)"),
-    781: ((11, 22), "dlaždice (11, 22)"),
-    782: ((12, 22), "dlaždice (12, 22)"),
-    783: ((13, 22), "dlaždice (13, 22)"),
-    784: ((14, 22), "dlaždice (14, 22)"),
-    785: ((15, 22), "dlaždice (15, 22)"),
-    786: ((16, 22), "dlaždice (16, 22)"),
-    787: ((17, 22), "dlaždice (17, 22)"),
-    788: ((18, 22), "dlaždice (18, 22)"),
-    789: ((19, 22), "dlaždice (19, 22)"),
-    790: ((20, 22), "dlaždice (20, 22)"),
-    791: ((21, 22), "dlaždice (21, 22)"),
-    792: ((22, 22), "dlaždice (22, 22)"),
-    793: ((23, 22), "dlaždice (23, 22)"),
-    794: ((24, 22), "dlaždice (24, 22)"),
-    795: ((25, 22), "dlaždice (25, 22)"),
-    796: ((26, 22), "dlaždice (26, 22)"),
-    797: ((27, 22), "dlaždice (27, 22)"),
-    798: ((28, 22), "dlaždice (28, 22)"),
-    799: ((29, 22), "dlaždice (29, 22)"),
-    800: ((30, 22), "dlaždice (30, 22)"),
-    801: ((31, 22), "dlaždice (31, 22)"),
-    802: ((32, 22), "dlaždice (32, 22)"),
-    803: ((33, 22), "dlaždice (33, 22)"),
-    804: ((34, 22), "dlaždice (34, 22)"),
-    805: ((0, 23), "dlaždice (0, 23)"),
-    806: ((1, 23), "dlaždice (1, 23)"),
-    807: ((2, 23), "dlaždice (2, 23)"),
-    808: ((3, 23), "dlaždice (3, 23)"),
-    809: ((4, 23), "dlaždice (4, 23)"),
-    810: ((5, 23), "dlaždice (5, 23)"),
-    811: ((6, 23), "dlaždice (6, 23)"),
-    812: ((7, 23), "dlaždice (7, 23)"),
-    813: ((8, 23), "dlaždice (8, 23)"),
-    814: ((9, 23), "dlaždice (9, 23)"),
-    815: ((10, 23), "dlaždice (10, 23)"),
-    816: ((11, 23), "dlaždice (11, 23)"),
-    817: ((12, 23), "dlaždice (12, 23)"),
-    818: ((13, 23), "dlaždice (13, 23)"),
-    819: ((14, 23), "dlaždice (14, 23)"),
-    820: ((15, 23), "dlaždice (15, 23)"),
-    821: ((16, 23), "dlaždice (16, 23)"),
-    822: ((17, 23), "dlaždice (17, 23)"),
-    823: ((18, 23), "dlaždice (18, 23)"),
-    824: ((19, 23), "dlaždice (19, 23)"),
-    825: ((20, 23), "dlaždice (20, 23)"),
-    826: ((21, 23), "dlaždice (21, 23)"),
-    827: ((22, 23), "dlaždice (22, 23)"),
-    828: ((23, 23), "dlaždice (23, 23)"),
-    829: ((24, 23), "dlaždice (24, 23)"),
-    830: ((25, 23), "dlaždice (25, 23)"),
-    831: ((26, 23), "dlaždice (26, 23)"),
-    832: ((27, 23), "dlaždice (27, 23)"),
-    833: ((28, 23), "dlaždice (28, 23)"),
-    834: ((29, 23), "dlaždice (29, 23)"),
-    835: ((30, 23), "dlaždice (30, 23)"),
-    836: ((31, 23), "dlaždice (31, 23)"),
-    837: ((32, 23), "dlaždice (32, 23)"),
-    838: ((33, 23), "dlaždice (33, 23)"),
-    839: ((34, 23), "dlaždice (34, 23)"),
-    840: ((0, 24), "dlaždice (0, 24)"),
-    841: ((1, 24), "dlaždice (1, 24)"),
-    842: ((2, 24), "dlaždice (2, 24)"),
-    843: ((3, 24), "dlaždice (3, 24)"),
-    844: ((4, 24), "dlaždice (4, 24)"),
-    845: ((5, 24), "dlaždice (5, 24)"),
-    846: ((6, 24), "dlaždice (6, 24)"),
-    847: ((7, 24), "dlaždice (7, 24)"),
-    848: ((8, 24), "dlaždice (8, 24)"),
-    849: ((9, 24), "dlaždice (9, 24)"),
-    676: ((10, 24), "dlaždice (10, 24)"),
-    851: ((11, 24), "dlaždice (11, 24)"),
-    852: ((12, 24), "dlaždice (12, 24)"),
-    853: ((13, 24), "dlaždice (13, 24)"),
-    854: ((14, 24), "dlaždice (14, 24)"),
-    855: ((15, 24), "dlaždice (15, 24)"),
-    856: ((16, 24), "dlaždice (16, 24)"),
-    857: ((17, 24), "dlaždice (17, 24)"),
-    858: ((18, 24), "dlaždice (18, 24)"),
-    859: ((19, 24), "dlaždice (19, 24)"),
-    860: ((20, 24), "dlaždice (20, 24)"),
-    861: ((21, 24), "dlaždice (21, 24)"),
-    862: ((22, 24), "dlaždice (22, 24)"),
-    863: ((23, 24), "dlaždice (23, 24)"),
-    864: ((24, 24), "dlaždice (24, 24)"),
-    865: ((25, 24), "dlaždice (25, 24)"),
-    866: ((26, 24), "dlaždice (26, 24)"),
-    867: ((27, 24), "dlaždice (27, 24)"),
-    868: ((28, 24), "dlaždice (28, 24)"),
-    869: ((29, 24), "dlaždice (29, 24)"),
-    870: ((30, 24), "dlaždice (30, 24)"),
-    871: ((31, 24), "dlaždice (31, 24)"),
-    872: ((32, 24), "dlaždice (32, 24)"),
-    873: ((33, 24), "dlaždice (33, 24)"),
-    874: ((34, 24), "dlaždice (34, 24)"),
-    875: ((0, 25), "dlaždice (0, 25)"),
-    876: ((1, 25), "dlaždice (1, 25)"),
-    877: ((2, 25), "dlaždice (2, 25)"),
-    878: ((3, 25), "dlaždice (3, 25)"),
-    879: ((4, 25), "dlaždice (4, 25)"),
-    880: ((5, 25), "dlaždice (5, 25)"),
-    881: ((6, 25), "dlaždice (6, 25)"),
-    882: ((7, 25), "dlaždice (7, 25)"),
-    883: ((8, 25), "dlaždice (8, 25)"),
-    884: ((9, 25), "dlaždice (9, 25)"),
-    885: ((10, 25), "dlaždice (10, 25)"),
-    886: ((11, 25), "dlaždice (11, 25)"),
-    887: ((12, 25), "dlaždice (12, 25)"),
-    888: ((13, 25), "dlaždice (13, 25)"),
-    889: ((14, 25), "dlaždice (14, 25)"),
-    890: ((15, 25), "dlaždice (15, 25)"),
-    891: ((16, 25), "dlaždice (16, 25)"),
-    892: ((17, 25), "dlaždice (17, 25)"),
-    893: ((18, 25), "dlaždice (18, 25)"),
-    894: ((19, 25), "dlaždice (19, 25)"),
-    895: ((20, 25), "dlaždice (20, 25)"),
-    896: ((21, 25), "dlaždice (21, 25)"),
-    897: ((22, 25), "dlaždice (22, 25)"),
-    898: ((23, 25), "dlaždice (23, 25)"),
-    899: ((24, 25), "dlaždice (24, 25)"),
-    900: ((25, 25), "dlaždice (25, 25)"),
-    901: ((26, 25), "dlaždice (26, 25)"),
-    902: ((27, 25), "dlaždice (27, 25)"),
-    903: ((28, 25), "dlaždice (28, 25)"),
-    904: ((29, 25), "dlaždice (29, 25)"),
-    905: ((30, 25), "dlaždice (30, 25)"),
-    906: ((31, 25), "dlaždice (31, 25)"),
-    907: ((32, 25), "dlaždice (32, 25)"),
-    908: ((33, 25), "dlaždice (33, 25)"),
-    909: ((34, 25), "dlaždice (34, 25)"),
-}
@@ -0,0 +1,114 @@
+import heapq
+import itertools
+import time
+
+
+class Deadline:
+    """A scheduled deadline, returned by :meth:`DeadlineScheduler.schedule`."""
+
+    __slots__ = ("expires_at", "duration", "on_expire", "bonus", "active")
+
+    def __init__(self, expires_at, duration, on_expire, bonus):
+        self.expires_at = expires_at
+        self.duration = duration
+        self.on_expire = on_expire
+        self.bonus = bonus
+        self.active = True
+
+
+class DeadlineScheduler:
+    """Runs callbacks when deadlines pass.
+
+    Deadlines are stored as absolute expiry times of a monotonic clock in a
+    min-heap, so nothing has to be counted down every frame. :meth:`poll` only
+    looks at the top of the heap and each expiry costs O(log n). Cancelled and
+    completed deadlines stay in the heap and are skipped once they reach the
+    top (lazy deletion).
+    """
+
+    def __init__(self, clock=time.monotonic):
+        """Initializes an empty scheduler.
+
+        Args:
+            clock (callable): Function returning the current time in seconds.
+        """
+
+        self.clock = clock
+        self._heap = []  # (expires_at, sequence number, Deadline)
+        self._sequence = itertools.count()
+        self._active = 0
+
+    def __len__(self):
+        return self._active
+
+    def schedule(self, duration, on_expire=None, bonus=None):
+        """Starts a deadline.
+
+        Args:
+            duration (float): Seconds until the deadline expires.
+            on_expire (callable, optional): Called with the Deadline when it expires.
+            bonus (callable, optional): Called with the remaining seconds when the
+                deadline is completed in time, returns the bonus (see :meth:`complete`).
+
+        Returns:
+            Deadline: Handle of the deadline.
+        """
+
+        deadline = Deadline(self.clock() + duration, duration, on_expire, bonus)
+        heapq.heappush(self._heap, (deadline.expires_at, next(self._sequence), deadline))
+        self._active += 1
+        return deadline
+
+    def remaining(self, deadline):
+        """Returns the seconds left until the deadline (0 once it is over)."""
+
+        if not deadline.active:
+            return 0.0
+        return max(deadline.expires_at - self.clock(), 0.0)
+
+    def cancel(self, deadline):
+        """Stops a deadline without calling any callback."""
+
+        if deadline.active:
+            deadline.active = False
+            self._active -= 1
+
+    def complete(self, deadline):
+        """Stops a deadline that was met and returns its bonus.
+
+        Args:
+            deadline (Deadline): The deadline.
+
+        Returns:
+            The value returned by the deadline's bonus callback, or 0 if it
+            already expired or has no bonus callback.
+        """
+
+        if not deadline.active:
+            return 0
+        remaining = self.remaining(deadline)
+        self.cancel(deadline)
+        if deadline.bonus is None:
+            return 0
+        return deadline.bonus(remaining)
+
+    def poll(self):
+        """Expires all deadlines that have passed, calling their callbacks.
+
+        Returns:
+            int: Number of deadlines that expired.
+        """
+
+        heap = self._heap
+        now = self.clock()
+        expired = 0
+        while heap and heap[0][0] <= now:
+            deadline = heapq.heappop(heap)[2]
+            if not deadline.active:
+                continue
+            deadline.active = False
+            self._active -= 1
+            expired += 1
+            if deadline.on_expire is not None:
+                deadline.on_expire(deadline)
+        return expired
@@ -0,0 +1,300 @@
+import random
+import numpy as np
+import pygame
+from car_sprite import CarSprite
+from fleet import Fleet
+from ai_driver import AIDriver, plan_drivers
+from spatial_hash import SpatialHash
+from lod import LODScheduler
+
+
+def boxes_overlap(first, second):
+    """Tests pairs of oriented boxes for overlap with the separating axis theorem.
+
+    The boxes are given by their corners in the order of ``CarSprite.COLLISION_CORNERS``,
+    so corners 0-1 and 0-2 are the two edge directions of each box.
+
+    Args:
+        first (numpy.ndarray): (P, 4, 2) corners of the first box of each pair.
+        second (numpy.ndarray): (P, 4, 2) corners of the second box of each pair.
+
+    Returns:
+        numpy.ndarray: (P,) boolean array, True where the boxes overlap.
+    """
+
+    axes = np.concatenate((
+        first[:, 1:3] - first[:, :1],
+        second[:, 1:3] - second[:, :1],
+    ), axis=1)
+    projected_first = np.einsum("pad,pcd->pac", axes, first)
+    projected_second = np.einsum("pad,pcd->pac", axes, second)
+    separated = (
+        (projected_first.max(axis=2) < projected_second.min(axis=2))
+        | (projected_second.max(axis=2) < projected_first.min(axis=2))
+    )
+    return ~separated.any(axis=1)
+
+
+class TrafficSystem:
+    """Ambient traffic: NPC cars that drive around the road network.
+
+    The cars are simulated by a :class:`Fleet` and driven by :class:`AIDriver`
+    instances, each heading to one of a fixed set of destinations (so the road
+    distance fields stay cached). An :class:`LODScheduler` decides how precisely
+    each car is simulated: cars on screen are stepped every tick, nearby cars
+    every few ticks with a proportionally longer step and far away cars just
+    move along their path at cruise speed, a limited number per tick. Cars
+    coming closer first catch up along their path, then continue physically
+    from there.
+
+    Car-to-car collisions use the oriented collision box of ``CarSprite``.
+    Candidate pairs come from a :class:`SpatialHash` rebuilt every tick. A move
+    that makes two boxes overlap while bringing the cars closer is undone.
+    """
+
+    CELL_SIZE = 100  # At least the length of a car
+    DESTINATIONS = 24
+    SPAWN_DISTANCE = 600  # Minimal distance of spawned cars from the player
+    TINTS = ((255, 255, 255), (120, 200, 255), (255, 150, 150), (170, 255, 150))
+
+    def __init__(self, road_network, tile_size, image):
+        """Initializes an empty traffic system.
+
+        Args:
+            road_network (RoadNetwork): Road graph the cars drive on.
+            tile_size (int): Size of one tile in world pixels.
+            image (pygame.Surface): Unrotated car image, tinted per car.
+        """
+
+        self.road_network = road_network
+        self.tile_size = tile_size
+        self.fleet = Fleet(road_network.walkable_mask, tile_size)
+        self.drivers = []
+        self.tints = []
+        self.spatial_hash = SpatialHash(self.CELL_SIZE)
+        self.lod = LODScheduler(full_margin=self.CELL_SIZE)
+        self.hashed = np.zeros(0, dtype=np.int64)  # Fleet indices of the cars in the spatial hash
+
+        # Cars stay in the largest connected part of the road network
+        labels = road_network.components()
+        largest = np.bincount(labels[labels >= 0]).argmax() if (labels >= 0).any() else -1
+        rows, columns = np.nonzero(labels == largest)
+        self.road_tiles = list(zip(columns.tolist(), rows.tolist()))
+        self.destinations = random.sample(self.road_tiles, min(self.DESTINATIONS, len(self.road_tiles)))
+
+        self.images = [self._tint(image, color) for color in self.TINTS]
+        self._rotated = {}
+
+    @staticmethod
+    def _tint(image, color):
+        """Returns a copy of the image multiplied by a color."""
+
+        tinted = image.copy()
+        tinted.fill(color + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+        return tinted
+
+    def __len__(self):
+        return self.fleet.count
+
+    def spawn(self, count, player_pos):
+        """Places new cars on random road tiles away from the player and other cars.
+
+        Args:
+            count (int): Number of cars to add.
+            player_pos: The player's world position.
+        """
+
+        for _ in range(count * 10):
+            if count == 0 or not self.road_tiles:
+                break
+            tile = random.choice(self.road_tiles)
+            x = tile[0] * self.tile_size + self.tile_size // 2
+            y = tile[1] * self.tile_size + self.tile_size // 2
+            if abs(x - player_pos[0]) + abs(y - player_pos[1]) < self.SPAWN_DISTANCE:
+                continue
+            taken = self.fleet.pos[:self.fleet.count]
+            if len(taken) and (np.abs(taken - (x, y)).sum(axis=1) < self.CELL_SIZE).any():
+                continue
+
+            self.fleet.add(x, y, angle=random.choice((0, 90, 180, 270)))
+            self.drivers.append(AIDriver(self.road_network, self.tile_size))
+            self.tints.append(random.randrange(len(self.images)))
+            self.lod.add()
+            count -= 1
+
+    def update(self, player_car, view_rect):
+        """Advances the traffic by one tick.
+
+        Args:
+            player_car (CarSprite): The player's car, an obstacle for the traffic.
+            view_rect (pygame.Rect): The camera view in world coordinates.
+        """
+
+        fleet = self.fleet
+        count = fleet.count
+        if count == 0:
+            return
+
+        # Send idle drivers to a new destination
+        for i, driver in enumerate(self.drivers):
+            if driver.phase == "idle" or (driver.phase == "to_destination" and not driver.path):
+                driver.drive_to(random.choice(self.destinations), fleet.pos[i])
+
+        full, near, far, elapsed = self.lod.schedule(fleet.pos, view_rect)
+        previous = fleet.pos[:count].copy()
+        previous_angle = fleet.angle[:count].copy()
+
+        for i in far.tolist():
+            self._follow_path(i, elapsed[i])
+        simulated = np.concatenate((full, near))
+
+        interval = self.lod.near_interval
+        for indices, scale in ((full, 1), (near, interval)):
+            if len(indices) == 0:
+                continue
+            # Cars that were far away until now catch up along their path first
+            for i in indices[elapsed[indices] > interval].tolist():
+                self._follow_path(i, elapsed[i] - scale)
+
+            controls, toggles = plan_drivers(
+                [self.drivers[i] for i in indices],
+                fleet.pos[indices], fleet.angle[indices], fleet.speed[indices], fleet.handbrake[indices]
+            )
+            if toggles.any():
+                fleet.toggle_handbrake(indices[toggles])
+            fleet.step(controls, indices, float(scale))
+
+        # Traffic cars never run out of fuel
+        fleet.fuel[:count] = CarSprite.MAX_FUEL
+
+        self._resolve_collisions(simulated, previous, previous_angle, player_car)
+
+    def _follow_path(self, index, ticks):
+        """Moves a car along its path as far as it would get in the given number of ticks."""
+
+        fleet = self.fleet
+        x, y, angle = self.drivers[index].follow_path(fleet.pos[index], AIDriver.CRUISE_SPEED * ticks)
+        fleet.pos[index] = (x, y)
+        if angle is not None:
+            fleet.angle[index] = angle
+        fleet.speed[index] = AIDriver.CRUISE_SPEED
+        fleet.steering[index] = 0
+        fleet.handbrake[index] = False
+
+    def _resolve_collisions(self, simulated, previous, previous_angle, player_car):
+        """Undoes the moves of cars that drove into another car (or the player) this tick.
+
+        Only physically simulated cars collide. Far away cars drive through each
+        other, they are only estimated and would otherwise block each other for good.
+        """
+
+        fleet = self.fleet
+        self.hashed = simulated
+        if len(simulated) == 0:
+            self.spatial_hash.rebuild(np.zeros((0, 2)))
+            return
+
+        # The player is appended as the last object, it is never moved back here
+        player = np.array([[player_car.pos.x, player_car.pos.y]])
+        before = np.concatenate((previous[simulated], player))
+        before_angle = np.append(previous_angle[simulated], player_car.angle)
+        before_corners = fleet.collision_points(before, before_angle)
+        cars = len(simulated)
+
+        # Moving a car back can make it overlap a car that moved into its old place,
+        # so repeat until no more cars have to be moved back
+        for _ in range(cars):
+            pos = np.concatenate((fleet.pos[simulated], player))
+            angle = np.append(fleet.angle[simulated], player_car.angle)
+            self.spatial_hash.rebuild(pos)
+            first, second = self.spatial_hash.candidate_pairs()
+            if len(first) == 0:
+                return
+
+            # Cars already overlapping may only move apart
+            corners = fleet.collision_points(pos, angle)
+            hit = boxes_overlap(corners[first], corners[second])
+            moved = (pos[first] != before[first]).any(axis=1) | (pos[second] != before[second]).any(axis=1)
+            hit &= moved
+            if not hit.any():
+                return
+            overlapped = boxes_overlap(before_corners[first[hit]], before_corners[second[hit]])
+            closer = (
+                np.hypot(*(pos[first[hit]] - pos[second[hit]]).T)
+                < np.hypot(*(before[first[hit]] - before[second[hit]]).T)
+            )
+            hit[hit] = ~overlapped | closer
+            if not hit.any():
+                return
+
+            blocked = np.unique(np.concatenate((first[hit], second[hit])))
+            blocked = simulated[blocked[blocked < cars]]
+            fleet.pos[blocked] = previous[blocked]
+            fleet.angle[blocked] = previous_angle[blocked]
+            fleet.speed[blocked] = 0
+
+    def blocks(self, pos, angle, previous_pos):
+        """Tells whether a car moving from previous_pos to pos would drive into a traffic car.
+
+        Uses the spatial hash from the last :meth:`update`, so only physically
+        simulated cars are obstacles.
+
+        Args:
+            pos: The car's new world position.
+            angle (float): The car's heading in degrees.
+            previous_pos: The car's world position before the move.
+
+        Returns:
+            bool: True if the move has to be undone.
+        """
+
+        hashed = self.hashed
+        candidates = [hashed[i] for i in self.spatial_hash.query(pos[0], pos[1]) if i < len(hashed)]
+        if not candidates:
+            return False
+
+        candidates = np.array(candidates)
+        others = self.fleet.pos[candidates]
+        closer = (
+            np.hypot(others[:, 0] - pos[0], others[:, 1] - pos[1])
+            < np.hypot(others[:, 0] - previous_pos[0], others[:, 1] - previous_pos[1])
+        )
+        if not closer.any():
+            return False
+
+        candidates = candidates[closer]
+        corners = self.fleet.collision_points(self.fleet.pos[candidates], self.fleet.angle[candidates])
+        own = self.fleet.collision_points(np.array([[pos[0], pos[1]]]), np.array([angle]))
+        return bool(boxes_overlap(np.repeat(own, len(candidates), axis=0), corners).any())
+
+    def draw(self, batch, camera_x, camera_y, view_rect):
+        """Queues the visible cars for drawing.
+
+        Rotated images are cached per tint and whole degree.
+
+        Args:
+            batch (BlitBatch): The batch the cars are added to.
+            camera_x (float): The camera's x position.
+            camera_y (float): The camera's y position.
+            view_rect (pygame.Rect): The camera view in world coordinates.
+        """
+
+        count = self.fleet.count
+        if count == 0:
+            return
+
+        area = view_rect.inflate(self.CELL_SIZE * 2, self.CELL_SIZE * 2)
+        pos = self.fleet.pos[:count]
+        visible = np.flatnonzero(
+            (pos[:, 0] >= area.left) & (pos[:, 0] < area.right)
+            & (pos[:, 1] >= area.top) & (pos[:, 1] < area.bottom)
+        )
+        degrees = np.rint(self.fleet.angle[visible]).astype(np.int64) % 360
+        for i, degree in zip(visible.tolist(), degrees.tolist()):
+            key = (self.tints[i], degree)
+            image = self._rotated.get(key)
+            if image is None:
+                image = pygame.transform.rotate(self.images[key[0]], degree)
+                self._rotated[key] = image
+            rect = image.get_rect(center=(pos[i, 0] - camera_x, pos[i, 1] - camera_y))
+            batch.add(image, rect)